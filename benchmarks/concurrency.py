@@ -0,0 +1,108 @@
+"""
+Stress benchmark of concurrent ask/tell.
+
+Every thread asks a configuration, evaluates
+cheap objective and tells the result, so the
+throughput is bounded by job's bookkeeping,
+oracles and storage.
+
+Usage:
+
+    python concurrency.py --threads 32 --rounds 200
+    python concurrency.py --storage sqlite:///stress.db
+
+"""
+
+import threading
+import time
+
+import click
+
+from feijoa import Real, SearchSpace, create_job
+
+
+def stress(n_threads=32, n_rounds=200, optimizer="ucb<random>", storage=None):
+    """
+    Ask and tell from many threads concurrently.
+
+    Args:
+        n_threads (int):
+            Count of threads.
+        n_rounds (int):
+            Count of ask/tell round-trips of every thread.
+        optimizer (str):
+            Optimizer according to feijoa's optimizer's spec.
+        storage (str | None):
+            Storage RFC1738 spec, in-memory sqlite by default.
+
+    Returns:
+        Dictionary with round-trips count, elapsed
+        time and throughput (round-trips per second).
+
+    """
+
+    space = SearchSpace()
+    space.insert(Real("x", low=-5.0, high=5.0))
+    space.insert(Real("y", low=-5.0, high=5.0))
+
+    job = create_job(search_space=space, storage=storage)
+    job._setup_optimizer(optimizer, seed=0)
+
+    barrier = threading.Barrier(n_threads + 1)
+    errors = []
+
+    def worker():
+        barrier.wait()
+
+        try:
+            for _ in range(n_rounds):
+                for experiment in job.ask(1):
+                    x, y = experiment.params["x"], experiment.params["y"]
+                    job.tell(experiment, x**2 + y**2)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.monotonic()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.monotonic() - start
+
+    if errors:
+        raise errors[0]
+
+    round_trips = n_threads * n_rounds
+
+    assert job.experiments_count == round_trips
+    assert job.pending_experiments == 0
+
+    return {
+        "round_trips": round_trips,
+        "elapsed": elapsed,
+        "throughput": round_trips / elapsed,
+    }
+
+
+@click.command()
+@click.option("--threads", type=int, default=32)
+@click.option("--rounds", type=int, default=200)
+@click.option("--optimizer", type=str, default="ucb<random>")
+@click.option("--storage", type=str, default=None)
+def main(threads, rounds, optimizer, storage):
+    stats = stress(threads, rounds, optimizer, storage)
+
+    print(
+        f"{stats['round_trips']} ask/tell round-trips from {threads} threads"
+        f" in {stats['elapsed']:.2f}s: {stats['throughput']:.0f} per second"
+    )
+
+
+if __name__ == "__main__":
+    main()
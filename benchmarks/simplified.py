@@ -22,7 +22,7 @@ def parabolic_cylinder_noised(
     x: "[-10, 10]:real",
     y: "[-100, 100]:real",
 ):
-    return x**2 + y + np.random.random() * 2
+    return x**2 + y + np.random.random(np.shape(x)) * 2
 
 
 @bench
@@ -33,7 +33,7 @@ def parabolic_cylinder_noised(
     x: "[-10, 10]:real",
     y: "[-100, 100]:real",
 ):
-    return x**2 + y + np.random.random() * 2
+    return x**2 + y + np.random.random(np.shape(x)) * 2
 
 
 @bench
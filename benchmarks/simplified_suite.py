@@ -112,8 +112,10 @@ class BenchmarkSuite:
 
             start = time.monotonic()
 
-            def evaluator(experiment):
-                return problem.fun(**experiment.params)
+            def evaluator(columns):
+                # problems are written with numpy operations,
+                # so the whole batch is evaluated with one call
+                return problem.fun(**columns)
 
             # noinspection PyBroadException
             try:
@@ -125,10 +127,10 @@ class BenchmarkSuite:
                         (evaluator,),
                         {
                             "n_trials": iterations,
-                            "n_jobs": -1,
                             "n_points_iter": 20,
                             "optimizer": optimizer,
                             "progress_bar": True,
+                            "vectorized": "columns",
                         },
                     ),
                     max_iterations=1,
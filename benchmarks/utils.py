@@ -84,7 +84,7 @@ def pickup_problems(*paths):
         space = SearchSpace()
 
         for key, value in func.__annotations__.items():
-            match = re.match("^[(?P<bounds>.+)]:(?P<kind>.+)", value)  # noqa: W605
+            match = re.match(r"^\[(?P<bounds>.+)\]:(?P<kind>.+)", value)
             kind = match.group("kind")
             bounds = match.group("bounds")
 
@@ -32,6 +32,8 @@ __all__ = [
     "InvalidStorageRFC1738",
     "PackageNotInstalledError",
     "InvalidOptimizer",
+    "TrialPruned",
+    "ServerError",
 ]
 
 
@@ -119,3 +121,17 @@ class PackageNotInstalledError(FeijoaError):
     Raises if an attempt to import a
     package was not successful.
     """
+
+
+class TrialPruned(FeijoaError):
+    """
+    Raises by objective if the experiment
+    should be pruned (see `Experiment.should_prune`).
+    """
+
+
+class ServerError(FeijoaError):
+    """
+    Raises if ask/tell server failed
+    to handle request of client.
+    """
@@ -0,0 +1,152 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Evaluation cache module."""
+
+import logging
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from feijoa.jobs.engine import TIMEOUT_METRIC
+from feijoa.models import Experiment, Result
+from feijoa.search.space import SearchSpace
+from feijoa.storages import Storage
+
+__all__ = ["EvaluationCache"]
+
+log = logging.getLogger(__name__)
+
+
+class EvaluationCache:
+    """
+    Evaluation cache keyed by configuration fingerprint.
+
+    Key of cache is a pair of search space fingerprint
+    and canonical hash of configuration, so measured results
+    are shared between all jobs in the storage with the same
+    search space. Cache is persisted in the storage backend,
+    looked up results are also kept in memory.
+
+    Example:
+
+        .. code-block:: python
+
+            job.do(objective, n_trials=100, use_cache=True)
+            print(job.cache.hits, job.cache.misses)
+
+    Args:
+        storage (Storage):
+            Storage instance, which keeps the cache.
+        search_space (SearchSpace):
+            Search space of job.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(self, storage: Storage, search_space: SearchSpace):
+        self.storage = storage
+        self.space_fingerprint = search_space.fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._memory: Dict[str, Result] = dict()
+
+    def lookup(self, experiment: Experiment) -> Optional[Result]:
+        """
+        Look up result for experiment's configuration.
+
+        Args:
+            experiment (Experiment):
+                Experiment instance.
+
+        Returns:
+            Cached result or None.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        key = experiment.params_hash
+        result = self._memory.get(key)
+
+        if result is None:
+            result = self.storage.get_cached_result(self.space_fingerprint, key)
+
+        if result is None:
+            self.misses += 1
+            return None
+
+        self._memory[key] = result
+        self.hits += 1
+
+        log.debug(f"Cache hit for {experiment.params}")
+
+        return result
+
+    def store(self, experiment: Experiment, result: Union[float, Result]):
+        """
+        Store experiment's result into cache.
+
+        Args:
+            experiment (Experiment):
+                Experiment instance.
+            result (Union[float, Result]):
+                Result of experiment.
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        key = experiment.params_hash
+
+        if key in self._memory:
+            return
+
+        if not isinstance(result, Result):
+            result = Result(objective_result=result, metrics=None)
+
+        if result.metrics and TIMEOUT_METRIC in result.metrics:
+            # killed trial may succeed next time
+            return
+
+        if not np.isfinite(result.objective_result):
+            # NaN isn't stored by all backends
+            result = Result(objective_result=float("+inf"), metrics=result.metrics)
+
+        self._memory[key] = result
+        self.storage.insert_cached_result(self.space_fingerprint, key, result)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of hits among lookups."""
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self):
+        return f"EvaluationCache(hits={self.hits}, misses={self.misses})"
@@ -0,0 +1,308 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Client of ask/tell server module."""
+
+import http.client
+import json
+import logging
+import socket
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from urllib.parse import urlsplit
+
+from feijoa.exceptions import ServerError
+from feijoa.jobs.server import _default
+from feijoa.models import Experiment, Result
+from feijoa.models.configuration import Configuration
+from feijoa.models.experiment import ExperimentState
+
+__all__ = ["JobClient"]
+
+log = logging.getLogger(__name__)
+
+
+def _load(item: dict) -> Experiment:
+    """Load experiment leased by server."""
+
+    return Experiment.construct(
+        id=item["id"],
+        job_id=item["job_id"],
+        state=ExperimentState.WIP,
+        hash=None,
+        objective_result=None,
+        params=Configuration(
+            item["params"],
+            requestor=item.get("requestor", "UNKNOWN"),
+            budget=item.get("budget"),
+        ),
+        create_timestamp=datetime.timestamp(datetime.now()),
+        finish_timestamp=None,
+        metrics=None,
+        intermediate_values=None,
+    )
+
+
+class JobClient:
+    """
+    Client of :class:`feijoa.jobs.server.JobServer`.
+
+    Keeps one persistent connection, which is
+    reopened if server closes it. Failed `tell` and
+    `status` requests are repeated once, failed `ask`
+    isn't: server may have leased experiments already.
+
+    Example:
+
+        .. code-block:: python
+
+            from feijoa.jobs.client import JobClient
+
+            with JobClient("http://127.0.0.1:8642") as client:
+                experiments = client.ask(4)
+
+                while experiments:
+                    results = [objective(e) for e in experiments]
+                    client.tell_many(experiments, results)
+                    experiments = client.ask(4)
+
+                # or the same loop
+                client.work(objective, n=4)
+
+    Args:
+        url (str):
+            Base URL of server.
+        timeout (float | None):
+            Socket timeout in seconds.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(self, url: str, timeout: Optional[float] = None):
+        parsed = urlsplit(url)
+
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 80
+        self.timeout = timeout
+
+        self._connection: Optional[http.client.HTTPConnection] = None
+
+    def ask(self, n: int = 1) -> List[Experiment]:
+        """
+        Lease experiments from server.
+
+        Args:
+            n (int):
+                Preferred count of experiments.
+
+        Returns:
+            Leased experiments, empty list if trials are over.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        response = self._request("POST", "/ask", {"n": n})
+
+        return [_load(item) for item in response["experiments"]]
+
+    def tell(
+        self,
+        experiment: Union[Experiment, int],
+        result: Union[float, Result],
+        metrics: Optional[dict] = None,
+    ) -> int:
+        """
+        Tell result of experiment.
+
+        Args:
+            experiment (Experiment | int):
+                Leased experiment or its id.
+            result (float | Result):
+                Objective result.
+            metrics (dict | None):
+                Metrics of experiment.
+
+        Returns:
+            Count of results accepted by server.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        if metrics is not None:
+            objective_result = (
+                result.objective_result if isinstance(result, Result) else result
+            )
+            result = Result(objective_result=objective_result, metrics=metrics)
+
+        return self.tell_many([experiment], [result])
+
+    def tell_many(
+        self,
+        experiments: Sequence[Union[Experiment, int]],
+        results: Sequence[Union[float, Result]],
+    ) -> int:
+        """
+        Tell results of batch with one request.
+
+        Args:
+            experiments (Sequence[Experiment | int]):
+                Leased experiments or their ids.
+            results (Sequence[float | Result]):
+                Objective results.
+
+        Returns:
+            Count of results accepted by server (results
+            of expired experiments may be ignored).
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        items = []
+
+        for experiment, result in zip(experiments, results):
+            item: Dict[str, Any] = {
+                "id": experiment if isinstance(experiment, int) else experiment.id
+            }
+
+            if isinstance(result, Result):
+                item["objective"] = result.objective_result
+                item["metrics"] = result.metrics
+            else:
+                item["objective"] = result
+
+            items.append(item)
+
+        return self._request("POST", "/tell", {"results": items})["told"]
+
+    def status(self) -> dict:
+        """
+        Get status of served job.
+
+        Returns:
+            Dictionary with status.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        return self._request("GET", "/status")
+
+    def work(self, objective: Callable, n: int = 1) -> int:
+        """
+        Evaluate leased experiments until trials are over.
+
+        Args:
+            objective (Callable):
+                Objective function.
+            n (int):
+                Count of experiments in one ask.
+
+        Returns:
+            Count of evaluated experiments.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        evaluated = 0
+
+        while True:
+            experiments = self.ask(n)
+
+            if not experiments:
+                return evaluated
+
+            self.tell_many(experiments, [objective(e) for e in experiments])
+            evaluated += len(experiments)
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None):
+        """Send request over persistent connection."""
+
+        body = None
+        headers = {}
+
+        if payload is not None:
+            body = json.dumps(payload, default=_default).encode()
+            headers["Content-Type"] = "application/json"
+
+        # repeated ask would lease other experiments,
+        # while the lost ones wait for their lease timeout
+        retries = 1 if method == "GET" or path == "/tell" else 0
+
+        for attempt in range(retries + 1):
+            if self._connection is None:
+                self._connection = self._connect()
+
+            try:
+                self._connection.request(method, path, body=body, headers=headers)
+                response = self._connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError) as e:
+                # kept alive connection may be closed by server
+                self.close()
+
+                if attempt == retries:
+                    raise ServerError(f"Request {method} {path} is failed: {e}")
+
+        answer = json.loads(data)
+
+        if response.status != 200:
+            raise ServerError(answer.get("error", response.reason))
+
+        return answer
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Open connection to server."""
+
+        connection = http.client.HTTPConnection(
+            self.host, self.port, timeout=self.timeout
+        )
+        connection.connect()
+
+        # headers and body are sent with separate writes,
+        # they must not wait for delayed ACK
+        connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        return connection
+
+    def close(self):
+        """Close connection."""
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,173 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Coordination of workers, which share one job in storage."""
+
+import logging
+import os
+import socket
+import uuid
+from typing import List, Optional, Set
+
+from feijoa.models import Experiment
+
+__all__ = ["WorkerCoordinator"]
+
+log = logging.getLogger(__name__)
+
+
+class WorkerCoordinator:
+    """
+    Coordinator of worker, which shares job with
+    other processes (or machines) through storage.
+
+    Each worker has its own oracles, so results
+    of other workers are synchronized from storage
+    and told to worker's oracles before every ask.
+    Indexes of experiments are allocated atomically
+    by storage. Asked experiments are claimed in storage
+    with lease, which is prolonged on every ask. If worker
+    dies, its leases expire and experiments are
+    reclaimed and evaluated by other workers.
+
+    .. note::
+        Lease expiration is checked with wall clock of
+        workers, so clocks of machines must be synchronized
+        with precision much better than lease timeout.
+
+    Args:
+        job (Job):
+            Job instance.
+        lease_timeout (float):
+            Lease duration in seconds. Must be greater than
+            the longest evaluation of objective.
+        worker_id (str | None):
+            Unique worker identifier. Generated from host
+            name and process index by default.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(self, job, lease_timeout: float, worker_id: Optional[str] = None):
+        self.storage = job.storage
+        self.job_id = job.id
+        self.lease_timeout = lease_timeout
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        )
+
+        self.leased: Set[int] = set()
+        self.known: Set[int] = {e.id for e in job.loaded_experiments_pool}
+        self.finish_seq = job.finish_seq
+
+        if job.state.finished > len(job.loaded_experiments_pool):
+            # results of previous runs are already
+            # told to oracles of this job instance
+            self.finish_seq = self.storage.get_finish_seq(self.job_id)
+
+        self.synced = 0
+        self.reclaimed = 0
+
+    def sync(self, job):
+        """
+        Prolong leases and tell results
+        of other workers to job's oracles.
+
+        Args:
+            job (Job):
+                Job instance.
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        self.storage.renew_leases(
+            self.job_id, self.worker_id, self.leased, self.lease_timeout
+        )
+
+        experiments, self.finish_seq = self.storage.get_experiments_finished_after(
+            self.job_id, self.finish_seq
+        )
+
+        for experiment in experiments:
+            if experiment.id in self.known:
+                continue
+
+            job.absorb(experiment)
+
+            self.known.add(experiment.id)
+            self.synced += 1
+
+    def reclaim(self, n: int) -> List[Experiment]:
+        """Take over experiments with expired leases."""
+
+        experiments = self.storage.reclaim_expired_experiments(
+            self.job_id, self.worker_id, self.lease_timeout, n
+        )
+
+        if experiments:
+            log.warning(
+                f"Worker <{self.worker_id}> reclaimed"
+                f" {len(experiments)} expired experiments."
+            )
+
+        self.leased.update(e.id for e in experiments)
+        self.reclaimed += len(experiments)
+
+        return experiments
+
+    def allocate(self, n: int) -> range:
+        """Allocate indexes for new experiments."""
+
+        return self.storage.allocate_experiment_ids(self.job_id, n)
+
+    def claim(self, experiments: List[Experiment]):
+        """Claim new experiments with lease."""
+
+        self.storage.claim_experiments(experiments, self.worker_id, self.lease_timeout)
+        self.leased.update(e.id for e in experiments)
+
+    def finish(self, experiment: Experiment):
+        """Mark experiment as finished by this worker."""
+
+        self.leased.discard(experiment.id)
+        self.known.add(experiment.id)
+
+    def release(self, experiments: List[Experiment]):
+        """Release leases of experiments, which won't be evaluated."""
+
+        ids = [e.id for e in experiments if e.id in self.leased]
+
+        self.storage.release_experiments(self.job_id, self.worker_id, ids)
+        self.leased.difference_update(ids)
+
+    def __repr__(self):
+        return (
+            f"WorkerCoordinator(worker_id={self.worker_id}, "
+            f"leased={len(self.leased)}, synced={self.synced}, "
+            f"reclaimed={self.reclaimed})"
+        )
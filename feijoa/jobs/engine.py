@@ -0,0 +1,739 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Continuous trials scheduling engine module."""
+
+import asyncio
+import bisect
+import logging
+import time
+import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import joblib
+
+from feijoa.exceptions import TrialPruned
+from feijoa.jobs.executors import WorkerPool, _timed_acall
+from feijoa.models import Experiment, Result
+from feijoa.models.configuration import Configuration
+from feijoa.search.parameters import Categorical, Integer, Real
+
+__all__ = ["Engine", "EngineStatistics", "TIMEOUT_METRIC"]
+
+log = logging.getLogger(__name__)
+
+# metric of killed trials, contains evaluation time
+TIMEOUT_METRIC = "timeout"
+
+
+def check_ranges(search_space, configuration):
+    """
+    Check that configuration values lie in
+    the search space.
+
+    Args:
+        search_space (SearchSpace):
+            Search space instance.
+        configuration (Configuration):
+            Configuration to check.
+
+    Raises:
+        AssertionError: If some value is out of range.
+
+    """
+
+    for name, value in configuration.items():
+        p = search_space.get(name)
+
+        if isinstance(p, (Real, Integer)):
+            assert p.low <= value <= p.high, f"{p.low} <= {value} <= {p.high}"
+        if isinstance(p, Categorical):
+            assert value in p.choices, f"value in [{p.choices}]"
+
+
+class EngineStatistics:
+    """
+    Statistics of optimization session.
+
+    Args:
+        n_workers (int):
+            Count of workers in pool.
+
+    """
+
+    def __init__(self, n_workers: int):
+        self.n_workers = n_workers
+        self.trials = 0
+        self.pruned = 0
+        self.timed_out = 0
+        self.busy_time = 0.0
+        self.ask_time = 0.0
+        self.wall_time = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of wall time workers were busy."""
+
+        if not self.wall_time:
+            return 0.0
+
+        return min(1.0, self.busy_time / (self.n_workers * self.wall_time))
+
+    @property
+    def ask_fraction(self) -> float:
+        """Fraction of wall time the engine was blocked by ask."""
+
+        if not self.wall_time:
+            return 0.0
+
+        return min(1.0, self.ask_time / self.wall_time)
+
+    @property
+    def trials_per_hour(self) -> float:
+        """Finished trials per hour of wall time."""
+
+        if not self.wall_time:
+            return 0.0
+
+        return self.trials * 3600.0 / self.wall_time
+
+    def __repr__(self):
+        return (
+            f"EngineStatistics(trials={self.trials}, "
+            f"pruned={self.pruned}, "
+            f"timed_out={self.timed_out}, "
+            f"workers={self.n_workers}, "
+            f"utilization={self.utilization:.2%}, "
+            f"ask_fraction={self.ask_fraction:.2%}, "
+            f"trials_per_hour={self.trials_per_hour:.1f})"
+        )
+
+    def __str__(self):
+        return repr(self)
+
+
+class Engine:
+    """
+    Continuous (barrier-free) trials scheduling engine.
+
+    Keeps all workers of one long-lived pool busy: as soon
+    as any trial is finished, its result is told to the job
+    and a new configuration is submitted to the free worker.
+
+    Example:
+
+        .. code-block:: python
+
+            from feijoa.jobs.engine import Engine
+
+            engine = Engine(job, objective, n_trials=100, n_jobs=4)
+            statistics = engine.run()
+
+            # or with coroutine objective
+            statistics = await engine.arun()
+
+    Drivers of shared pools (e.g. :class:`feijoa.jobs.scheduler.Scheduler`)
+    take trials with :meth:`request`, :meth:`asking` and
+    :meth:`next_experiment`, report them with :meth:`lookup` and
+    :meth:`finish`, and end session with :meth:`close`.
+
+    Args:
+        job (Job):
+            Job instance, used for ask-tell.
+        objective (Callable):
+            Objective function.
+        n_trials (int):
+            Number of total runs.
+        n_jobs (int):
+            Count of workers (or coroutines in flight for `arun`).
+            If -1 passed => used max of CPU's.
+        n_points_iter (int | None):
+            The preferred number of configurations in one ask.
+            By default, it's adaptive: exactly as many configurations
+            as there are idle workers are asked (capped by remaining
+            trials and ``max_batch_size`` of optimizer).
+        backend (str):
+            Workers pool backend: `threads`, `processes` or `serial`.
+        timeout (float | None):
+            Wall-clock limit of one trial in seconds.
+        straggler_cutoff (float | None):
+            Kill trials running longer than ``straggler_cutoff``
+            times the median runtime of finished trials (active
+            after ``cutoff_min_trials`` finished trials).
+        pipelined (bool):
+            Ask the next configurations in a background thread
+            while the current trials are evaluated, so model fitting
+            and acquisition optimization don't leave workers idle.
+            Configurations of in-flight trials are passed to oracles
+            as pending (see :meth:`Oracle.set_pending`). Trials finished
+            meanwhile are recorded at once, oracles are told their
+            results before the next ask.
+
+    .. note::
+        Trials out of limits are recorded as ``ERROR`` with
+        :data:`TIMEOUT_METRIC` in metrics and their worker slot
+        is freed immediately. With `processes` backend every
+        trial runs in its own process, which is killed with
+        all its subprocesses. Threads can't be killed, so hung
+        thread is left in background (with a warning). `serial`
+        trials can't be interrupted.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    cutoff_min_trials = 5
+
+    def __init__(
+        self,
+        job,
+        objective: Callable,
+        *,
+        n_trials: int,
+        n_jobs: int = 1,
+        n_points_iter: Optional[int] = None,
+        backend: str = "threads",
+        timeout: Optional[float] = None,
+        straggler_cutoff: Optional[float] = None,
+        pipelined: bool = False,
+    ):
+        self.job = job
+        self.objective = objective
+        self.n_trials = n_trials
+        self.n_jobs = n_jobs
+        self.n_points_iter = n_points_iter
+        self.backend = backend
+        self.timeout = timeout
+        self.straggler_cutoff = straggler_cutoff
+        self.pipelined = pipelined
+
+        # sorted runtimes of finished trials
+        self.runtimes: List[float] = []
+
+        self.n_workers = 1 if backend == "serial" else joblib.effective_n_jobs(n_jobs)
+        self.statistics = EngineStatistics(self.n_workers)
+
+        with self.job.locked_optimizer() as optimizer:
+            optimizer.set_workers(self.n_workers)
+
+        self.callback: Optional[Callable[[Experiment], None]] = None
+
+        self.backlog: Deque[Experiment] = deque()
+        self.submitted = 0
+        self.exhausted = False
+
+        # experiments in evaluation, by future (or task)
+        self.running: Dict[Any, Experiment] = dict()
+
+        self.prefetcher: Optional[ThreadPoolExecutor] = None
+        self.prefetched: Optional[Future] = None
+
+    def _pending(self) -> List[Configuration]:
+        """Get configurations which are asked, but not told yet."""
+
+        experiments = list(self.running.values()) + list(self.backlog)
+
+        return [experiment.params for experiment in experiments]
+
+    def _batch_size(self, idle: int) -> int:
+        """Count of configurations to ask for idle workers."""
+
+        if self.n_points_iter is not None:
+            return self.n_points_iter
+
+        n = max(1, min(idle, self.n_trials - self.submitted - len(self.backlog)))
+        limit = self.job.optimizer.max_batch_size
+
+        return n if limit is None else max(1, min(n, limit))
+
+    def _ask_configs(self, pending: List[Configuration], n: int):
+        """Ask optimizer with known pending configurations."""
+
+        with self.job.locked_optimizer() as optimizer:
+            optimizer.set_pending(pending)
+            return optimizer.ask(n)
+
+    def _prefetch(self, n: int):
+        """Start asking the next configurations in background."""
+
+        if self.prefetcher is None:
+            self.prefetcher = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="feijoa-ask"
+            )
+
+        self.prefetched = self.prefetcher.submit(self._ask_configs, self._pending(), n)
+
+    def _ask(self, n: int) -> Optional[List[Experiment]]:
+        """Ask job, take configurations asked in background if any."""
+
+        start = time.monotonic()
+
+        if self.pipelined and self.prefetched is None:
+            self._prefetch(n)
+
+        if self.prefetched is not None:
+            configs = self.prefetched.result()
+            self.prefetched = None
+
+            experiments = self.job.ask(n, configs=configs or [])
+        else:
+            with self.job.locked_optimizer() as optimizer:
+                optimizer.set_pending(self._pending())
+
+            experiments = self.job.ask(n)
+
+        self.statistics.ask_time += time.monotonic() - start
+
+        return experiments
+
+    def request(self, idle: int = 1):
+        """
+        Start asking configurations for idle workers
+        in background, if backlog is empty.
+
+        Args:
+            idle (int):
+                Count of idle workers.
+
+        Returns:
+            None
+
+        """
+
+        if self.backlog or self.exhausted or self.prefetched is not None:
+            return
+
+        self._prefetch(self._batch_size(idle))
+
+    def asking(self) -> Optional[Future]:
+        """
+        Get background ask, which the next experiment waits for.
+
+        Returns:
+            Future of ask or None if the next
+            experiment can be taken without waiting.
+
+        """
+
+        if self.backlog or self.prefetched is None or self.prefetched.done():
+            return None
+
+        return self.prefetched
+
+    def next_experiment(self, idle: int = 1) -> Optional[Experiment]:
+        """
+        Pop experiment from backlog, ask job for
+        idle workers if backlog is empty.
+
+        Args:
+            idle (int):
+                Count of idle workers.
+
+        Returns:
+            Experiment to evaluate or None if
+            optimizer has no new configurations.
+
+        """
+
+        if not self.backlog:
+            if self.exhausted:
+                return None
+
+            n = self._batch_size(idle)
+            experiments = self._ask(n)
+
+            if not experiments:
+                warnings.warn("No new configurations.")
+                self.exhausted = True
+                return None
+
+            for experiment in experiments:
+                check_ranges(self.job.search_space, experiment.params)
+
+            self.backlog.extend(experiments)
+
+            if self.pipelined and self.submitted + len(self.backlog) < self.n_trials:
+                # overlap the next ask with evaluation of this batch,
+                # as many workers are expected to be idle again
+                self._prefetch(self._batch_size(n))
+
+        self.submitted += 1
+
+        return self.backlog.popleft()
+
+    def lookup(self, experiment: Experiment) -> bool:
+        """
+        Finish experiment from evaluation cache if possible.
+
+        Returns:
+            ``True`` if experiment is finished.
+
+        """
+
+        if not self.job.cache:
+            return False
+
+        cached = self.job.cache.lookup(experiment)
+
+        if cached is None:
+            return False
+
+        self.finish([(experiment, cached, 0.0)])
+
+        return True
+
+    def finish(self, finished: List[Tuple[Experiment, Any, float]]):
+        """
+        Tell results of finished experiments to job with one batch.
+
+        Args:
+            finished (List[Tuple[Experiment, Any, float]]):
+                Experiments with their results and evaluation times.
+
+        Returns:
+            None
+
+        """
+
+        force = self.submitted >= self.n_trials
+
+        measured, results = [], []
+
+        for experiment, result, elapsed in finished:
+            self.statistics.busy_time += elapsed
+            self.statistics.trials += 1
+
+            if isinstance(result, TrialPruned):
+                self.statistics.pruned += 1
+                self.job.prune(experiment, force=force)
+            else:
+                measured.append(experiment)
+                results.append(result)
+
+        if measured:
+            self.job.tell_many(measured, results, force=force)
+
+        if self.callback:
+            for experiment, _, _ in finished:
+                self.callback(experiment)
+
+    @property
+    def limit(self) -> Optional[float]:
+        """Current runtime limit of one trial."""
+
+        limits = []
+
+        if self.timeout is not None:
+            limits.append(self.timeout)
+
+        if (
+            self.straggler_cutoff is not None
+            and len(self.runtimes) >= self.cutoff_min_trials
+        ):
+            median = self.runtimes[len(self.runtimes) // 2]
+            limits.append(self.straggler_cutoff * median)
+
+        return min(limits) if limits else None
+
+    def _deadlines(self, started: Dict) -> Tuple[List, Optional[float]]:
+        """Get expired evaluations and time to the nearest deadline."""
+
+        limit = self.limit
+
+        if limit is None:
+            return [], None
+
+        now = time.monotonic()
+
+        expired = [key for key, start in started.items() if now - start >= limit]
+        remaining = [
+            limit - (now - start) for start in started.values() if now - start < limit
+        ]
+
+        return expired, min(remaining, default=None)
+
+    def _measured(self, elapsed: float):
+        """Account runtime of finished trial."""
+
+        bisect.insort(self.runtimes, elapsed)
+
+    def _timed_out(self, experiment: Experiment, elapsed: float):
+        """Make result for killed trial."""
+
+        self.statistics.timed_out += 1
+
+        log.warning(
+            f"Experiment #{experiment.id} is killed after {elapsed:.2f}s"
+            f" (limit: {self.limit:.2f}s)."
+        )
+
+        result = Result(
+            objective_result=float("+inf"),
+            metrics={TIMEOUT_METRIC: elapsed},
+        )
+
+        return experiment, result, elapsed
+
+    def close(self, start: float):
+        """
+        Close session: stop background ask and
+        discard configurations, which aren't evaluated.
+
+        Args:
+            start (float):
+                Monotonic start time of session.
+
+        Returns:
+            None
+
+        """
+
+        self.statistics.wall_time = time.monotonic() - start
+
+        if self.prefetcher is not None:
+            # prefetched configurations are never evaluated
+            self.prefetcher.shutdown(wait=True)
+            self.prefetcher = None
+            self.prefetched = None
+
+        if self.backlog:
+            log.warning(
+                f"Requestor: <{self.backlog[0].params.requestor}>"
+                f" requires a large number of launches to work"
+                f" correctly, {len(self.backlog)} configurations are dropped."
+            )
+            self.job.discard(list(self.backlog))
+            self.backlog.clear()
+
+        log.info(f"Session statistics: {self.statistics}")
+
+    def run(
+        self, callback: Optional[Callable[[Experiment], None]] = None
+    ) -> EngineStatistics:
+        """
+        Run optimization session.
+
+        Args:
+            callback (Callable, optional):
+                Called with every finished experiment.
+
+        Returns:
+            Statistics of session.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        self.callback = callback
+
+        limited = self.timeout is not None or self.straggler_cutoff is not None
+
+        if limited and self.backend == "threads":
+            log.warning(
+                "Trials of `threads` backend can't be killed: trials out"
+                " of limits are left running in background."
+                " Use `processes` backend to kill them."
+            )
+
+        pool = WorkerPool(self.objective, self.n_workers, self.backend, isolate=limited)
+        in_flight: Dict = dict()
+        started: Dict = dict()
+
+        self.running = in_flight
+
+        start = time.monotonic()
+
+        try:
+            while True:
+                asking = None
+
+                while (
+                    len(in_flight) < self.n_workers and self.submitted < self.n_trials
+                ):
+                    if in_flight:
+                        asking = self.asking()
+
+                        if asking is not None:
+                            # finished trials are recorded while
+                            # the next configurations are asked
+                            break
+
+                    experiment = self.next_experiment(self.n_workers - len(in_flight))
+
+                    if experiment is None:
+                        break
+
+                    if not self.lookup(experiment):
+                        future = pool.submit(experiment)
+                        in_flight[future] = experiment
+                        started[future] = time.monotonic()
+
+                if not in_flight:
+                    break
+
+                _, remaining = self._deadlines(started)
+
+                done, _ = wait(
+                    [*in_flight, asking] if asking else in_flight,
+                    timeout=remaining,
+                    return_when=FIRST_COMPLETED,
+                )
+
+                finished = []
+
+                for future in done:
+                    if future is asking:
+                        continue
+
+                    started.pop(future)
+                    result, elapsed = future.result()
+                    self._measured(elapsed)
+                    finished.append((in_flight.pop(future), result, elapsed))
+
+                expired, _ = self._deadlines(started)
+
+                for future in expired:
+                    pool.abandon(future)
+                    elapsed = time.monotonic() - started.pop(future)
+                    finished.append(self._timed_out(in_flight.pop(future), elapsed))
+
+                if finished:
+                    self.finish(finished)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+            self.close(start)
+
+        return self.statistics
+
+    async def arun(
+        self, callback: Optional[Callable[[Experiment], None]] = None
+    ) -> EngineStatistics:
+        """
+        Run optimization session with coroutine objective
+        in the current event loop.
+
+        At most `n_jobs` coroutines are in flight, it is
+        capped by semaphore.
+
+        Args:
+            callback (Callable, optional):
+                Called with every finished experiment.
+
+        Returns:
+            Statistics of session.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        self.callback = callback
+
+        semaphore = asyncio.Semaphore(self.n_workers)
+        in_flight: set = set()
+        started: Dict = dict()
+        experiments: Dict = dict()
+
+        self.running = experiments
+
+        async def evaluate(experiment):
+            try:
+                result, elapsed = await _timed_acall(self.objective, experiment)
+                return experiment, result, elapsed
+            finally:
+                semaphore.release()
+
+        start = time.monotonic()
+
+        try:
+            while True:
+                asking = None
+
+                while self.submitted < self.n_trials and not semaphore.locked():
+                    prefetched = self.asking() if in_flight else None
+
+                    if prefetched is not None:
+                        # finished trials are recorded while
+                        # the next configurations are asked
+                        asking = asyncio.wrap_future(prefetched)
+                        break
+
+                    experiment = self.next_experiment(self.n_workers - len(in_flight))
+
+                    if experiment is None:
+                        break
+
+                    if self.lookup(experiment):
+                        continue
+
+                    await semaphore.acquire()
+                    task = asyncio.ensure_future(evaluate(experiment))
+                    in_flight.add(task)
+                    started[task] = time.monotonic()
+                    experiments[task] = experiment
+
+                if not in_flight:
+                    break
+
+                _, remaining = self._deadlines(started)
+
+                done, in_flight = await asyncio.wait(
+                    in_flight | {asking} if asking else in_flight,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                done.discard(asking)
+                in_flight.discard(asking)
+
+                finished = []
+
+                for task in done:
+                    started.pop(task)
+                    experiments.pop(task)
+                    experiment, result, elapsed = task.result()
+                    self._measured(elapsed)
+                    finished.append((experiment, result, elapsed))
+
+                expired, _ = self._deadlines(started)
+
+                for task in expired:
+                    task.cancel()
+                    in_flight.discard(task)
+                    elapsed = time.monotonic() - started.pop(task)
+                    finished.append(self._timed_out(experiments.pop(task), elapsed))
+
+                if finished:
+                    self.finish(finished)
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+            self.close(start)
+
+        return self.statistics
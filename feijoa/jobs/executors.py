@@ -0,0 +1,446 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Workers pools for objective evaluation module."""
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import os
+import pickle
+import signal
+import threading
+import time
+import warnings
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import cloudpickle
+except ImportError:  # pragma: no cover
+    # older joblib versions vendor cloudpickle
+    from joblib.externals import cloudpickle  # type: ignore
+
+from feijoa.exceptions import TrialPruned
+from feijoa.models import Experiment
+
+__all__ = [
+    "WorkerPool",
+    "SerialExecutor",
+    "EventLoopExecutor",
+    "IsolatedProcessExecutor",
+    "BACKENDS",
+]
+
+log = logging.getLogger(__name__)
+
+BACKENDS = ("threads", "processes", "serial", "asyncio")
+
+# objective of current worker process, set by initializer
+_worker_objective: Any = None
+
+
+def _timed_call(objective, experiment):
+    """
+    Evaluate objective and measure evaluation time.
+
+    If experiment is pruned, `TrialPruned` instance
+    is returned as result.
+
+    """
+
+    start = time.monotonic()
+
+    try:
+        result = objective(experiment)
+    except TrialPruned as e:
+        result = e
+
+    return result, time.monotonic() - start
+
+
+async def _timed_acall(objective, experiment):
+    """Evaluate coroutine objective and measure evaluation time."""
+
+    start = time.monotonic()
+
+    try:
+        result = await objective(experiment)
+    except TrialPruned as e:
+        result = e
+
+    return result, time.monotonic() - start
+
+
+def _pack(experiment: Experiment):
+    """Pack experiment to lightweight tuple for shipping."""
+
+    return (
+        experiment.id,
+        experiment.job_id,
+        experiment.state,
+        experiment.params,
+        experiment.create_timestamp,
+    )
+
+
+def _unpack(packed) -> Experiment:
+    """Build experiment from packed tuple without validation."""
+
+    idx, job_id, state, params, create_timestamp = packed
+
+    return Experiment.construct(
+        id=idx,
+        job_id=job_id,
+        state=state,
+        hash=None,
+        objective_result=None,
+        params=params,
+        create_timestamp=create_timestamp,
+        finish_timestamp=None,
+        metrics=None,
+        intermediate_values=None,
+    )
+
+
+def _init_worker(dumped_objective: bytes):
+    """Load objective once per worker process."""
+
+    global _worker_objective
+    _worker_objective = pickle.loads(dumped_objective)
+
+
+def _call_in_worker(packed, key=None):
+    """Evaluate objective (or objective by key) in worker process."""
+
+    objective = _worker_objective if key is None else _worker_objective[key]
+
+    return _timed_call(objective, _unpack(packed))
+
+
+def _run_isolated(conn, initializer, initargs, fn, args):
+    """Evaluate call in isolated process and send outcome to pipe."""
+
+    with contextlib.suppress(AttributeError, OSError):
+        # own process group, so children (compilers,
+        # benchmarks) are killed together with process
+        os.setpgrp()
+
+    try:
+        if initializer is not None:
+            initializer(*initargs)
+
+        conn.send((True, fn(*args)))
+    except BaseException as e:
+        conn.send((False, e))
+    finally:
+        conn.close()
+
+
+class SerialExecutor(Executor):
+    """
+    Executor which evaluates calls in-process
+    at submit time.
+
+    Useful for debugging and for objectives
+    which must not leave the main thread.
+
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future: Future = Future()
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+        return future
+
+
+class EventLoopExecutor(Executor):
+    """
+    Executor which runs coroutines in
+    a background event loop thread.
+
+    Lets synchronous code have many coroutine
+    evaluations in flight, even if an event loop
+    is already running in the calling thread (Jupyter).
+
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def submit(self, fn, *args, **kwargs):
+        return asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self.loop)
+
+    def shutdown(self, wait=True, **kwargs):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+        if wait:
+            self.thread.join()
+            self.loop.close()
+
+
+class IsolatedProcessExecutor(Executor):
+    """
+    Executor which evaluates every call in a separate
+    process, so a hung call can be killed individually
+    (with all its subprocesses) without breaking other calls.
+
+    Args:
+        initializer (Callable | None):
+            Called in every process before call.
+        initargs (tuple):
+            Arguments for initializer.
+
+    """
+
+    def __init__(self, initializer=None, initargs=()):
+        self.initializer = initializer
+        self.initargs = initargs
+        self.context = multiprocessing.get_context()
+        self.processes: dict = dict()
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        future: Future = Future()
+        receiver, sender = self.context.Pipe(duplex=False)
+
+        process = self.context.Process(
+            target=_run_isolated,
+            args=(sender, self.initializer, self.initargs, fn, args),
+            daemon=True,
+        )
+        process.start()
+        sender.close()
+
+        with self._lock:
+            self.processes[future] = process
+
+        future.set_running_or_notify_cancel()
+
+        def watch():
+            try:
+                ok, value = receiver.recv()
+            except (EOFError, OSError):
+                ok, value = False, RuntimeError("Worker process is terminated.")
+            finally:
+                receiver.close()
+
+            process.join()
+
+            with self._lock:
+                self.processes.pop(future, None)
+
+            if future.done():
+                return
+
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+        threading.Thread(target=watch, daemon=True).start()
+
+        return future
+
+    def kill(self, future: Future):
+        """Kill process of call with all its subprocesses."""
+
+        with self._lock:
+            process = self.processes.pop(future, None)
+
+        if process is None or process.pid is None:
+            return
+
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            process.kill()
+
+    def shutdown(self, wait=True, **kwargs):
+        with self._lock:
+            running = list(self.processes)
+
+        for future in running:
+            if wait:
+                with contextlib.suppress(Exception):
+                    future.exception()
+            else:
+                self.kill(future)
+
+
+class WorkerPool:
+    """
+    Long-lived pool of workers for objective evaluation.
+
+    Every submitted experiment returns a future with
+    pair of (result, evaluation time).
+
+    Backends:
+
+        threads:
+            Thread pool, suitable for objectives
+            which release the GIL (subprocesses, I/O, numpy).
+        processes:
+            Process pool for CPU-bound pure-Python objectives.
+            The objective is shipped to every worker once
+            (with `cloudpickle`, so lambdas and closures are allowed),
+            experiments are shipped as lightweight tuples.
+            If `isolate` is set, every evaluation runs in its
+            own process, which can be killed with all its
+            subprocesses.
+        serial:
+            In-process evaluation without any pool.
+        asyncio:
+            Coroutine objectives in a background event loop.
+
+    Args:
+        objective (Callable | dict):
+            Objective function or mapping of objectives,
+            so one pool can evaluate objectives of many jobs
+            (objective is selected by key in :meth:`submit`).
+        n_workers (int):
+            Count of workers.
+        backend (str):
+            One of `threads`, `processes`, `serial`, `asyncio`.
+        isolate (bool):
+            Make evaluations killable (see :meth:`abandon`).
+
+    Raises:
+        ValueError: If unknown backend passed.
+
+    """
+
+    def __init__(
+        self,
+        objective: Union[Callable, Dict[Any, Callable]],
+        n_workers: int,
+        backend="threads",
+        isolate=False,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown executor backend `{backend}`."
+                f" Available: {', '.join(BACKENDS)}."
+            )
+
+        self.objective = objective
+        self.n_workers = 1 if backend == "serial" else n_workers
+
+        if backend == "processes":
+            try:
+                dumped = cloudpickle.dumps(objective)
+            except Exception as e:
+                warnings.warn(
+                    f"Objective can't be pickled ({e}),"
+                    f" `threads` backend is used instead."
+                )
+                backend = "threads"
+
+        self.backend = backend
+
+        self.executor: Executor
+
+        if backend == "processes" and isolate:
+            self.executor = IsolatedProcessExecutor(
+                initializer=_init_worker,
+                initargs=(dumped,),
+            )
+        elif backend == "processes":
+            self.executor = ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(dumped,),
+            )
+        elif backend == "threads":
+            self.executor = ThreadPoolExecutor(max_workers=n_workers)
+        elif backend == "asyncio":
+            self.executor = EventLoopExecutor()
+        else:
+            self.executor = SerialExecutor()
+
+    def submit(self, experiment: Experiment, key=None) -> Future:
+        """
+        Submit experiment to evaluation.
+
+        Args:
+            experiment (Experiment):
+                Experiment instance.
+            key (Hashable | None):
+                Key of objective if pool has mapping of objectives.
+
+        Returns:
+            Future with (result, evaluation time) pair.
+
+        """
+
+        if self.backend == "processes":
+            return self.executor.submit(_call_in_worker, _pack(experiment), key)
+
+        objective = self.objective if key is None else self.objective[key]  # type: ignore
+
+        if self.backend == "asyncio":
+            return self.executor.submit(_timed_acall, objective, experiment)
+
+        return self.executor.submit(partial(_timed_call, objective), experiment)
+
+    def abandon(self, future: Future):
+        """
+        Stop waiting for evaluation and free its worker slot.
+
+        Isolated processes are killed with all their subprocesses,
+        coroutines are cancelled. Threads can't be killed, so the
+        abandoned thread is left to finish in background and
+        a fresh thread pool is used for the next evaluations.
+        Serial evaluations are never abandoned.
+
+        Args:
+            future (Future):
+                Future of submitted experiment.
+
+        Returns:
+            None
+
+        """
+
+        if future.cancel() or future.done():
+            return
+
+        if isinstance(self.executor, IsolatedProcessExecutor):
+            self.executor.kill(future)
+        elif self.backend == "threads":
+            self.executor.shutdown(wait=False)
+            self.executor = ThreadPoolExecutor(max_workers=self.n_workers)
+        elif self.backend == "processes":
+            # pooled processes can't be killed individually
+            log.warning("Evaluation in process pool can't be killed.")
+
+    def shutdown(self, wait=True):
+        """Shutdown pool."""
+
+        self.executor.shutdown(wait=wait)
@@ -22,13 +22,26 @@
 """Job class module."""
 
 import contextlib
+import inspect
 import logging
+import threading
 import warnings
+from collections import deque
 from datetime import datetime
 from functools import partial
-from typing import Any, Callable, ContextManager, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
-import joblib
 import numpy as np
 import pandas as pd
 from rich.progress import Progress
@@ -42,8 +55,19 @@ from feijoa.exceptions import (
     InvalidStorageRFC1738,
     JobNotFoundError,
 )
+from feijoa.jobs.cache import EvaluationCache
+from feijoa.jobs.coordinator import WorkerCoordinator
+from feijoa.jobs.engine import Engine, EngineStatistics
+from feijoa.jobs.snapshot import Snapshot, SnapshotManager
+from feijoa.jobs.state import JobState
+from feijoa.jobs.vectorized import VectorizedEngine, numba_objective
 from feijoa.models import Experiment, Result
+from feijoa.models.configuration import Configuration
 from feijoa.models.experiment import ExperimentState
+from feijoa.pruners import IntermediateHistory, Pruner
+from feijoa.search.duplicates import ProposalIndex
+from feijoa.search.failures import FailureModel
+from feijoa.search.fallback import Fallback
 from feijoa.search.oracles.finder import Oracle, maker
 from feijoa.search.oracles.meta.meta import MetaOracle
 from feijoa.search.parameters import Categorical, Integer, Real
@@ -91,11 +115,24 @@ class Job:
         optimizer (MetaOracle):
             Optimizer, which will be used to oracles manipulation.
 
+    .. note::
+        :meth:`ask`, :meth:`tell` and :meth:`tell_many` may be called
+        from many threads concurrently (e.g. by request handlers of
+        a service). Oracles are asked and told one at a time,
+        results told while oracles are asked (e.g. in background)
+        are queued and told before the next ask. Bookkeeping is
+        guarded by its own lock and storages use thread-local sessions.
+
     Raises:
         AnyError: If anything bad happens.
 
     """
 
+    # count of asks, when all configurations are likely to fail
+    failure_retries = 3
+    # count of asks, when configurations are already proposed
+    duplicate_retries = 3
+
     def __init__(
         self,
         name: str,
@@ -113,11 +150,40 @@ class Job:
         # noinspection PyTypeChecker
         self.optimizer: MetaOracle = None  # type: ignore
         self.optimizer_name_dsl: str = ""
+        # guards optimizer from concurrent ask (pipelined engine) and tell
+        self.optimizer_lock = threading.Lock()
+        # results told while optimizer is locked (e.g. asked in
+        # background), they are told to optimizer before the next ask
+        self._untold: Deque[Tuple[List[Configuration], List[float], bool]] = deque()
+        # guards bookkeeping (state, history, coordinator, cache, snapshots),
+        # must not be acquired under optimizer lock
+        self._lock = threading.RLock()
         self.search_space = search_space
-        self.pending_experiments = 0
+        self.state = JobState()
         self.loaded_experiments_pool: List[Experiment] = []
+        # experiments in progress of stopped driver, asked again first
+        self.unfinished: Deque[Experiment] = deque()
+        # asked experiments are stored in progress, if storage can
+        self._store_wip = True
 
         self.seeds: List[dict] = []
+        # finished experiments of earlier jobs to prime oracles
+        self.history: List[Experiment] = []
+
+        self.statistics: Optional[EngineStatistics] = None
+        self.cache: Optional[EvaluationCache] = None
+        self.failures: Optional[FailureModel] = None
+        self.proposals: Optional[ProposalIndex] = None
+
+        self.pruner: Optional[Pruner] = None
+        self.intermediate_history = IntermediateHistory()
+
+        self.coordinator: Optional[WorkerCoordinator] = None
+        self.finish_seq = 0
+
+        self.snapshots: Optional[SnapshotManager] = None
+        self.snapshot: Optional[Snapshot] = None
+        self._loaded_pool_is_complete = True
 
         if not loaded:
             assert not self.storage.is_job_name_exists(self.name)
@@ -127,8 +193,7 @@ class Job:
     def best_parameters(self) -> Optional[dict]:
         """
         Get the best parameters in job.
-        Load configurations with result
-        and take params from best.
+        Take params from the best experiment.
 
         Returns:
             The best parameters' dict.
@@ -172,7 +237,7 @@ class Job:
 
         """
 
-        return self.storage.best_experiment(self.id)
+        return self.state.best_experiment
 
     @property
     def experiments(self) -> List[Experiment]:
@@ -237,16 +302,17 @@ class Job:
 
         """
 
-        rewards = 0
-        experiments = self.experiments
-        m = float("+inf")
+        return self.state.rewards
+
+    @property
+    def pending_experiments(self) -> int:
+        """Count of asked, but not told experiments."""
 
-        for exp in experiments:
-            if exp.objective_result < m:
-                rewards += 1
-                m = exp.objective_result
+        return self.state.pending
 
-        return rewards
+    @pending_experiments.setter
+    def pending_experiments(self, value: int):
+        self.state.pending = value
 
     @staticmethod
     def setup_default_algo():
@@ -268,11 +334,24 @@ class Job:
         objective: Callable,
         n_trials: int = 100,
         n_jobs: int = 1,
-        n_points_iter: int = 1,
+        n_points_iter: Optional[int] = None,
         optimizer="",
         progress_bar=True,
         use_numba_jit=False,
         seed=None,
+        backend="threads",
+        use_cache=False,
+        pruner: Optional[Pruner] = None,
+        lease_timeout: Optional[float] = None,
+        snapshot_interval: Optional[int] = None,
+        timeout: Optional[float] = None,
+        straggler_cutoff: Optional[float] = None,
+        pipelined=False,
+        avoid_failures=False,
+        deduplicate=False,
+        vectorized: Union[bool, str] = False,
+        ask_timeout: Optional[float] = None,
+        ask_fallback="random",
     ):
         """
         Do optimization for current job.
@@ -307,21 +386,245 @@ class Job:
 
         Args:
             objective:
-                Objective function.
+                Objective function. If coroutine function passed,
+                it's evaluated in a background event loop and `n_jobs`
+                is count of evaluations in flight (see also :meth:`ado`).
             n_trials (int):
                 Number of total runs.
             n_jobs (int):
-                Job's count parallelization with `joblib` backend. if -1 passed => used max of CPU's.
+                Count of workers in one long-lived pool. Workers are kept
+                busy continuously: a finished trial is told to oracles and
+                a new configuration is submitted immediately.
+                If -1 passed => used max of CPU's.
             optimizer (str):
                 Optimizer according to feijoa's optimizer's spec.
-            n_points_iter (int):
+            n_points_iter (int | None):
                 The preferred number of configurations in one epoch. May have no effect for some oracles.
+                By default, it's adaptive: as many configurations as there are
+                idle workers are asked (see ``preferred_batch_size`` and
+                ``max_batch_size`` of oracles).
             progress_bar (bool):
                 Show progress bar (rich) or not.
             use_numba_jit (bool):
-                Use numba for objective evaluation speedup.
+                Compile objective with numba (see
+                :func:`feijoa.jobs.vectorized.numba_objective`).
+                Objective takes float64 vector in search space order
+                (categorical values are replaced with their indices)
+                and returns float. Batches are evaluated in parallel
+                loop without GIL in vectorized mode, compilation is
+                cached on disk across runs. Use it with in-memory
+                storage (``sqlite:///:memory:``) for large counts of
+                trials of synthetic problems.
             seed (int | None):
                 Random seed
+            backend (str):
+                Workers backend: `threads` (default), `processes` for
+                CPU-bound pure-Python objectives (objective may be
+                a lambda or closure) or `serial` for in-process evaluation.
+                For coroutine objectives `asyncio` is used.
+            use_cache (bool):
+                Use evaluation cache. Configurations which were already
+                measured in any job with the same search space in
+                the storage aren't evaluated again, stored objective
+                and metrics are used. Hits and misses count is
+                available in ``cache``.
+            pruner (Pruner | None):
+                Pruner for experiments, which report intermediate
+                values with ``experiment.report(step, value)`` and check
+                ``experiment.should_prune()``. Is not available for
+                `processes` backend (ValueError is raised).
+            lease_timeout (float | None):
+                Enable worker mode: job can be shared by many
+                processes (or machines) through one RDB storage.
+                Experiments are claimed in storage with lease
+                of specified duration (seconds), which must be
+                greater than the longest evaluation. Results of
+                other workers are told to oracles before every ask.
+                See :class:`feijoa.jobs.coordinator.WorkerCoordinator`.
+            snapshot_interval (int | None):
+                Take snapshot of oracles after every specified count
+                of finished experiments and at the end of optimization.
+                ``load_job(..., restore_snapshot=True)`` restores
+                the latest snapshot and replays only experiments
+                finished after it.
+            timeout (float | None):
+                Wall-clock limit of one trial in seconds.
+            straggler_cutoff (float | None):
+                Kill trials running longer than specified multiple
+                of the median runtime of finished trials.
+                Killed trials are recorded as ``ERROR`` with
+                ``timeout`` metric, worker slot is freed immediately
+                (see :class:`feijoa.jobs.engine.Engine`).
+            pipelined (bool):
+                Ask the next configurations in background while
+                the current trials are evaluated. Oracles are asked
+                on the results known at the moment, configurations in
+                evaluation are passed as pending (Bayesian oracle fits
+                model with fantasized results for them). Fraction of
+                wall time the engine waited for ask is available in
+                ``statistics.ask_fraction``.
+            avoid_failures (bool):
+                Train classifier of failure regions on failed
+                (non-finite result) and successful experiments.
+                Configurations, which are likely to fail, are dropped
+                before evaluation (Bayesian oracle replaces them with
+                the next candidates of acquisition). Count of rejected
+                configurations and expected count of avoided failed
+                evaluations are available in ``failures``.
+            deduplicate (bool):
+                Keep hash index of proposed and evaluated
+                configurations. Configurations, which were already
+                proposed (in the same batch or earlier), never reach
+                workers: optimizer is asked again a few times, then
+                duplicates are replaced with their random unseen
+                neighbours. Duplicate rates per oracle are available
+                in ``proposals.rates``.
+            vectorized (bool | str):
+                Evaluate a whole batch of configurations with one
+                objective call (see
+                :class:`feijoa.jobs.vectorized.VectorizedEngine`).
+                If True, objective takes float64 matrix with columns
+                in search space order (categorical values are replaced
+                with their indices), if `columns`, it takes dict of
+                parameter's name to array of its values. Objective
+                returns array of results. Batch size is `n_points_iter`
+                (256 by default), `n_jobs` and `backend` are ignored,
+                with `pipelined` the next batch is asked while the
+                current one is evaluated.
+            ask_timeout (float | None):
+                Deadline of oracle's ask in seconds. Oracle, which
+                doesn't produce configurations in time (e.g. Bayesian
+                oracle with long history), finishes its ask in background
+                for its next turn, and configurations of cheap fallback are
+                evaluated instead. Count of missed deadlines per oracle
+                is available in ``optimizer.deadline_misses``.
+            ask_fallback (str):
+                Fallback for missed deadlines: `random`, `quasirandom`
+                (low-discrepancy sequence) or `mutation` (random
+                neighbours of the best configuration), see
+                :class:`feijoa.search.fallback.Fallback`.
+
+        Returns:
+            None. Session statistics (workers utilization,
+            ask fraction, trials per hour) are available
+            in ``statistics``.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        if inspect.iscoroutinefunction(objective):
+            backend = "asyncio"
+
+        if use_numba_jit:
+            if vectorized == "columns":
+                raise ValueError("Numba objective takes batch in `array` layout.")
+
+            objective = numba_objective(objective)
+            vectorized = True
+
+        if vectorized and (
+            pruner or timeout is not None or straggler_cutoff is not None
+        ):
+            raise ValueError(
+                "Pruner and trial timeouts aren't available in vectorized mode."
+            )
+
+        if pruner and backend == "processes":
+            raise ValueError("Pruner isn't available with `processes` backend.")
+
+        self._setup_optimizer(optimizer, seed)
+        self._setup_cache(use_cache)
+        self._setup_failures(avoid_failures)
+        self._setup_proposals(deduplicate)
+        self._setup_deadline(ask_timeout, ask_fallback, seed)
+        self._setup_coordinator(lease_timeout)
+        self._setup_snapshots(snapshot_interval)
+        self.pruner = pruner
+
+        progress: ContextManager = (
+            Progress(transient=True, disable=not progress_bar)  # type: ignore
+            if progress_bar
+            else contextlib.nullcontext()
+        )
+
+        engine: Engine
+
+        if vectorized:
+            engine = VectorizedEngine(
+                self,
+                objective,
+                n_trials=n_trials,
+                n_points_iter=n_points_iter,
+                layout="columns" if vectorized == "columns" else "array",
+                pipelined=pipelined,
+            )
+        else:
+            engine = Engine(
+                self,
+                objective,
+                n_trials=n_trials,
+                n_jobs=n_jobs,
+                n_points_iter=n_points_iter,
+                backend=backend,
+                timeout=timeout,
+                straggler_cutoff=straggler_cutoff,
+                pipelined=pipelined,
+            )
+
+        with progress as bar:  # type: ignore
+            # pyre-ignore[16]:
+            task = bar.add_task("Optimizing", total=n_trials) if bar else None
+            best = float("+inf")
+
+            def on_finish(_):
+                nonlocal best
+
+                if bar:
+                    bar.update(
+                        task,
+                        advance=1,
+                        description=(
+                            f"Trials <{self.name}>]:"
+                            f" {engine.statistics.trials}/{n_trials}"
+                        ),
+                    )
+
+                if self.best_value and self.best_value < best:
+                    log.info(f"New best result: {self.best_value}")
+                    best = self.best_value
+
+            self.statistics = engine.run(callback=on_finish)
+
+        if self.failures:
+            log.info(f"Failure model: {self.failures}")
+
+        if self.proposals:
+            log.info(f"Proposal index: {self.proposals}")
+
+        if self.optimizer.deadline_misses:
+            log.info(f"Missed ask deadlines: {dict(self.optimizer.deadline_misses)}")
+
+        if self.snapshots:
+            with self._lock:
+                self.snapshots.take(self)
+
+        if in_notebook():
+            from IPython.display import clear_output
+
+            clear_output(wait=False)
+
+    def _setup_optimizer(self, optimizer: str, seed):
+        """
+        Build optimizer from DSL spec and tell it
+        loaded experiments.
+
+        Args:
+            optimizer (str):
+                Optimizer according to feijoa's optimizer's spec.
+            seed (int | None):
+                Random seed.
 
         Returns:
             None
@@ -339,7 +642,27 @@ class Job:
         if not optimizer and self.optimizer_name_dsl:
             optimizer_name = self.optimizer_name_dsl
 
-        self.optimizer = maker(optimizer_name, self.search_space, random_state=seed)
+        snapshot, self.snapshot = self.snapshot, None
+
+        if snapshot and snapshot.optimizer_name_dsl == optimizer_name:
+            log.info(f"Restore oracles of job <{self.name}> from snapshot.")
+            self.optimizer = snapshot.optimizer
+        else:
+            if not self._loaded_pool_is_complete:
+                # oracles are built from scratch, so replay everything
+                self.loaded_experiments_pool = [
+                    e for e in self.experiments if e.is_finished()
+                ]
+                self._loaded_pool_is_complete = True
+
+            self.optimizer = maker(optimizer_name, self.search_space, random_state=seed)
+
+            if self.history:
+                self.optimizer.prime(
+                    [e.params for e in self.history],
+                    [e.objective_result for e in self.history],
+                )
+
         self.optimizer_name_dsl = optimizer_name
 
         self.storage.update_optimizer_name_by_job_id(self.id, self.optimizer_name_dsl)
@@ -350,86 +673,385 @@ class Job:
         for loaded_experiment in self.loaded_experiments_pool:
             self._tell_for_loaded(loaded_experiment)
 
-        if use_numba_jit:
-            with ImportWrapper():
-                from numba import jit
+    async def ado(
+        self,
+        objective: Callable,
+        n_trials: int = 100,
+        n_concurrent: int = 100,
+        n_points_iter: Optional[int] = None,
+        optimizer="",
+        seed=None,
+        use_cache=False,
+        pruner: Optional[Pruner] = None,
+        lease_timeout: Optional[float] = None,
+        snapshot_interval: Optional[int] = None,
+        timeout: Optional[float] = None,
+        straggler_cutoff: Optional[float] = None,
+        pipelined=False,
+        avoid_failures=False,
+        deduplicate=False,
+        ask_timeout: Optional[float] = None,
+        ask_fallback="random",
+    ):
+        """
+        Do optimization for current job with asynchronous objective.
+
+        Every evaluation is a coroutine, so hundreds of evaluations
+        can be in flight from one thread. Result of each evaluation
+        is told to oracles as soon as its coroutine is completed.
 
-                objective = jit(objective)
+        Example:
 
-        dela = joblib.delayed(objective)
+            .. code-block:: python
 
-        progress: ContextManager = (
-            Progress(transient=True, disable=not progress_bar)  # type: ignore
-            if progress_bar
-            else contextlib.nullcontext()
+                import asyncio
+
+                async def objective(experiment: Experiment):
+                    proc = await asyncio.create_subprocess_exec(...)
+                    ...
+                    return value
+
+                job = create_job(search_space=space)
+
+                # in Jupyter just await it
+                await job.ado(objective, n_trials=500, n_concurrent=200)
+
+        Args:
+            objective:
+                Asynchronous objective function.
+            n_trials (int):
+                Number of total runs.
+            n_concurrent (int):
+                Max count of evaluations in flight.
+            n_points_iter (int | None):
+                The preferred number of configurations in one ask,
+                adaptive by default (see :meth:`do`).
+            optimizer (str):
+                Optimizer according to feijoa's optimizer's spec.
+            seed (int | None):
+                Random seed
+            use_cache (bool):
+                Use evaluation cache (see :meth:`do`).
+            pruner (Pruner | None):
+                Pruner for experiments (see :meth:`do`).
+            lease_timeout (float | None):
+                Enable worker mode (see :meth:`do`).
+            snapshot_interval (int | None):
+                Snapshots interval (see :meth:`do`).
+            timeout (float | None):
+                Wall-clock limit of one trial (see :meth:`do`).
+            straggler_cutoff (float | None):
+                Adaptive limit of one trial (see :meth:`do`).
+            pipelined (bool):
+                Ask in background (see :meth:`do`).
+            avoid_failures (bool):
+                Use failure model (see :meth:`do`).
+            deduplicate (bool):
+                Drop already proposed configurations (see :meth:`do`).
+            ask_timeout (float | None):
+                Deadline of oracle's ask (see :meth:`do`).
+            ask_fallback (str):
+                Fallback for missed deadlines (see :meth:`do`).
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        self._setup_optimizer(optimizer, seed)
+        self._setup_cache(use_cache)
+        self._setup_failures(avoid_failures)
+        self._setup_proposals(deduplicate)
+        self._setup_deadline(ask_timeout, ask_fallback, seed)
+        self._setup_coordinator(lease_timeout)
+        self._setup_snapshots(snapshot_interval)
+        self.pruner = pruner
+
+        engine = Engine(
+            self,
+            objective,
+            n_trials=n_trials,
+            n_jobs=n_concurrent,
+            n_points_iter=n_points_iter,
+            timeout=timeout,
+            straggler_cutoff=straggler_cutoff,
+            pipelined=pipelined,
         )
 
-        def range_checker(p, value):
-            if isinstance(p, (Real, Integer)):
-                assert p.low <= value <= p.high, f"{p.low} <= {value} <= {p.high}"
-            if isinstance(p, Categorical):
-                assert value in p.choices, f"value in [{p.choices}]"
+        self.statistics = await engine.arun()
 
-        trials = 0
-        with progress as bar:  # type: ignore
-            # pyre-ignore[16]:
-            m = float("+inf")
-            task = bar.add_task("Optimizing", total=n_trials)
-            while trials < n_trials:
-                configurations = self.ask(n_points_iter)
-
-                if not configurations:
-                    warnings.warn("No new configurations.")
-                    # TODO (qnbhd): make closing
-                    break
-
-                for c in configurations:
-                    for param, value in c.params.items():
-                        sp_p = self.search_space.get(param)
-                        range_checker(sp_p, value)
-
-                configurations = configurations[
-                    : min(len(configurations), n_trials - trials)
-                ]
+        if self.snapshots:
+            with self._lock:
+                self.snapshots.take(self)
 
-                if len(configurations) + trials > n_trials:
+    def _setup_cache(self, use_cache: bool):
+        """
+        Enable or disable evaluation cache.
 
-                    log.warning(
-                        f"Requestor: <{configurations[0].params.requestor}>"
-                        f" requires a large number of launches to work"
-                        f" correctly. this logic will change in the future."
-                    )
+        Args:
+            use_cache (bool):
+                Use cache or not.
 
-                    # TODO (qnbhd): fix this logic
+        Returns:
+            None
 
-                configurations_len = len(configurations)
-                trials += configurations_len
-                # pyre-ignore[16]:
+        """
 
-                # noinspection PyUnresolvedReferences,PyBroadException
-                parallel = joblib.Parallel(n_jobs=n_jobs, prefer="threads")
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    results = parallel(dela(u) for u in configurations)
+        if not use_cache:
+            self.cache = None
+        elif self.cache is None:
+            self.cache = EvaluationCache(self.storage, self.search_space)
 
-                # Applying result
-                for experiment, result in zip(configurations, results):
-                    self.tell(experiment, result, force=(trials >= n_trials))
+    def _setup_failures(self, avoid_failures: bool):
+        """
+        Enable or disable failure model, which is
+        trained on finished experiments of job.
 
-                bar.update(
-                    task,
-                    advance=configurations_len,
-                    description=f"Trials <{self.name}>]: {trials}/{n_trials}",
-                )
+        Args:
+            avoid_failures (bool):
+                Use failure model or not.
 
-                if self.best_value and self.best_value < m:
-                    log.info(f"New best result: {self.best_value}")
-                    m = self.best_value
+        Returns:
+            None
 
-        if in_notebook():
-            from IPython.display import clear_output
+        """
 
-            clear_output(wait=False)
+        if not avoid_failures:
+            self.failures = None
+        elif self.failures is None:
+            self.failures = FailureModel(self.search_space)
+
+            finished = [
+                e
+                for e in self.experiments
+                if e.state in (ExperimentState.OK, ExperimentState.ERROR)
+            ]
+
+            self.failures.add(
+                [e.params for e in finished], [e.objective_result for e in finished]
+            )
+
+        with self.locked_optimizer():
+            self.optimizer.set_failure_model(self.failures)
+
+    def _avoid_failures(
+        self, configs: List[Configuration], n: int
+    ) -> List[Configuration]:
+        """
+        Drop configurations, which are likely to fail,
+        ask optimizer again (a few times) if all are dropped.
+        """
+
+        assert self.failures is not None
+
+        accepted = self.failures.filter(configs)
+
+        for _ in range(self.failure_retries):
+            if accepted:
+                break
+
+            with self.locked_optimizer():
+                asked = self.optimizer.ask(n)
+
+            if not asked:
+                break
+
+            configs = asked
+            accepted = self.failures.filter(configs)
+
+        # configurations aren't starved by wrong model
+        return accepted or configs
+
+    def _setup_proposals(self, deduplicate: bool):
+        """
+        Enable or disable index of proposed configurations,
+        which is filled with experiments of job.
+
+        Args:
+            deduplicate (bool):
+                Use proposal index or not.
+
+        Returns:
+            None
+
+        """
+
+        if not deduplicate:
+            self.proposals = None
+        elif self.proposals is None:
+            self.proposals = ProposalIndex(self.search_space)
+            self.proposals.add(e.params for e in self.experiments)
+
+        with self.locked_optimizer():
+            self.optimizer.set_proposal_index(self.proposals)
+
+    def _setup_deadline(self, ask_timeout: Optional[float], fallback: str, seed):
+        """
+        Set deadline of oracle's ask with fallback proposals,
+        mutations start from the best experiment of job.
+
+        Args:
+            ask_timeout (float | None):
+                Deadline in seconds, ``None`` disables it.
+            fallback (str):
+                Kind of fallback.
+            seed (int | None):
+                Random seed.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If unknown fallback passed.
+
+        """
+
+        proposals = None
+
+        if ask_timeout is not None:
+            proposals = Fallback(self.search_space, kind=fallback, seed=seed or 0)
+
+            if self.best_experiment is not None:
+                proposals.tell_many([self.best_parameters], [self.best_value])
+
+        with self.locked_optimizer():
+            self.optimizer.set_ask_deadline(ask_timeout, proposals)
+
+    def _deduplicate(self, configs: List[Configuration], n: int) -> List[Configuration]:
+        """
+        Drop already proposed configurations, ask optimizer
+        again (a few times) and replace the rest of duplicates
+        with their unseen neighbours.
+        """
+
+        assert self.proposals is not None
+
+        accepted, duplicates = self.proposals.filter(configs)
+        wanted = len(configs)
+
+        for _ in range(self.duplicate_retries):
+            if len(accepted) >= wanted:
+                break
+
+            with self.locked_optimizer():
+                more = self.optimizer.ask(wanted - len(accepted))
+
+            if not more:
+                break
+
+            unseen, rejected = self.proposals.filter(more)
+            accepted += unseen
+            duplicates += rejected
+
+        for config in duplicates[: max(0, wanted - len(accepted))]:
+            neighbour = self.proposals.neighbour(config)
+
+            if neighbour is not None:
+                accepted.append(neighbour)
+
+        return accepted
+
+    def _setup_coordinator(self, lease_timeout: Optional[float]):
+        """
+        Enable or disable worker mode.
+
+        Args:
+            lease_timeout (float | None):
+                Lease duration or None to disable worker mode.
+
+        Returns:
+            None
+
+        """
+
+        if lease_timeout is None:
+            self.coordinator = None
+        elif self.coordinator is None:
+            self.coordinator = WorkerCoordinator(self, lease_timeout)
+        else:
+            self.coordinator.lease_timeout = lease_timeout
+
+    def _setup_snapshots(self, snapshot_interval: Optional[int]):
+        """
+        Enable or disable periodic snapshots.
+
+        Args:
+            snapshot_interval (int | None):
+                Snapshots interval or None to disable snapshots.
+
+        Returns:
+            None
+
+        """
+
+        if snapshot_interval is None:
+            self.snapshots = None
+        elif self.snapshots is None:
+            self.snapshots = SnapshotManager(snapshot_interval)
+        else:
+            self.snapshots.interval = snapshot_interval
+
+    @contextlib.contextmanager
+    def locked_optimizer(self, blocking=True):
+        """
+        Lock optimizer for ask (or any other use).
+
+        Results told while optimizer was locked by
+        other thread are told to it first.
+
+        Args:
+            blocking (bool):
+                Wait for optimizer, if it's locked by other
+                thread. Otherwise, ``None`` is yielded then.
+
+        Example:
+
+            .. code-block:: python
+
+                with job.locked_optimizer() as optimizer:
+                    configs = optimizer.ask(4)
+
+        """
+
+        if not self.optimizer_lock.acquire(blocking=blocking):
+            yield None
+            return
+
+        try:
+            self._flush_untold()
+            yield self.optimizer
+        finally:
+            self.optimizer_lock.release()
+
+        self._tell_untold()
+
+    def _tell_untold(self):
+        """
+        Tell queued results, unless optimizer is locked
+        by other thread (e.g. asked in background): then
+        they are told by the thread, which locks it next.
+        """
+
+        while self._untold and self.optimizer_lock.acquire(blocking=False):
+            try:
+                self._flush_untold()
+            finally:
+                self.optimizer_lock.release()
+
+    def _flush_untold(self):
+        """Tell queued results to optimizer (under optimizer lock)."""
+
+        while self._untold:
+            configs, objectives, force = self._untold.popleft()
+
+            if force:
+                with contextlib.suppress(Exception):
+                    self.optimizer.tell_many(configs, objectives)
+            else:
+                self.optimizer.tell_many(configs, objectives)
 
     def tell(self, experiment, result: Union[float, Result], force=False):
         """
@@ -452,36 +1074,240 @@ class Job:
 
         """
 
-        objective = result.objective_result if isinstance(result, Result) else result
+        self.tell_many([experiment], [result], force=force)
 
-        if np.isfinite(objective):
-            experiment.success_finish()
-        else:
-            experiment.error_finish()
+    def tell_many(
+        self,
+        experiments: List[Experiment],
+        results: List[Union[float, Result]],
+        force=False,
+    ):
+        """
+        Finish batch of experiments and tell
+        results to oracles with one call.
 
-        if experiment.is_finished():
-            self.pending_experiments -= 1
+        Args:
+            experiments (List[Experiment]):
+                Specified experiments.
+            results (List[Union[float, Result]]):
+                Results for experiments.
+            force (bool):
+                Force result (suppress tell exceptions to optimizer)
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        objectives = [
+            result.objective_result if isinstance(result, Result) else result
+            for result in results
+        ]
+
+        for experiment, objective in zip(experiments, objectives):
+            if np.isfinite(objective):
+                experiment.success_finish()
+            else:
+                experiment.error_finish()
+
+            if not experiment.is_finished():
+                raise ExperimentNotFinishedError()
+
+        configs = [experiment.params for experiment in experiments]
+
+        for experiment, result, objective in zip(experiments, results, objectives):
+            experiment.apply(objective)
 
             if isinstance(result, Result):
-                if force:
-                    with contextlib.suppress(Exception):
-                        self.optimizer.tell(experiment.params, result.objective_result)
-                else:
-                    self.optimizer.tell(experiment.params, result.objective_result)
-                experiment.apply(result.objective_result)
                 experiment.metrics = result.metrics
-            else:
-                if force:
-                    with contextlib.suppress(Exception):
-                        self.optimizer.tell(experiment.params, result)
-                else:
-                    self.optimizer.tell(experiment.params, result)
-                experiment.apply(result)
+
+        with self._lock:
+            self.pending_experiments -= len(experiments)
+
+            # results are stored and queued for optimizer at once,
+            # so snapshots (taken under this lock) are consistent
+            self.storage.insert_experiments(experiments)
+            self._untold.append((configs, objectives, force))
+
+            for experiment, result in zip(experiments, results):
+                self.state.update(experiment)
+                self.intermediate_history.add(experiment)
+
+                if self.coordinator:
+                    self.coordinator.finish(experiment)
+
+                if self.cache:
+                    self.cache.store(experiment, result)
+
+                if self.snapshots:
+                    self.snapshots.on_finish(self)
+
+        self._tell_untold()
+
+        if self.failures:
+            self.failures.add(configs, objectives)
+
+    def prune(self, experiment: Experiment, force=False):
+        """
+        Finish pruned experiment.
+
+        Oracles are told the last reported intermediate
+        value (or +inf if nothing was reported).
+
+        Args:
+            experiment (Experiment):
+                Specified experiment.
+            force (bool):
+                Force result (suppress tell exceptions to optimizer)
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        objective = experiment.last_intermediate_value
+
+        if objective is None:
+            objective = float("+inf")
+
+        experiment.apply(objective)
+        experiment.prune_finish()
+
+        with self._lock:
+            self.pending_experiments -= 1
 
             self.storage.insert_experiment(experiment)
+            self._untold.append(([experiment.params], [objective], force))
+
+            self.state.update(experiment)
+            self.intermediate_history.add(experiment)
+
+            if self.coordinator:
+                self.coordinator.finish(experiment)
+
+            if self.snapshots:
+                self.snapshots.on_finish(self)
+
+        self._tell_untold()
+
+    def discard(self, experiments: List[Experiment]):
+        """
+        Discard asked experiments, which won't be evaluated.
+
+        Args:
+            experiments (List[Experiment]):
+                Asked experiments.
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        with self._lock:
+            self.pending_experiments -= len(experiments)
+
+            if self.coordinator:
+                self.coordinator.release(experiments)
+            elif self._store_wip:
+                self.storage.delete_experiments(self.id, [e.id for e in experiments])
+
+    def detach(self, experiments: List[Experiment]):
+        """
+        Stop waiting for asked experiments, which may be
+        finished after restart (e.g. by external workers).
+
+        Experiments are kept in storage in progress, so
+        :func:`load_job` re-queues them.
+
+        Args:
+            experiments (List[Experiment]):
+                Asked experiments.
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        with self._lock:
+            self.pending_experiments -= len(experiments)
+
+    def _resume(self, n: Optional[int] = None) -> List[Experiment]:
+        """Take up to n unfinished experiments of stopped driver."""
+
+        resumed: List[Experiment] = []
+
+        with self._lock:
+            while self.unfinished and (n is None or len(resumed) < n):
+                resumed.append(self.unfinished.popleft())
+
+            self.pending_experiments += len(resumed)
+
+        for experiment in resumed:
+            experiment._pruning = self._should_prune
+
+        return resumed
+
+    def _store_asked(self, experiments: List[Experiment]):
+        """Store asked experiments in progress, so they survive restart."""
+
+        if not self._store_wip:
             return
 
-        raise ExperimentNotFinishedError()
+        try:
+            self.storage.insert_wip_experiments(experiments)
+        except NotImplementedError:
+            self._store_wip = False
+
+    def absorb(self, experiment: Experiment):
+        """
+        Absorb experiment finished by other worker.
+
+        Args:
+            experiment (Experiment):
+                Finished experiment.
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        with self._lock:
+            self._tell_for_loaded(experiment)
+            self.state.update(experiment)
+            self.intermediate_history.add(experiment)
+
+            if self.failures and experiment.state != ExperimentState.PRUNED:
+                self.failures.add([experiment.params], [experiment.objective_result])
+
+            if self.proposals:
+                self.proposals.add([experiment.params])
+
+            if self.snapshots:
+                self.snapshots.on_finish(self)
+
+    def _should_prune(self, experiment: Experiment) -> bool:
+        """Check experiment with job's pruner."""
+
+        if self.pruner is None:
+            return False
+
+        with self._lock:
+            return self.pruner.should_prune(experiment, self.intermediate_history)
 
     def _tell_for_loaded(self, experiment: Experiment):
         """
@@ -495,19 +1321,31 @@ class Job:
 
         """
 
-        self.optimizer.tell(experiment.params, experiment.objective_result)
+        with self.locked_optimizer():
+            self.optimizer.tell(experiment.params, experiment.objective_result)
 
-    def ask(self, n: int) -> Optional[List[Experiment]]:
+    def ask(
+        self, n: int, configs: Optional[List[Configuration]] = None
+    ) -> Optional[List[Experiment]]:
         """
         Ask for a new experiment.
 
         Args:
             n (int):
                 Preferred count of experiments:
+            configs (List[Configuration] | None):
+                Configurations already asked from optimizer
+                (in background by pipelined engine). If passed,
+                optimizer isn't asked again.
 
         .. note::
             n may not affect on experiments count.
 
+        .. note::
+            Asked experiments are stored in progress (if storage
+            supports it), unfinished experiments of loaded job
+            are asked again first.
+
         Returns:
             None
 
@@ -516,10 +1354,42 @@ class Job:
 
         """
 
-        configs = self.optimizer.ask(n)
+        reclaimed = self._resume(n) if self.unfinished else []
+
+        if self.coordinator:
+            with self._lock:
+                self.coordinator.sync(self)
+
+                expired = self.coordinator.reclaim(n - len(reclaimed))
+                self.pending_experiments += len(expired)
+
+            for experiment in expired:
+                experiment._pruning = self._should_prune
+
+            reclaimed.extend(expired)
+
+        if reclaimed and configs is None:
+            return reclaimed
+
+        if configs is None:
+            with self.locked_optimizer():
+                configs = self.optimizer.ask(n)
+
+        if configs and self.failures:
+            configs = self._avoid_failures(configs, n)
+
+        if configs and self.proposals:
+            configs = self._deduplicate(configs, n)
 
         if not configs:
-            return None
+            return reclaimed or None
+
+        with self._lock:
+            if self.coordinator:
+                ids = self.coordinator.allocate(len(configs))
+                self.pending_experiments += len(configs)
+            else:
+                ids = self.state.reserve(len(configs))
 
         applicator = partial(
             Experiment,
@@ -530,15 +1400,22 @@ class Job:
         experiments = [
             applicator(
                 params=config,
-                id=(self.experiments_count + self.pending_experiments + i),
+                id=idx,
                 create_timestamp=datetime.timestamp(datetime.now()),
             )
-            for i, config in enumerate(configs)
+            for idx, config in zip(ids, configs)
         ]
 
-        self.pending_experiments += len(experiments)
+        for experiment in experiments:
+            experiment._pruning = self._should_prune
 
-        return experiments
+        if self.coordinator:
+            with self._lock:
+                self.coordinator.claim(experiments)
+        else:
+            self._store_asked(experiments)
+
+        return reclaimed + experiments
 
     def get_dataframe(self, brief=False, desc=False, only_good=False):
         """
@@ -566,6 +1443,10 @@ class Job:
         m = float("+inf")
 
         for experiment in self.experiments:
+            if not experiment.is_finished():
+                # experiments in progress have no results yet
+                continue
+
             dataframe_dict = experiment.dict()
 
             if dataframe_dict["objective_result"] < m:
@@ -595,6 +1476,7 @@ class Job:
             del dataframe_dict["finish_timestamp"]
             del dataframe_dict["hash"]
             del dataframe_dict["job_id"]
+            del dataframe_dict["intermediate_values"]
 
             if brief:
                 idx = dataframe_dict["id"]
@@ -679,6 +1561,81 @@ class Job:
 
         self.seeds.append(seed)
 
+    def warm_start(self, top_k: int = 5, history=False) -> List[int]:
+        """
+        Warm-start job from earlier jobs in the storage
+        with compatible search space (the same parameters
+        names, kinds and meta).
+
+        The best ``top_k`` configurations of all compatible
+        jobs are measured first (with :class:`SeedOracle`).
+        If ``history`` is set, their finished experiments are
+        also passed to oracles (see :meth:`Oracle.prime`), so
+        model-based oracles (Bayesian) start with trained model
+        and skip warmup. History isn't evaluated again.
+
+        Args:
+            top_k (int):
+                Count of the best configurations to seed.
+            history (bool):
+                Prime oracles with history of compatible jobs.
+
+        Returns:
+            Indexes of compatible jobs.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        fingerprint = self.search_space.fingerprint
+        sources = []
+        experiments: List[Experiment] = []
+
+        for item in self.storage.jobs:
+            job_id = item["id"]
+
+            if job_id == self.id:
+                continue
+
+            space = self.storage.get_search_space_by_job_id(job_id)
+
+            if space.fingerprint != fingerprint:
+                continue
+
+            sources.append(job_id)
+            experiments.extend(
+                e
+                for e in self.storage.get_experiments_by_job_id(job_id)
+                if e.state == ExperimentState.OK
+                and e.objective_result is not None
+                and np.isfinite(e.objective_result)
+            )
+
+        experiments.sort(key=lambda e: cast(float, e.objective_result))
+
+        seeded: Set[str] = set()
+
+        for experiment in experiments:
+            if len(seeded) >= top_k:
+                break
+
+            if experiment.params_hash in seeded:
+                continue
+
+            seeded.add(experiment.params_hash)
+            self.add_seed(dict(experiment.params))
+
+        if history:
+            self.history.extend(experiments)
+
+        log.info(
+            f"Job <{self.name}> is warm-started from {len(sources)} jobs"
+            f" with {len(seeded)} seeds and {len(self.history)} primed experiments."
+        )
+
+        return sources
+
 
 def _load_storage(storage_or_name: Union[str, Optional[Storage]]) -> Storage:
     """
@@ -718,6 +1675,10 @@ def create_job(
     search_space: SearchSpace,
     name: Optional[str] = None,
     storage: Union[str, Optional[Storage]] = None,
+    load_if_exists=False,
+    restore_snapshot=False,
+    warm_start: int = 0,
+    warm_start_history=False,
     **kwargs,
 ):
     """
@@ -742,6 +1703,20 @@ def create_job(
         storage:
             Storage instance or string
             with `RFC1738` spec.
+        load_if_exists (bool):
+            Load job if it already exists in storage.
+            Useful for workers, which share one job.
+        restore_snapshot (bool):
+            Restore oracles of loaded job from the latest
+            snapshot (see :func:`load_job`). Snapshots are
+            unpickled, enable it only for trusted storages.
+        warm_start (int):
+            Seed new job with specified count of the best
+            configurations of earlier jobs in storage with
+            compatible search space (see :meth:`Job.warm_start`).
+        warm_start_history (bool):
+            Also prime oracles (Bayesian surrogate) with history
+            of compatible jobs without evaluating it again.
 
     Returns:
         Job instance.
@@ -759,9 +1734,32 @@ def create_job(
     assert isinstance(search_space, SearchSpace)
 
     if storage.is_job_name_exists(name):
+        if load_if_exists:
+            return load_job(
+                name=name,
+                storage=storage,
+                restore_snapshot=restore_snapshot,
+                **kwargs,
+            )
+
         raise DuplicatedJobError(f"Job {name} is already exists.")
 
-    job = Job(name, storage, search_space, storage.jobs_count + 1, **kwargs)
+    try:
+        job = Job(name, storage, search_space, storage.jobs_count + 1, **kwargs)
+    except DuplicatedJobError:
+        # job is created concurrently by other worker
+        if not load_if_exists:
+            raise
+
+        return load_job(
+            name=name,
+            storage=storage,
+            restore_snapshot=restore_snapshot,
+            **kwargs,
+        )
+
+    if warm_start or warm_start_history:
+        job.warm_start(warm_start, history=warm_start_history)
 
     return job
 
@@ -770,6 +1768,7 @@ def load_job(
     *,
     name: str,
     storage: Optional[Union[str, Storage]] = None,
+    restore_snapshot=False,
     **kwargs,
 ):
     """
@@ -792,6 +1791,17 @@ def load_job(
         storage:
             Storage instance or string
             with `RFC1738` spec.
+        restore_snapshot (bool):
+            Restore oracles from the latest snapshot (see
+            ``snapshot_interval`` of :meth:`Job.do`) and replay
+            only experiments finished after it. By default,
+            all experiments are replayed.
+
+    .. warning::
+        Snapshots are unpickled, so everyone who can write
+        to the storage can run code in every process, which
+        restores them. Enable ``restore_snapshot`` only for
+        storages, which are writable by trusted parties only.
 
     Returns:
         Job instance.
@@ -808,12 +1818,51 @@ def load_job(
     if not job_id:
         raise JobNotFoundError(f"Job {name} not found is storage.")
 
-    experiments = storage.get_experiments_by_job_id(job_id)
+    finish_seq = 0
+
+    with contextlib.suppress(NotImplementedError):
+        finish_seq = storage.get_finish_seq(job_id)
+
     search_space = storage.get_search_space_by_job_id(job_id)
 
     job = Job(name, storage, search_space, job_id, **kwargs, loaded=True)
+    job.finish_seq = finish_seq
+
+    snapshot = Snapshot.latest(storage, job_id) if restore_snapshot else None
+
+    if snapshot:
+        # only experiments finished after snapshot are replayed
+        experiments, _ = storage.get_experiments_finished_after(
+            job_id, snapshot.finish_seq
+        )
+
+        job.snapshot = snapshot
+        job.state = snapshot.state
+        job.state.pending = 0
+        job.intermediate_history = snapshot.intermediate_history
+        job._loaded_pool_is_complete = False
+
+        for experiment in experiments:
+            job.state.update(experiment)
+    else:
+        # experiments in progress of other workers are skipped
+        experiments = [
+            e for e in storage.get_experiments_by_job_id(job_id) if e.is_finished()
+        ]
+        job.state = JobState.from_experiments(experiments)
 
     job.loaded_experiments_pool.extend(experiments)
+    job.intermediate_history.extend(experiments)
+
+    # experiments in progress of stopped driver are asked again,
+    # their results may still come from external workers
+    job.unfinished.extend(storage.get_unfinished_experiments(job_id))
+
+    if job.unfinished:
+        job.state.next_experiment_id = max(
+            job.state.next_experiment_id, max(e.id for e in job.unfinished) + 1
+        )
+        log.info(f"{len(job.unfinished)} unfinished experiments are re-queued.")
 
     dsl_name = storage.get_optimizer_name_by_job_id(job.id)
 
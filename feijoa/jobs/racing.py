@@ -0,0 +1,286 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Racing evaluation of noisy and multi-instance objectives module."""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import stats
+
+from feijoa.models import Experiment, Result
+
+__all__ = [
+    "Race",
+    "TESTS",
+    "MEASUREMENTS_METRIC",
+    "MEASURE_TIME_METRIC",
+    "RACED_OUT_METRIC",
+]
+
+log = logging.getLogger(__name__)
+
+TESTS = ("t-test", "wilcoxon")
+
+# count of measurements spent on experiment
+MEASUREMENTS_METRIC = "measurements"
+# wall time of measurements in seconds
+MEASURE_TIME_METRIC = "measure_time"
+# 1.0 if experiment was dropped by race
+RACED_OUT_METRIC = "raced_out"
+
+
+class Race:
+    """
+    Racing objective (F-Race style) for noisy
+    and multi-instance measurements.
+
+    Configuration is measured incrementally in blocks
+    ``(repeat, instance)``: every instance once, then every
+    instance again, up to ``n_repeats`` times. After each block
+    (starting from ``min_blocks``) measurements are compared
+    with measurements of incumbent (the best configuration,
+    which finished the whole race) on the same blocks with
+    one-sided paired test. As soon as configuration is
+    significantly worse than incumbent, it's dropped, so bad
+    configurations get a small part of measurement effort.
+
+    Objective of finished configuration is mean of its
+    measurements. Objective of dropped configuration is
+    estimated with paired difference: mean of incumbent plus
+    mean difference on measured blocks, so it's always worse
+    than incumbent.
+
+    Consumed effort is recorded in experiment's metrics:
+    :data:`MEASUREMENTS_METRIC`, :data:`MEASURE_TIME_METRIC`
+    and :data:`RACED_OUT_METRIC`.
+
+    Example:
+
+        .. code-block:: python
+
+            from feijoa.jobs.racing import Race
+
+            def measure(experiment, source):
+                binary = compile_with_flags(source, experiment.params)
+                return run_binary(binary)
+
+            race = Race(measure, instances=["a.c", "b.c"], n_repeats=5)
+
+            job.do(race, n_trials=100, n_jobs=4)
+
+    .. note::
+        Incumbent is kept in objective instance and shared
+        by threads. With `processes` backend every process races
+        against its own incumbent.
+
+    Args:
+        measure (Callable):
+            Measurement function ``measure(experiment, instance)``,
+            which returns float.
+        instances (Sequence):
+            Instances (benchmark programs, datasets), ``[None]``
+            for single-instance objective.
+        n_repeats (int):
+            Max count of measurements of every instance.
+        min_blocks (int):
+            Count of blocks, which are measured before
+            the first test. Must be less than count of
+            blocks (instances times ``n_repeats``).
+        alpha (float):
+            Significance level of test.
+        test (str):
+            Paired test, `t-test` or `wilcoxon`.
+
+    Raises:
+        ValueError: If arguments are incorrect.
+
+    """
+
+    def __init__(
+        self,
+        measure: Callable[[Experiment, object], float],
+        instances: Sequence = (None,),
+        n_repeats: int = 10,
+        min_blocks: int = 3,
+        alpha: float = 0.05,
+        test: str = "t-test",
+    ):
+        if test not in TESTS:
+            raise ValueError(
+                f"Unknown racing test `{test}`. Available: {', '.join(TESTS)}."
+            )
+
+        if not instances or n_repeats < 1 or min_blocks < 2:
+            raise ValueError(
+                "Race must have instances, `n_repeats` must be >= 1"
+                " and `min_blocks` must be >= 2."
+            )
+
+        self.measure = measure
+        self.instances = list(instances)
+        self.n_repeats = n_repeats
+        self.min_blocks = min_blocks
+        self.alpha = alpha
+        self.test = test
+
+        # blocks (repeat, instance index) in measurement order
+        self.blocks: List[Tuple[int, int]] = [
+            (repeat, index)
+            for repeat in range(n_repeats)
+            for index in range(len(self.instances))
+        ]
+
+        if min_blocks >= len(self.blocks):
+            raise ValueError(
+                f"Race of {len(self.blocks)} blocks never drops configurations"
+                f" with `min_blocks` = {min_blocks}: `min_blocks` must be less"
+                f" than count of instances times `n_repeats`."
+            )
+
+        # (mean, measurements by block) of the best finished configuration
+        self.incumbent: Optional[Tuple[float, Dict[Tuple[int, int], float]]] = None
+
+        self.measurements = 0
+        self.dropped = 0
+        self.finished = 0
+
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_lock")
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _worse(self, values: List[float], incumbent: List[float]) -> bool:
+        """Test that values are greater than incumbent's ones."""
+
+        differences = np.subtract(values, incumbent)
+
+        if not np.any(differences) or np.mean(differences) <= 0:
+            return False
+
+        if self.test == "wilcoxon":
+            _, p_value = stats.wilcoxon(values, incumbent, alternative="greater")
+        else:
+            _, p_value = stats.ttest_rel(values, incumbent, alternative="greater")
+
+        return bool(p_value < self.alpha)
+
+    def __call__(self, experiment: Experiment) -> Result:
+        """
+        Race configuration of experiment.
+
+        Args:
+            experiment (Experiment):
+                Experiment instance.
+
+        Returns:
+            Result with objective and consumed effort metrics.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        measured: Dict[Tuple[int, int], float] = dict()
+        # measurements of incumbent on the same blocks
+        rivals: List[float] = []
+        raced_out = False
+
+        with self._lock:
+            incumbent = self.incumbent
+
+        start = time.monotonic()
+
+        for block in self.blocks:
+            _, index = block
+            value = float(self.measure(experiment, self.instances[index]))
+            measured[block] = value
+
+            if not np.isfinite(value):
+                # failed measurement, nothing to race
+                break
+
+            if incumbent is None:
+                continue
+
+            rivals.append(incumbent[1][block])
+
+            if len(measured) >= self.min_blocks and self._worse(
+                list(measured.values()), rivals
+            ):
+                raced_out = True
+                break
+
+        values = list(measured.values())
+
+        if raced_out and incumbent is not None:
+            objective = incumbent[0] + float(np.mean(values) - np.mean(rivals))
+        else:
+            objective = float(np.mean(values))
+
+        with self._lock:
+            self.measurements += len(measured)
+
+            if raced_out:
+                self.dropped += 1
+            else:
+                self.finished += 1
+
+                if np.isfinite(objective) and (
+                    self.incumbent is None or objective < self.incumbent[0]
+                ):
+                    self.incumbent = (objective, measured)
+
+        if raced_out:
+            log.debug(
+                f"Experiment #{experiment.id} is raced out"
+                f" after {len(measured)}/{len(self.blocks)} measurements."
+            )
+
+        return Result(
+            objective_result=objective,
+            metrics={
+                MEASUREMENTS_METRIC: float(len(measured)),
+                MEASURE_TIME_METRIC: time.monotonic() - start,
+                RACED_OUT_METRIC: float(raced_out),
+            },
+        )
+
+    @property
+    def saved_fraction(self) -> float:
+        """Fraction of measurements saved by racing."""
+
+        total = (self.dropped + self.finished) * len(self.blocks)
+
+        if not total:
+            return 0.0
+
+        return 1.0 - self.measurements / total
@@ -0,0 +1,416 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Scheduler of many jobs over one workers pool module."""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, Dict, List, Optional
+
+import joblib
+
+from feijoa.jobs.engine import Engine, EngineStatistics
+from feijoa.jobs.executors import WorkerPool
+from feijoa.models import Experiment
+from feijoa.pruners import Pruner
+
+__all__ = ["Scheduler", "POLICIES"]
+
+log = logging.getLogger(__name__)
+
+POLICIES = ("fair", "priority")
+
+
+class _Lane:
+    """Scheduled job with its engine and share parameters."""
+
+    def __init__(self, index: int, engine: Engine, weight: float, priority: int):
+        self.index = index
+        self.engine = engine
+        self.weight = weight
+        self.priority = priority
+
+        # start times of running trials, by future
+        self.started: Dict = dict()
+
+    @property
+    def job(self):
+        return self.engine.job
+
+    @property
+    def active(self) -> bool:
+        """Lane has trials to submit."""
+
+        engine = self.engine
+
+        return engine.submitted < engine.n_trials and not engine.exhausted
+
+    @property
+    def ready(self) -> bool:
+        """Lane's next trial doesn't wait for ask."""
+
+        return self.active and self.engine.asking() is None
+
+    def share(self, now: float) -> float:
+        """Used worker time divided by weight."""
+
+        used = self.engine.statistics.busy_time + sum(
+            now - start for start in self.started.values()
+        )
+
+        return used / self.weight
+
+    def progress(self) -> dict:
+        """Progress of job."""
+
+        statistics = self.engine.statistics
+
+        return {
+            "job": self.job.name,
+            "trials": statistics.trials,
+            "n_trials": self.engine.n_trials,
+            "running": len(self.started),
+            "best_value": self.job.best_value,
+            "busy_time": statistics.busy_time,
+        }
+
+
+class Scheduler:
+    """
+    Scheduler, which runs many jobs concurrently
+    over one shared long-lived workers pool.
+
+    Every job has its own oracles and trial budget.
+    When a worker is free, the next trial is taken
+    from the job selected by policy:
+
+        fair:
+            Weighted fair share. Job with the least used worker
+            time (finished and running trials) divided by its
+            weight is selected, so jobs with weights 2 and 1 get
+            2/3 and 1/3 of workers time.
+        priority:
+            Job with the highest priority is selected, jobs with
+            the same priority share workers fairly. Lower priority
+            jobs get workers only when higher priority jobs
+            can't use them (budget is submitted, oracles are
+            exhausted or asked).
+
+    Workers never wait for asks of other jobs: jobs are
+    asked in background (the next ask of job overlaps
+    evaluation of its trials), while one job is asked,
+    free workers get trials of other jobs.
+
+    Example:
+
+        .. code-block:: python
+
+            from feijoa.jobs.scheduler import Scheduler
+
+            scheduler = Scheduler(n_jobs=8)
+
+            for source in sources:
+                job = create_job(search_space=space, name=source)
+                scheduler.add(job, make_objective(source), n_trials=200)
+
+            statistics = scheduler.run()
+
+            for progress in scheduler.progress():
+                print(progress)
+
+    Args:
+        n_jobs (int):
+            Count of workers in shared pool.
+            If -1 passed => used max of CPU's.
+        backend (str):
+            Workers pool backend: `threads`, `processes`,
+            `serial` or `asyncio` (coroutine objectives).
+        policy (str):
+            Scheduling policy, `fair` or `priority`.
+
+    Raises:
+        ValueError: If unknown policy passed.
+
+    """
+
+    def __init__(self, n_jobs: int = 1, backend: str = "threads", policy="fair"):
+        if policy not in POLICIES:
+            raise ValueError(
+                f"Unknown scheduling policy `{policy}`."
+                f" Available: {', '.join(POLICIES)}."
+            )
+
+        self.backend = backend
+        self.policy = policy
+        self.n_workers = 1 if backend == "serial" else joblib.effective_n_jobs(n_jobs)
+
+        self.lanes: List[_Lane] = []
+        self.statistics = EngineStatistics(self.n_workers)
+
+    def add(
+        self,
+        job,
+        objective: Callable,
+        n_trials: int = 100,
+        weight: float = 1.0,
+        priority: int = 0,
+        optimizer="",
+        seed=None,
+        n_points_iter: Optional[int] = None,
+        use_cache=False,
+        pruner: Optional[Pruner] = None,
+        pipelined=False,
+        avoid_failures=False,
+        deduplicate=False,
+        ask_timeout: Optional[float] = None,
+        ask_fallback="random",
+    ):
+        """
+        Add job to schedule.
+
+        Args:
+            job (Job):
+                Job instance.
+            objective (Callable):
+                Objective function of job.
+            n_trials (int):
+                Trial budget of job.
+            weight (float):
+                Share of workers time for `fair` policy.
+            priority (int):
+                Priority for `priority` policy, higher is first.
+            optimizer (str):
+                Optimizer according to feijoa's optimizer's spec.
+            seed (int | None):
+                Random seed.
+            n_points_iter (int | None):
+                The preferred number of configurations in one ask,
+                by default one configuration per free worker.
+            use_cache (bool):
+                Use evaluation cache (see :meth:`Job.do`).
+            pruner (Pruner | None):
+                Pruner of experiments (see :meth:`Job.do`).
+            pipelined (bool):
+                Ask the next configurations of job in background
+                (see :meth:`Job.do`).
+            avoid_failures (bool):
+                Use failure model (see :meth:`Job.do`).
+            deduplicate (bool):
+                Drop already proposed configurations (see :meth:`Job.do`).
+            ask_timeout (float | None):
+                Deadline of oracle's ask (see :meth:`Job.do`).
+            ask_fallback (str):
+                Fallback for missed deadlines (see :meth:`Job.do`).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If weight isn't positive.
+
+        """
+
+        if weight <= 0:
+            raise ValueError("Weight of job must be positive.")
+
+        job._setup_optimizer(optimizer, seed)
+        job._setup_cache(use_cache)
+        job._setup_failures(avoid_failures)
+        job._setup_proposals(deduplicate)
+        job._setup_deadline(ask_timeout, ask_fallback, seed)
+        job.pruner = pruner
+
+        engine = Engine(
+            job,
+            objective,
+            n_trials=n_trials,
+            n_jobs=self.n_workers,
+            n_points_iter=n_points_iter,
+            backend=self.backend,
+            pipelined=pipelined,
+        )
+
+        self.lanes.append(_Lane(len(self.lanes), engine, weight, priority))
+
+    def _select(self, now: float) -> Optional[_Lane]:
+        """Select lane for free worker according to policy."""
+
+        lanes = [lane for lane in self.lanes if lane.ready]
+
+        if not lanes:
+            return None
+
+        if self.policy == "priority":
+            top = max(lane.priority for lane in lanes)
+            lanes = [lane for lane in lanes if lane.priority == top]
+
+        return min(
+            lanes, key=lambda lane: (lane.share(now), len(lane.started) / lane.weight)
+        )
+
+    def progress(self) -> List[dict]:
+        """
+        Get progress of scheduled jobs.
+
+        Returns:
+            List of dictionaries with job name, finished
+            and budgeted trials, running trials, best value
+            and used worker time.
+
+        """
+
+        return [lane.progress() for lane in self.lanes]
+
+    def run(
+        self, callback: Optional[Callable[[object, Experiment], None]] = None
+    ) -> EngineStatistics:
+        """
+        Run all scheduled jobs until their budgets are spent.
+
+        Args:
+            callback (Callable, optional):
+                Called with job and every its finished experiment.
+
+        Returns:
+            Aggregate statistics of session (per-job
+            statistics are available in job's ``statistics``).
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        for lane in self.lanes:
+            if callback is not None:
+                lane.engine.callback = lambda experiment, job=lane.job: callback(
+                    job, experiment
+                )
+
+        pool = WorkerPool(
+            {lane.index: lane.engine.objective for lane in self.lanes},
+            self.n_workers,
+            self.backend,
+        )
+        # future -> lane
+        in_flight: Dict = dict()
+
+        start = time.monotonic()
+
+        try:
+            while True:
+                while len(in_flight) < self.n_workers:
+                    selected = self._select(time.monotonic())
+
+                    if selected is None:
+                        break
+
+                    engine = selected.engine
+                    idle = self.n_workers - len(in_flight)
+
+                    # job is asked in background, other
+                    # jobs are selected while it's asked
+                    engine.request(idle)
+
+                    if engine.asking() is not None:
+                        continue
+
+                    experiment = engine.next_experiment(idle)
+
+                    if experiment is None or engine.lookup(experiment):
+                        continue
+
+                    future = pool.submit(experiment, key=selected.index)
+                    in_flight[future] = selected
+                    engine.running[future] = experiment
+                    selected.started[future] = time.monotonic()
+
+                    if selected.active:
+                        # the next ask overlaps evaluation, as workers
+                        # of job are expected to be free again
+                        engine.request(len(selected.started))
+
+                # background asks of jobs
+                asking: List[Future] = []
+
+                for lane in self.lanes:
+                    prefetched = lane.engine.asking() if lane.active else None
+
+                    if prefetched is not None:
+                        asking.append(prefetched)
+
+                if not in_flight and not any(lane.active for lane in self.lanes):
+                    break
+
+                done, _ = wait([*in_flight, *asking], return_when=FIRST_COMPLETED)
+
+                # finished trials by lane index
+                finished: Dict[int, list] = dict()
+
+                for future in done:
+                    if future not in in_flight:
+                        # asked configurations are taken on the next round
+                        continue
+
+                    lane = in_flight.pop(future)
+                    lane.started.pop(future)
+                    experiment = lane.engine.running.pop(future)
+                    result, elapsed = future.result()
+                    finished.setdefault(lane.index, []).append(
+                        (experiment, result, elapsed)
+                    )
+
+                for index, batch in finished.items():
+                    self.lanes[index].engine.finish(batch)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+            self._close(start)
+
+        return self.statistics
+
+    def _close(self, start: float):
+        """Close session of all jobs and aggregate statistics."""
+
+        statistics = EngineStatistics(self.n_workers)
+
+        for lane in self.lanes:
+            lane.engine.close(start)
+            lane.job.statistics = lane.engine.statistics
+
+            statistics.trials += lane.engine.statistics.trials
+            statistics.pruned += lane.engine.statistics.pruned
+            statistics.busy_time += lane.engine.statistics.busy_time
+            statistics.ask_time += lane.engine.statistics.ask_time
+
+        statistics.wall_time = time.monotonic() - start
+
+        self.statistics = statistics
+
+        for progress in self.progress():
+            log.info(
+                f"Job <{progress['job']}>: {progress['trials']}/{progress['n_trials']}"
+                f" trials, best: {progress['best_value']}"
+            )
+
+        log.info(f"Scheduler statistics: {statistics}")
@@ -0,0 +1,449 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Ask/tell server for external workers module."""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+
+from feijoa.models import Experiment, Result
+
+__all__ = ["JobServer"]
+
+log = logging.getLogger(__name__)
+
+
+def _default(value):
+    """Make numpy scalars JSON serializable."""
+
+    if hasattr(value, "item"):
+        return value.item()
+
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _dump(experiment: Experiment) -> dict:
+    """Dump experiment for worker."""
+
+    return {
+        "id": experiment.id,
+        "job_id": experiment.job_id,
+        "params": dict(experiment.params),
+        "requestor": experiment.params.requestor,
+        "budget": experiment.budget,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """JSON handler, connections are kept alive."""
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are sent with separate writes,
+    # they must not wait for delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._handle(None)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._reply(400, {"error": "Body must be JSON."})
+            return
+
+        self._handle(body)
+
+    def _handle(self, body):
+        server: JobServer = self.server.job_server  # type: ignore
+        route = server.routes.get((self.command, self.path))
+
+        if route is None:
+            self._reply(404, {"error": f"Unknown endpoint {self.path}."})
+            return
+
+        try:
+            self._reply(200, route(body) if body is not None else route())
+        except (KeyError, TypeError, ValueError) as e:
+            self._reply(400, {"error": repr(e)})
+        except Exception as e:
+            log.exception(f"Request {self.command} {self.path} is failed.")
+            self._reply(500, {"error": repr(e)})
+
+    def _reply(self, code: int, payload: dict):
+        data = json.dumps(payload, default=_default).encode()
+
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        log.debug(format % args)
+
+
+class JobServer:
+    """
+    HTTP/JSON ask/tell server, which wraps job.
+
+    Lets evaluations run in external processes, containers
+    or batch schedulers, which can't import objective into
+    :meth:`Job.do`. Workers lease experiments with ``ask``
+    and return results with ``tell`` (see
+    :class:`feijoa.jobs.client.JobClient`). Both requests
+    are batched, connections are kept alive.
+
+    Endpoints:
+
+        POST /ask:
+            ``{"n": 4}`` -> ``{"experiments": [{"id", "params",
+            "requestor", "budget"}, ...]}``. Empty list means
+            that trials are over.
+        POST /tell:
+            ``{"results": [{"id", "objective", "metrics"}, ...]}``
+            -> ``{"told": 3, "ignored": 1}``. Results of unknown
+            (already told or expired) experiments are ignored.
+        GET /status:
+            Count of experiments, leased experiments,
+            best value and parameters.
+
+    Example:
+
+        .. code-block:: python
+
+            from feijoa.jobs.server import JobServer
+
+            with JobServer(job, port=8642, n_trials=1000) as server:
+                server.wait()
+
+    Args:
+        job (Job):
+            Job instance.
+        host (str):
+            Host to bind.
+        port (int):
+            Port to bind, 0 picks free port.
+        optimizer (str):
+            Optimizer according to feijoa's optimizer's spec.
+        seed (int | None):
+            Random seed.
+        n_trials (int | None):
+            Count of experiments to lease, unlimited by default.
+        lease_timeout (float | None):
+            Experiments, which aren't told during lease timeout
+            (worker died), are leased to other workers again.
+            Unfinished experiments of loaded job are leased
+            to their workers once more on start.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(
+        self,
+        job,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        optimizer: str = "",
+        seed=None,
+        n_trials: Optional[int] = None,
+        lease_timeout: Optional[float] = None,
+    ):
+        self.job = job
+        self.n_trials = n_trials
+        self.lease_timeout = lease_timeout
+
+        job._setup_optimizer(optimizer, seed)
+
+        # experiment id -> (experiment, lease deadline)
+        self.leased: Dict[int, Tuple[Experiment, float]] = dict()
+        # asked from job, but not leased yet
+        self.backlog: Deque[Experiment] = deque()
+        self.issued = 0
+        self.told = 0
+        self.exhausted = False
+
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+        # experiments leased before restart, their
+        # workers may still tell results
+        self._reattach(job._resume())
+
+        self.routes = {
+            ("POST", "/ask"): self.ask,
+            ("POST", "/tell"): self.tell,
+            ("GET", "/status"): self.status,
+        }
+
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.job_server = self  # type: ignore
+
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of server."""
+
+        host, port = self.httpd.server_address[:2]
+
+        if isinstance(host, bytes):
+            host = host.decode()
+
+        return f"http://{host}:{port}"
+
+    def ask(self, body: dict) -> dict:
+        """
+        Lease experiments to worker.
+
+        Args:
+            body (dict):
+                Request with preferred count ``n``.
+
+        Returns:
+            Response with leased experiments.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        n = int(body.get("n", 1))
+
+        with self._lock:
+            experiments = self._expired(n)
+
+            while len(experiments) < n and not self._over():
+                if not self.backlog:
+                    asked = self.job.ask(n - len(experiments))
+
+                    if not asked:
+                        self.exhausted = True
+                        break
+
+                    self.backlog.extend(asked)
+
+                experiments.append(self.backlog.popleft())
+                self.issued += 1
+
+            deadline = time.monotonic() + (self.lease_timeout or float("+inf"))
+
+            for experiment in experiments:
+                self.leased[experiment.id] = (experiment, deadline)
+
+            self._check_finished()
+
+        return {"experiments": [_dump(e) for e in experiments]}
+
+    def tell(self, body: dict) -> dict:
+        """
+        Tell results of workers to job with one batch.
+
+        Args:
+            body (dict):
+                Request with ``results`` list.
+
+        Returns:
+            Response with count of told and ignored results.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        experiments: List[Experiment] = []
+        results: List[Result] = []
+
+        with self._lock:
+            for item in body["results"]:
+                lease = self.leased.pop(int(item["id"]), None)
+
+                if lease is None:
+                    continue
+
+                objective = item["objective"]
+
+                experiments.append(lease[0])
+                results.append(
+                    Result(
+                        objective_result=(
+                            float("+inf") if objective is None else float(objective)
+                        ),
+                        metrics=item.get("metrics"),
+                    )
+                )
+
+            self.told += len(experiments)
+
+        if experiments:
+            self.job.tell_many(experiments, results)
+
+        with self._lock:
+            self._check_finished()
+
+        return {
+            "told": len(experiments),
+            "ignored": len(body["results"]) - len(experiments),
+        }
+
+    def status(self) -> dict:
+        """
+        Get status of job.
+
+        Returns:
+            Response with job status.
+
+        """
+
+        return {
+            "job": self.job.name,
+            "issued": self.issued,
+            "told": self.told,
+            "leased": len(self.leased),
+            "finished": self._finished.is_set(),
+            "best_value": self.job.best_value,
+            "best_parameters": self.job.best_parameters,
+        }
+
+    def _over(self) -> bool:
+        """Check if experiments are over."""
+
+        return self.exhausted or (
+            self.n_trials is not None and self.issued >= self.n_trials
+        )
+
+    def _check_finished(self):
+        """Set finished event if experiments are over and told."""
+
+        if self._over() and not self.leased:
+            self._finished.set()
+
+    def _expired(self, n: int) -> List[Experiment]:
+        """Take experiments with expired leases."""
+
+        if self.lease_timeout is None:
+            return []
+
+        now = time.monotonic()
+
+        expired = [
+            experiment
+            for experiment, deadline in self.leased.values()
+            if deadline <= now
+        ][:n]
+
+        if expired:
+            log.warning(f"{len(expired)} expired experiments are leased again.")
+
+        return expired
+
+    def _reattach(self, experiments: List[Experiment]):
+        """Lease experiments to workers of stopped server again."""
+
+        deadline = time.monotonic() + (self.lease_timeout or float("+inf"))
+
+        for experiment in experiments:
+            self.leased[experiment.id] = (experiment, deadline)
+
+        if experiments:
+            log.info(f"{len(experiments)} experiments in progress are reattached.")
+
+    def start(self) -> "JobServer":
+        """
+        Start serving in background thread.
+
+        Returns:
+            Server instance.
+
+        """
+
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="feijoa-server", daemon=True
+        )
+        self._thread.start()
+
+        log.info(f"Job <{self.job.name}> is served at {self.url}")
+
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all leased experiments are told.
+
+        Args:
+            timeout (float | None):
+                Timeout in seconds.
+
+        Returns:
+            ``True`` if experiments are over and told.
+
+        """
+
+        return self._finished.wait(timeout)
+
+    def stop(self):
+        """
+        Stop server, not leased experiments are discarded.
+
+        Leased experiments are kept in progress, so server of
+        loaded job reattaches them (see :func:`load_job`).
+
+        Returns:
+            None
+
+        """
+
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self.httpd.server_close()
+
+        with self._lock:
+            leased = [e for e, _ in self.leased.values()]
+            dropped = list(self.backlog)
+            self.leased.clear()
+            self.backlog.clear()
+
+        if leased:
+            # leased experiments are kept in progress,
+            # so restarted server accepts their results
+            self.job.detach(leased)
+
+        if dropped:
+            self.job.discard(dropped)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
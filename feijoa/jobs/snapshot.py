@@ -0,0 +1,219 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Snapshots of job's oracles module."""
+
+import logging
+import pickle
+from typing import Optional
+
+try:
+    import cloudpickle
+except ImportError:  # pragma: no cover
+    # older joblib versions vendor cloudpickle
+    from joblib.externals import cloudpickle  # type: ignore
+
+__all__ = ["Snapshot", "SnapshotManager"]
+
+log = logging.getLogger(__name__)
+
+
+class Snapshot:
+    """
+    Snapshot of job's oracles and bookkeeping.
+
+    Contains meta-oracle with all child oracles (bandit
+    state, surrogate training data, populations, etc.),
+    job state index and intermediate values, so the job
+    can be resumed without replaying all experiments.
+
+    Args:
+        finish_seq (int):
+            Finish sequence number of the last
+            experiment told to oracles.
+        optimizer (MetaOracle):
+            Job's optimizer.
+        optimizer_name_dsl (str):
+            DSL spec of optimizer.
+        state (JobState):
+            Job state index.
+        intermediate_history (IntermediateHistory):
+            Intermediate values of experiments.
+
+    """
+
+    def __init__(
+        self,
+        finish_seq,
+        optimizer,
+        optimizer_name_dsl,
+        state,
+        intermediate_history,
+    ):
+        self.finish_seq = finish_seq
+        self.optimizer = optimizer
+        self.optimizer_name_dsl = optimizer_name_dsl
+        self.state = state
+        self.intermediate_history = intermediate_history
+
+    def dumps(self) -> bytes:
+        """Serialize snapshot (without finish sequence number)."""
+
+        return cloudpickle.dumps(
+            {
+                "optimizer": self.optimizer,
+                "optimizer_name_dsl": self.optimizer_name_dsl,
+                "state": self.state,
+                "intermediate_history": self.intermediate_history,
+            }
+        )
+
+    @classmethod
+    def loads(cls, finish_seq, data: bytes) -> "Snapshot":
+        """
+        Deserialize snapshot.
+
+        Data is unpickled, so it must come
+        from a trusted storage only.
+        """
+
+        return cls(finish_seq, **pickle.loads(data))
+
+    @classmethod
+    def latest(cls, storage, job_id) -> Optional["Snapshot"]:
+        """
+        Load the latest snapshot of job from storage.
+
+        Args:
+            storage (Storage):
+                Storage instance.
+            job_id (int):
+                Job index.
+
+        Returns:
+            The latest snapshot or None if storage has
+            no snapshots of job or doesn't support them.
+
+        """
+
+        try:
+            found = storage.get_latest_snapshot(job_id)
+        except NotImplementedError:
+            return None
+
+        if found is None:
+            return None
+
+        finish_seq, data = found
+
+        try:
+            return cls.loads(finish_seq, data)
+        except Exception as e:
+            # e.g. snapshot made by other version of package
+            log.warning(f"Snapshot of job {job_id} can't be restored: {e}")
+            return None
+
+
+class SnapshotManager:
+    """
+    Periodic snapshots of job's oracles.
+
+    Snapshot is taken after every `interval`
+    finished experiments and saved in job's storage.
+
+    Args:
+        interval (int):
+            Count of finished experiments between snapshots.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(self, interval: int):
+        if interval < 1:
+            raise ValueError("Snapshot interval must be >= 1.")
+
+        self.interval = interval
+        self.since_last = 0
+        self.taken = 0
+
+    def on_finish(self, job):
+        """Account finished experiment and take snapshot if needed."""
+
+        self.since_last += 1
+
+        if self.since_last >= self.interval:
+            # if oracles are asked in background (pipelined
+            # engine), snapshot is taken after the next finish
+            self.take(job, blocking=False)
+
+    def take(self, job, blocking=True):
+        """
+        Take snapshot of job's oracles.
+
+        Must be called under job's bookkeeping lock, so
+        results are stored and told to oracles up to
+        the sequence number of snapshot.
+
+        Args:
+            job (Job):
+                Job instance.
+            blocking (bool):
+                Wait for oracles, if they are asked
+                by other thread, or skip snapshot.
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        with job.locked_optimizer(blocking=blocking) as optimizer:
+            if optimizer is None:
+                return
+
+            if job.coordinator:
+                # results of other workers are told up to synced number
+                finish_seq = job.coordinator.finish_seq
+            else:
+                finish_seq = job.storage.get_finish_seq(job.id)
+
+            snapshot = Snapshot(
+                finish_seq,
+                optimizer,
+                job.optimizer_name_dsl,
+                job.state,
+                job.intermediate_history,
+            )
+            dumped = snapshot.dumps()
+
+        job.storage.insert_snapshot(job.id, finish_seq, dumped)
+
+        self.since_last = 0
+        self.taken += 1
+
+        log.debug(f"Snapshot of job <{job.name}> is taken at {finish_seq}.")
+
+    def __repr__(self):
+        return f"SnapshotManager(interval={self.interval}, taken={self.taken})"
@@ -0,0 +1,137 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Job state index module."""
+
+from typing import Iterable, Optional
+
+from feijoa.models import Experiment
+from feijoa.models.experiment import ExperimentState
+
+__all__ = ["JobState"]
+
+
+class JobState:
+    """
+    In-memory index of job bookkeeping.
+
+    Keeps running best experiment, next experiment id,
+    rewards counter and pending experiments count, so
+    the optimization loop doesn't rescan the storage
+    on every iteration. The index is updated on every
+    finished experiment and seeded from storage
+    only on job loading.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(self):
+        self.best_experiment: Optional[Experiment] = None
+        self.next_experiment_id = 0
+        self.rewards = 0
+        self.pending = 0
+        self.finished = 0
+        self._rewards_threshold = float("+inf")
+
+    @classmethod
+    def from_experiments(cls, experiments: Iterable[Experiment]) -> "JobState":
+        """
+        Build index from stored experiments.
+
+        Args:
+            experiments (Iterable[Experiment]):
+                Finished experiments in order of insertion.
+
+        Returns:
+            Seeded job state.
+
+        """
+
+        state = cls()
+
+        for experiment in experiments:
+            state.update(experiment)
+
+        return state
+
+    def reserve(self, n: int) -> range:
+        """
+        Reserve ids for new pending experiments.
+
+        Args:
+            n (int):
+                Count of experiments.
+
+        Returns:
+            Range of reserved ids.
+
+        """
+
+        ids = range(self.next_experiment_id, self.next_experiment_id + n)
+        self.next_experiment_id += n
+        self.pending += n
+        return ids
+
+    def update(self, experiment: Experiment):
+        """
+        Account finished experiment.
+
+        Args:
+            experiment (Experiment):
+                Finished experiment.
+
+        Returns:
+            None
+
+        """
+
+        self.finished += 1
+        self.next_experiment_id = max(self.next_experiment_id, experiment.id + 1)
+
+        if experiment.state == ExperimentState.PRUNED:
+            # pruned experiments are not fully measured
+            return
+
+        objective = experiment.objective_result
+
+        if (
+            self.best_experiment is None
+            # FIXME (qnbhd): Comparison with None
+            or objective < self.best_experiment.objective_result  # type: ignore
+        ):
+            self.best_experiment = experiment
+
+        if objective < self._rewards_threshold:
+            self.rewards += 1
+            self._rewards_threshold = objective
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        if self.best_experiment is not None:
+            # don't serialize pruning callback bound to job
+            best = self.best_experiment.copy()
+            best._pruning = None
+            state["best_experiment"] = best
+
+        return state
@@ -0,0 +1,320 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Vectorized trials evaluation engine module."""
+
+import functools
+import logging
+import time
+import warnings
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+try:
+    from numba import prange
+except ImportError:  # pragma: no cover
+    prange = range  # type: ignore
+
+from feijoa.jobs.engine import Engine, EngineStatistics, check_ranges
+from feijoa.models import Experiment
+from feijoa.utils.imports import ImportWrapper
+from feijoa.utils.transformers import batch_columns, batch_inverse_transform
+
+__all__ = ["VectorizedEngine", "LAYOUTS", "numba_objective"]
+
+log = logging.getLogger(__name__)
+
+LAYOUTS = ("array", "columns")
+
+
+def _evaluate_rows(kernel, X):
+    """Evaluate kernel on every row of matrix in parallel."""
+
+    results = np.empty(X.shape[0])
+
+    for i in prange(X.shape[0]):
+        results[i] = kernel(X[i])
+
+    return results
+
+
+@functools.lru_cache(maxsize=None)
+def _rows_evaluator():
+    """
+    Compile rows evaluator once per process.
+
+    Kernel is passed as first-class function with fixed
+    signature, so compiled evaluator is cached on disk
+    and shared by all objectives.
+    """
+
+    with ImportWrapper():
+        import numba
+        from numba import types
+
+    if numba.config.THREADING_LAYER == "default":
+        # TBB pool hangs at exit of process, which forked
+        # workers after pool start (`processes` backend)
+        numba.config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+
+    kernel_type = types.FunctionType(types.float64(types.float64[::1]))
+    signature = types.float64[::1](kernel_type, types.float64[:, ::1])
+
+    return numba.njit(signature, parallel=True, nogil=True, cache=True)(_evaluate_rows)
+
+
+def numba_objective(objective: Callable) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Compile objective with numba to batch objective
+    for :class:`VectorizedEngine` with `array` layout.
+
+    Example:
+
+        .. code-block:: python
+
+            def objective(x):
+                return (x[0] - 1.0) ** 2 + x[1] ** 2
+
+            batch_objective = numba_objective(objective)
+            batch_objective(np.random.rand(1000, 2))
+
+    Args:
+        objective (Callable):
+            Function (or numba dispatcher), which takes float64
+            vector in search space order (categorical values are
+            replaced with their indices) and returns float.
+            It's compiled in nopython mode without GIL, compilation
+            is cached on disk if function is defined in a file.
+
+    Returns:
+        Function, which evaluates objective on every row
+        of float64 matrix in parallel loop.
+
+    Raises:
+        PackageNotInstalledError: If numba isn't installed.
+
+    """
+
+    with ImportWrapper():
+        import numba
+        from numba import types
+
+    function = getattr(objective, "py_func", objective)
+    signature = types.float64(types.float64[::1])
+
+    try:
+        kernel = numba.njit(signature, cache=True, nogil=True)(function)
+    except RuntimeError as e:
+        # functions defined in REPL can't be cached
+        log.warning(f"Objective compilation isn't cached: {e}")
+        kernel = numba.njit(signature, nogil=True)(function)
+
+    evaluator = _rows_evaluator()
+
+    def batch_objective(X: np.ndarray) -> np.ndarray:
+        return evaluator(kernel, np.ascontiguousarray(X, dtype=np.float64))
+
+    return batch_objective
+
+
+class VectorizedEngine(Engine):
+    """
+    Engine, which evaluates a whole batch of
+    configurations with one objective call.
+
+    Suitable for cheap analytic objectives (synthetic
+    benchmarks, surrogate models), which are written
+    with NumPy operations: per-trial dispatch is replaced
+    with one call per batch, and results of batch are told
+    to the job (and stored) at once.
+
+    Example:
+
+        .. code-block:: python
+
+            from feijoa.jobs.vectorized import VectorizedEngine
+
+            def objective(X):
+                return (X[:, 0] - 1.0) ** 2 + X[:, 1] ** 2
+
+            engine = VectorizedEngine(job, objective, n_trials=10000)
+            statistics = engine.run()
+
+    Args:
+        job (Job):
+            Job instance, used for ask-tell.
+        objective (Callable):
+            Objective function, which takes a batch
+            and returns array of objective results.
+        n_trials (int):
+            Number of total runs.
+        n_points_iter (int | None):
+            Count of configurations in one batch. By default,
+            ``batch_size`` capped by remaining trials and
+            ``max_batch_size`` of optimizer.
+        layout (str):
+            Layout of batch: `array` is float64 matrix with
+            columns in search space order (categorical values
+            are replaced with their indices), `columns` is dict
+            of parameter's name to array of its values.
+        pipelined (bool):
+            Ask the next batch in background while the current
+            one is evaluated (objectives compiled without GIL, see
+            :func:`numba_objective`, don't block the ask thread).
+
+    Raises:
+        ValueError: If unknown layout passed.
+
+    """
+
+    batch_size = 256
+
+    def __init__(
+        self,
+        job,
+        objective: Callable,
+        *,
+        n_trials: int,
+        n_points_iter: Optional[int] = None,
+        layout: str = "array",
+        pipelined: bool = False,
+    ):
+        if layout not in LAYOUTS:
+            raise ValueError(
+                f"Unknown batch layout `{layout}`." f" Available: {', '.join(LAYOUTS)}."
+            )
+
+        super().__init__(
+            job,
+            objective,
+            n_trials=n_trials,
+            n_points_iter=n_points_iter,
+            backend="serial",
+            pipelined=pipelined,
+        )
+
+        self.layout = layout
+
+    def evaluate(self, experiments: List[Experiment]) -> np.ndarray:
+        """
+        Evaluate objective on batch of experiments.
+
+        Args:
+            experiments (List[Experiment]):
+                Experiments of batch.
+
+        Returns:
+            Objective results.
+
+        Raises:
+            ValueError: If objective returns wrong count of results.
+
+        """
+
+        configs = [experiment.params for experiment in experiments]
+
+        batch: Union[dict, np.ndarray]
+
+        if self.layout == "columns":
+            batch = batch_columns(configs, self.job.search_space)
+        else:
+            batch = batch_inverse_transform(configs, self.job.search_space)
+
+        results = np.asarray(self.objective(batch), dtype=np.float64).reshape(-1)
+
+        if len(results) != len(experiments):
+            raise ValueError(
+                f"Objective returned {len(results)} results"
+                f" for batch of {len(experiments)} configurations."
+            )
+
+        return results
+
+    def run(
+        self, callback: Optional[Callable[[Experiment], None]] = None
+    ) -> EngineStatistics:
+        """
+        Run optimization session.
+
+        Args:
+            callback (Callable, optional):
+                Called with every finished experiment.
+
+        Returns:
+            Statistics of session.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        self.callback = callback
+
+        start = time.monotonic()
+
+        try:
+            while self.submitted < self.n_trials:
+                experiments = self._ask(self._batch_size(self.batch_size))
+
+                if not experiments:
+                    warnings.warn("No new configurations.")
+                    self.exhausted = True
+                    break
+
+                for experiment in experiments:
+                    check_ranges(self.job.search_space, experiment.params)
+
+                remaining = self.n_trials - self.submitted
+
+                # extra configurations are discarded on close
+                self.backlog.extend(experiments[remaining:])
+                batch = experiments[:remaining]
+                self.submitted += len(batch)
+
+                measured = [
+                    experiment for experiment in batch if not self.lookup(experiment)
+                ]
+
+                # batch in evaluation is pending for the next ask
+                self.running = dict(enumerate(measured))
+
+                if self.pipelined and self.submitted < self.n_trials:
+                    self._prefetch(self._batch_size(self.batch_size))
+
+                if not measured:
+                    continue
+
+                evaluation_start = time.monotonic()
+                results = self.evaluate(measured)
+                elapsed = (time.monotonic() - evaluation_start) / len(measured)
+                self.running = dict()
+
+                self.finish(
+                    [
+                        (experiment, result, elapsed)
+                        for experiment, result in zip(measured, results.tolist())
+                    ]
+                )
+        finally:
+            self.close(start)
+
+        return self.statistics
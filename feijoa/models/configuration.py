@@ -21,9 +21,37 @@
 # SOFTWARE.
 """Configuration model class module."""
 
+import hashlib
+import json
+import uuid
 from pprint import pformat
 
-__all__ = ["Configuration"]
+__all__ = ["Configuration", "fingerprint"]
+
+
+def fingerprint(params: dict, budget=None) -> str:
+    """
+    Canonical hash of configuration.
+
+    Args:
+        params (dict):
+            Configuration (or parameters dict).
+        budget (int | float | None):
+            Evaluation budget, configurations with
+            different budgets have different hashes.
+
+    Returns:
+        Hex digest.
+
+    """
+
+    # numpy scalars are dumped as python ones
+    params_dumped = json.dumps(params, sort_keys=True, default=lambda v: v.item())
+
+    if budget is not None:
+        params_dumped += f"@{budget}"
+
+    return hashlib.sha1(params_dumped.encode()).hexdigest()
 
 
 class Configuration(dict):
@@ -42,6 +70,13 @@ class Configuration(dict):
             request_id=0,
         )
 
+        # multi-fidelity oracles attach budget
+        configuration = Configuration(
+            {"foo": 1, "bar": 2},
+            requestor="hyperband",
+            budget=27,
+        )
+
     Args:
         1st:
             configuration dict.
@@ -50,6 +85,14 @@ class Configuration(dict):
         request_id (int, optional):
             Index of requested configuration
             for specified requestor.
+        budget (int | float, optional):
+            Evaluation budget (epochs, iterations,
+            input size, etc.) for configuration.
+            Used by multi-fidelity oracles.
+        token (str, optional):
+            Unique request token. Generated if not passed.
+            Oracles match told results with their requests
+            by token, so results may be told in any order.
 
     """
 
@@ -58,18 +101,23 @@ class Configuration(dict):
         *args,
         requestor="UNKNOWN",
         request_id=0,
+        budget=None,
+        token=None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self.requestor = requestor
         self.request_id = request_id
+        self.budget = budget
+        self.token = token or uuid.uuid4().hex
 
     def __str__(self):
         fmt = pformat(dict(self.items()))
         return (
             f"Configuration({fmt}, "
             f"requestor={self.requestor}, "
-            f"request_id={self.request_id})"
+            f"request_id={self.request_id}"
+            + (f", budget={self.budget})" if self.budget is not None else ")")
         )
 
     def __repr__(self):
@@ -25,11 +25,11 @@ import datetime
 import hashlib
 import json
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
-from feijoa.models.configuration import Configuration
+from feijoa.models.configuration import Configuration, fingerprint
 
 __all__ = ["ExperimentState", "Experiment"]
 
@@ -39,6 +39,7 @@ class ExperimentState(str, Enum):
     OK = "OK"
     WIP = "WIP"
     ERROR = "ERROR"
+    PRUNED = "PRUNED"
 
     def __repr__(self):
         return self.name
@@ -59,7 +60,8 @@ class Experiment(BaseModel):
     2) Suggest experiment to job
     3) Measure it
     4) If all metrics are collected set OK state,
-       if error caused - ERROR.
+       if error caused - ERROR, if trial was stopped
+       by pruner - PRUNED.
     5) Finish experiment - calculate hash, set finish
        timestamp
     6) Tell to optimizers
@@ -71,7 +73,7 @@ class Experiment(BaseModel):
         job_id (int):
             Job index.
         state (ExperimentState):
-            Experiment state. Must be `WIP`, `OK` or `ERROR`
+            Experiment state. Must be `WIP`, `OK`, `ERROR` or `PRUNED`
         hash (str, optional):
             Hash of experiment.
         objective_result (Optional[Any]):
@@ -84,6 +86,9 @@ class Experiment(BaseModel):
             Experiment finish timestamp.
         metrics (dict, optional):
             Metrics of experiment.
+        intermediate_values (dict, optional):
+            Intermediate objective values by step,
+            reported by objective.
 
     Raises:
         AnyError: If anything bad happens.
@@ -99,6 +104,9 @@ class Experiment(BaseModel):
     create_timestamp: float
     finish_timestamp: Optional[float]
     metrics: Optional[dict]
+    intermediate_values: Optional[Dict[int, float]]
+
+    _pruning: Optional[Callable] = PrivateAttr(default=None)
 
     class Config:
         orm_mode = True
@@ -122,6 +130,64 @@ class Experiment(BaseModel):
         # TODO (qnbhd): make safe operations
         self.objective_result = result
 
+    def report(self, step: int, value: float):
+        """
+        Report intermediate objective value.
+
+        Example:
+
+            .. code-block:: python
+
+                from feijoa.exceptions import TrialPruned
+
+                def objective(experiment):
+                    for epoch in range(100):
+                        loss = train_epoch()
+                        experiment.report(epoch, loss)
+
+                        if experiment.should_prune():
+                            raise TrialPruned()
+
+                    return loss
+
+        Args:
+            step (int):
+                Step of evaluation (epoch, iteration, etc.)
+            value (float):
+                Intermediate objective value.
+
+        Returns:
+            None
+
+        """
+
+        if self.intermediate_values is None:
+            self.intermediate_values = dict()
+
+        self.intermediate_values[step] = value
+
+    def should_prune(self) -> bool:
+        """
+        Check if experiment should be pruned
+        according to job's pruner.
+
+        Returns:
+            ``True`` if objective should stop evaluation
+            and raise :class:`feijoa.exceptions.TrialPruned`.
+
+        """
+
+        return bool(self._pruning and self._pruning(self))
+
+    @property
+    def last_intermediate_value(self) -> Optional[float]:
+        """Intermediate value on the last reported step."""
+
+        if not self.intermediate_values:
+            return None
+
+        return self.intermediate_values[max(self.intermediate_values)]
+
     def set_error(self):
         """Set error state to experiment."""
 
@@ -130,17 +196,41 @@ class Experiment(BaseModel):
     def is_finished(self):
         """Check if experiment is finished."""
 
-        return self.state == ExperimentState.OK or self.state == ExperimentState.ERROR
+        return self.state in (
+            ExperimentState.OK,
+            ExperimentState.ERROR,
+            ExperimentState.PRUNED,
+        )
+
+    @property
+    def budget(self):
+        """
+        Evaluation budget of experiment.
+
+        Multi-fidelity oracles (e.g. `hyperband`) attach
+        budget to configurations, objective should read it
+        and evaluate configuration with given budget
+        (epochs, iterations, input size, etc.).
+
+        Returns:
+            Budget or None if configuration has no budget.
+
+        """
+
+        return getattr(self.params, "budget", None)
+
+    @property
+    def params_hash(self) -> str:
+        """Canonical hash of experiment's configuration."""
+
+        return fingerprint(self.params, self.budget)
 
     def _calculate_hash(self):
         """Calculate hash."""
 
-        params_dumped = json.dumps(self.params, sort_keys=True)
-
-        curve1 = hashlib.sha1(params_dumped.encode())
         curve2 = hashlib.sha1(str(self.objective_result).encode())
 
-        hd1 = curve1.hexdigest()
+        hd1 = self.params_hash
         hd2 = curve2.hexdigest()
 
         return hd1 + hd2
@@ -164,6 +254,11 @@ class Experiment(BaseModel):
 
         self._finish(ExperimentState.ERROR)
 
+    def prune_finish(self):
+        """Finish experiment with pruned state."""
+
+        self._finish(ExperimentState.PRUNED)
+
     def __repr__(self):
         return f"Experiment({json.dumps(self.dict(), indent=4)})"
 
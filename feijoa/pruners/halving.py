@@ -0,0 +1,84 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Successive halving pruner module."""
+
+from typing import List
+
+from feijoa.pruners.pruner import Pruner
+
+__all__ = ["SuccessiveHalvingPruner"]
+
+
+class SuccessiveHalvingPruner(Pruner):
+    """
+    Pruner with successive halving thresholds.
+
+    Rungs are placed at steps
+    ``min_resource * reduction_factor ** k``. On reaching
+    a rung experiment survives only if its value is in the
+    top ``1 / reduction_factor`` of values of finished
+    experiments at the rung.
+
+    See more: https://arxiv.org/abs/1810.05934
+
+    Args:
+        min_resource (int):
+            Step of the first rung.
+        reduction_factor (int):
+            Reduction factor of promotable experiments.
+        n_startup_trials (int):
+            See :class:`Pruner`.
+
+    Raises:
+        ValueError: If arguments are incorrect.
+
+    """
+
+    def __init__(self, min_resource=1, reduction_factor=4, n_startup_trials=1):
+        super().__init__(n_startup_trials, n_warmup_steps=min_resource)
+
+        if min_resource < 1 or reduction_factor < 2:
+            raise ValueError(
+                "`min_resource` must be >= 1 and `reduction_factor` must be >= 2."
+            )
+
+        self.min_resource = min_resource
+        self.reduction_factor = reduction_factor
+
+    def is_rung(self, step: int) -> bool:
+        """Check if step is a rung."""
+
+        rung = self.min_resource
+
+        while rung < step:
+            rung *= self.reduction_factor
+
+        return rung == step
+
+    def prune(self, step: int, value: float, others: List[float]) -> bool:
+        if not self.is_rung(step):
+            return False
+
+        values = sorted(others + [value])
+        n_promotable = max(1, len(values) // self.reduction_factor)
+
+        return value > values[n_promotable - 1]
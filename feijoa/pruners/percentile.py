@@ -0,0 +1,90 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Percentile pruners module."""
+
+from typing import List
+
+import numpy as np
+
+from feijoa.pruners.pruner import Pruner
+
+__all__ = ["PercentilePruner", "MedianPruner"]
+
+
+class PercentilePruner(Pruner):
+    """
+    Pruner to keep the specified percentile
+    of the experiments.
+
+    Prunes experiment if its intermediate value
+    is worse than the given percentile of values
+    of finished experiments at the same step.
+
+    Args:
+        percentile (float):
+            Percentile in range [0, 100]. Lower value
+            means more aggressive pruning.
+        n_startup_trials (int):
+            See :class:`Pruner`.
+        n_warmup_steps (int):
+            See :class:`Pruner`.
+
+    Raises:
+        ValueError: If percentile isn't in range [0, 100].
+
+    """
+
+    def __init__(self, percentile: float, n_startup_trials=5, n_warmup_steps=0):
+        super().__init__(n_startup_trials, n_warmup_steps)
+
+        if not 0.0 <= percentile <= 100.0:
+            raise ValueError("Percentile must be in range [0, 100].")
+
+        self.percentile = percentile
+
+    def prune(self, step: int, value: float, others: List[float]) -> bool:
+        finite = [v for v in others if np.isfinite(v)]
+
+        if not finite:
+            return False
+
+        return bool(value > np.percentile(finite, self.percentile))
+
+
+class MedianPruner(PercentilePruner):
+    """
+    Pruner using the median stopping rule.
+
+    Prunes experiment if its intermediate value is
+    worse than the median of values of finished
+    experiments at the same step.
+
+    Args:
+        n_startup_trials (int):
+            See :class:`Pruner`.
+        n_warmup_steps (int):
+            See :class:`Pruner`.
+
+    """
+
+    def __init__(self, n_startup_trials=5, n_warmup_steps=0):
+        super().__init__(50.0, n_startup_trials, n_warmup_steps)
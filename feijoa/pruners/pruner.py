@@ -0,0 +1,161 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Base pruner's class module."""
+
+import abc
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Iterable, List
+
+from feijoa.models import Experiment
+from feijoa.models.experiment import ExperimentState
+
+__all__ = ["Pruner", "IntermediateHistory"]
+
+
+class IntermediateHistory:
+    """
+    Intermediate values of finished experiments
+    in the job grouped by step.
+
+    Filled in main thread on experiment finish and
+    read from workers, so access is guarded by lock.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: DefaultDict[int, List[float]] = defaultdict(list)
+
+    def add(self, experiment: Experiment):
+        """Add intermediate values of finished experiment."""
+
+        if not experiment.intermediate_values:
+            return
+
+        with self._lock:
+            for step, value in experiment.intermediate_values.items():
+                self._values[step].append(value)
+
+    def extend(self, experiments: Iterable[Experiment]):
+        """Add intermediate values of finished experiments."""
+
+        for experiment in experiments:
+            self.add(experiment)
+
+    def at(self, step: int) -> List[float]:
+        """Get values of all finished experiments on step."""
+
+        with self._lock:
+            return list(self._values.get(step, []))
+
+    def __getstate__(self):
+        with self._lock:
+            return {"_values": dict(self._values)}
+
+    def __setstate__(self, state):
+        self._lock = threading.Lock()
+        self._values = defaultdict(list, state["_values"])
+
+
+class Pruner(metaclass=abc.ABCMeta):
+    """
+    Base pruner's class.
+
+    Pruner decides whether an experiment, which reported
+    intermediate value, should be stopped. The decision
+    is made by comparison with values of other finished
+    experiments of the same job at the same step.
+
+    Args:
+        n_startup_trials (int):
+            Pruning is disabled until the given number
+            of experiments have values at the step.
+        n_warmup_steps (int):
+            Pruning is disabled until the experiment
+            exceeds the given number of steps.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(self, n_startup_trials: int = 5, n_warmup_steps: int = 0):
+        self.n_startup_trials = n_startup_trials
+        self.n_warmup_steps = n_warmup_steps
+
+    def should_prune(self, experiment: Experiment, history: IntermediateHistory):
+        """
+        Check if experiment should be pruned.
+
+        Args:
+            experiment (Experiment):
+                Running experiment.
+            history (IntermediateHistory):
+                Intermediate values of finished experiments.
+
+        Returns:
+            ``True`` if experiment should be pruned.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        if experiment.state != ExperimentState.WIP:
+            return False
+
+        if not experiment.intermediate_values:
+            return False
+
+        step = max(experiment.intermediate_values)
+        value = experiment.intermediate_values[step]
+
+        if step < self.n_warmup_steps:
+            return False
+
+        others = history.at(step)
+
+        if len(others) < self.n_startup_trials:
+            return False
+
+        return self.prune(step, value, others)
+
+    @abc.abstractmethod
+    def prune(self, step: int, value: float, others: List[float]) -> bool:
+        """
+        Make prune decision.
+
+        Args:
+            step (int):
+                Last reported step.
+            value (float):
+                Value on last reported step.
+            others (List[float]):
+                Values of finished experiments on the step.
+
+        Returns:
+            ``True`` if experiment should be pruned.
+
+        """
+
+        raise NotImplementedError()
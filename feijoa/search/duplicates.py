@@ -0,0 +1,227 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Index of proposed configurations module."""
+
+import logging
+import random
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from feijoa.models.configuration import Configuration, fingerprint
+from feijoa.search.visitors import Perturber
+
+__all__ = ["ProposalIndex"]
+
+log = logging.getLogger(__name__)
+
+
+def _key(config) -> str:
+    """Canonical hash of configuration with its budget."""
+
+    return fingerprint(config, getattr(config, "budget", None))
+
+
+class ProposalIndex:
+    """
+    Hash index over proposed and evaluated configurations of job.
+
+    Job consults it to drop configurations, which were already
+    proposed (in the same batch or earlier), before they reach
+    workers, oracles may consult it to skip such candidates
+    (see :meth:`Oracle.set_proposal_index`). Configurations
+    with different budgets are different proposals.
+
+    Counts of proposed and duplicate configurations are
+    kept per requestor (oracle), see :attr:`rates`.
+
+    Args:
+        search_space (SearchSpace):
+            Search space instance.
+        max_attempts (int):
+            Count of attempts to find unseen neighbour.
+        scale (float):
+            Scale of neighbour perturbation relative
+            to parameter's range.
+        seed (int):
+            Random seed.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(
+        self,
+        search_space,
+        max_attempts: int = 20,
+        scale: float = 0.1,
+        seed: int = 0,
+    ):
+        self.search_space = search_space
+        self.max_attempts = max_attempts
+        self.scale = scale
+
+        self.hashes: set = set()
+
+        self.proposed: Counter = Counter()
+        self.duplicates: Counter = Counter()
+        # count of duplicates replaced with neighbours
+        self.neighbours = 0
+
+        self._perturber = Perturber(scale, seed)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_lock")
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __contains__(self, config) -> bool:
+        return _key(config) in self.hashes
+
+    def add(self, configs: Iterable[dict]):
+        """
+        Add configurations (e.g. of loaded experiments) to index.
+
+        Args:
+            configs (Iterable[dict]):
+                Configurations.
+
+        Returns:
+            None
+
+        """
+
+        with self._lock:
+            self.hashes.update(_key(config) for config in configs)
+
+    def filter(
+        self, configs: List[Configuration]
+    ) -> Tuple[List[Configuration], List[Configuration]]:
+        """
+        Split configurations into unseen and duplicate ones.
+        Unseen configurations are added to index.
+
+        Args:
+            configs (List[Configuration]):
+                Proposed configurations.
+
+        Returns:
+            Pair of unseen and duplicate configurations.
+
+        """
+
+        accepted, rejected = [], []
+
+        with self._lock:
+            for config in configs:
+                key = _key(config)
+                requestor = getattr(config, "requestor", "UNKNOWN")
+
+                self.proposed[requestor] += 1
+
+                if key in self.hashes:
+                    self.duplicates[requestor] += 1
+                    rejected.append(config)
+                else:
+                    self.hashes.add(key)
+                    accepted.append(config)
+
+        if rejected:
+            log.debug(f"{len(rejected)} configurations are already proposed.")
+
+        return accepted, rejected
+
+    def neighbour(self, config: Configuration) -> Optional[Configuration]:
+        """
+        Find unseen random neighbour of configuration and add it to index.
+
+        The number of perturbed parameters and scale of
+        perturbation grow with attempts.
+        Neighbour keeps requestor, budget and token of configuration,
+        so its result is told to oracle instead of configuration's one.
+
+        Args:
+            config (Configuration):
+                Duplicate configuration.
+
+        Returns:
+            Neighbour or None if all attempts give known
+            configurations (search space is nearly exhausted).
+
+        """
+
+        parameters = list(self.search_space)
+
+        with self._lock:
+            self._perturber.config = config
+
+            for attempt in range(self.max_attempts):
+                k = min(len(parameters), 1 + attempt // 3)
+                self._perturber.scale = self.scale * 2 ** (attempt // 3)
+
+                params = dict(config)
+
+                for p in self._random.sample(parameters, k):
+                    params[p.name] = p.accept(self._perturber)
+
+                candidate = Configuration(
+                    params,
+                    requestor=getattr(config, "requestor", "UNKNOWN"),
+                    request_id=getattr(config, "request_id", 0),
+                    budget=getattr(config, "budget", None),
+                    token=getattr(config, "token", None),
+                )
+                key = _key(candidate)
+
+                if key not in self.hashes:
+                    self.hashes.add(key)
+                    self.neighbours += 1
+
+                    return candidate
+
+        return None
+
+    @property
+    def rates(self) -> Dict[str, float]:
+        """Fraction of duplicate configurations per requestor (oracle)."""
+
+        with self._lock:
+            return {
+                requestor: self.duplicates[requestor] / count
+                for requestor, count in self.proposed.items()
+            }
+
+    def __repr__(self):
+        return (
+            f"ProposalIndex(size={len(self.hashes)}, "
+            f"duplicates={sum(self.duplicates.values())}"
+            f"/{sum(self.proposed.values())}, "
+            f"neighbours={self.neighbours})"
+        )
@@ -0,0 +1,244 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Failure regions model module."""
+
+import logging
+import random
+import threading
+from typing import List, Optional, Sequence
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from feijoa.models.configuration import Configuration
+from feijoa.utils.transformers import inverse_transform
+
+__all__ = ["FailureModel"]
+
+log = logging.getLogger(__name__)
+
+
+class FailureModel:
+    """
+        Classifier of failure regions of search space.
+
+        Is trained on failed (non-finite result, e.g. configuration
+        isn't compiled or crashed) versus successful configurations.
+        Oracles consult it to drop candidates, which are likely to
+        fail, before they are emitted (see :meth:`Oracle.set_failure_model`).
+        Model is refitted lazily: when count of failures changes
+    or every ``refit_every`` new results.
+
+        Candidates are rejected if probability of failure is
+        not less than ``threshold``. A small fraction (``explore``)
+        of rejected candidates is still emitted, so wrong
+        predictions are corrected.
+
+        Args:
+            search_space (SearchSpace):
+                Search space instance.
+            threshold (float):
+                Probability of failure to reject candidate.
+            explore (float):
+                Probability to emit rejected candidate.
+            min_failures (int):
+                Count of failures to start predictions
+                (at least one success is also required).
+            refit_every (int):
+                Count of new results to refit model, if
+                count of failures is the same.
+            seed (int):
+                Random seed.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+    """
+
+    def __init__(
+        self,
+        search_space,
+        threshold: float = 0.5,
+        explore: float = 0.05,
+        min_failures: int = 3,
+        refit_every: int = 10,
+        seed: int = 0,
+    ):
+        self.search_space = search_space
+        self.threshold = threshold
+        self.explore = explore
+        self.min_failures = min_failures
+        self.refit_every = refit_every
+
+        self.X: List[np.ndarray] = []
+        self.failed: List[bool] = []
+        self.n_failed = 0
+
+        # count of rejected candidates and expected
+        # count of failed evaluations they would give
+        self.rejected = 0
+        self.avoided = 0.0
+
+        self.classifier: Optional[RandomForestClassifier] = None
+        # (count of results, count of failures) of the last fit
+        self._fitted_on = (0, 0)
+        self._random = random.Random(seed)
+        self._seed = seed
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_lock")
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, configs: List[Configuration], results: Sequence[Optional[float]]):
+        """
+        Add results to training data.
+
+        Args:
+            configs (List[Configuration]):
+                Configurations.
+            results (Sequence[float | None]):
+                Their objective results, missing and
+                non-finite results are failures.
+
+        Returns:
+            None
+
+        """
+
+        with self._lock:
+            for config, result in zip(configs, results):
+                failed = result is None or not np.isfinite(result)
+
+                self.X.append(inverse_transform(config, self.search_space))
+                self.failed.append(failed)
+                self.n_failed += failed
+
+    @property
+    def ready(self) -> bool:
+        """Model has enough failures and successes to predict."""
+
+        return self.min_failures <= self.n_failed < len(self.failed)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict probability of failure.
+
+        Args:
+            X (np.ndarray):
+                Candidates vectors (see
+                :func:`feijoa.utils.transformers.inverse_transform`).
+
+        Returns:
+            Probabilities of failure, zeros if
+            model isn't ready yet.
+
+        """
+
+        with self._lock:
+            if not self.ready:
+                return np.zeros(len(X))
+
+            n_results, n_failed = self._fitted_on
+
+            if (
+                self.classifier is None
+                or n_failed != self.n_failed
+                or len(self.failed) - n_results >= self.refit_every
+            ):
+                self.classifier = RandomForestClassifier(
+                    n_estimators=50, random_state=self._seed
+                )
+                self.classifier.fit(np.array(self.X), np.array(self.failed))
+                self._fitted_on = (len(self.failed), self.n_failed)
+
+            classifier = self.classifier
+
+        return classifier.predict_proba(np.asarray(X))[:, 1]
+
+    def risky(self, X: np.ndarray) -> np.ndarray:
+        """
+        Get mask of candidates, which are likely to fail.
+
+        Args:
+            X (np.ndarray):
+                Candidates vectors.
+
+        Returns:
+            Boolean mask.
+
+        """
+
+        return self.predict(X) >= self.threshold
+
+    def account(self, probabilities):
+        """Account rejected candidates with their failure probabilities."""
+
+        with self._lock:
+            self.rejected += len(probabilities)
+            self.avoided += float(np.sum(probabilities))
+
+    def filter(self, configs: List[Configuration]) -> List[Configuration]:
+        """
+        Drop configurations, which are likely to fail.
+
+        Args:
+            configs (List[Configuration]):
+                Candidate configurations.
+
+        Returns:
+            Configurations to emit.
+
+        """
+
+        if not configs or not self.ready:
+            return configs
+
+        probabilities = self.predict(
+            np.array([inverse_transform(c, self.search_space) for c in configs])
+        )
+
+        kept, rejected = [], []
+
+        for config, p in zip(configs, probabilities):
+            if p < self.threshold or self._random.random() < self.explore:
+                kept.append(config)
+            else:
+                rejected.append(p)
+
+        if rejected:
+            self.account(rejected)
+            log.debug(f"{len(rejected)} configurations are likely to fail.")
+
+        return kept
+
+    def __repr__(self):
+        return (
+            f"FailureModel(failures={self.n_failed}/{len(self.failed)}, "
+            f"rejected={self.rejected}, avoided={self.avoided:.1f})"
+        )
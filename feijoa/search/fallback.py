@@ -0,0 +1,180 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Fallback proposals for missed ask deadlines module."""
+
+import logging
+import math
+import random
+from typing import List, Optional
+
+from feijoa.models.configuration import Configuration
+from feijoa.search.visitors import Perturber, Randomizer, UnitMapper
+
+__all__ = ["Fallback", "FALLBACKS"]
+
+log = logging.getLogger(__name__)
+
+FALLBACKS = ("random", "quasirandom", "mutation")
+
+
+def _recurrence(dimensions: int) -> List[float]:
+    """
+    Steps of additive recurrence with generalized golden ratio
+    (root of x^(d+1) = x + 1), which gives low-discrepancy
+    sequence for any count of dimensions.
+    """
+
+    phi = 2.0
+
+    for _ in range(30):
+        phi = (1 + phi) ** (1 / (dimensions + 1))
+
+    return [(1 / phi) ** (i + 1) % 1 for i in range(dimensions)]
+
+
+class Fallback:
+    """
+    Cheap proposals, which meta-oracle serves when oracle
+    doesn't produce configurations before ask deadline
+    (see :meth:`MetaOracle.set_ask_deadline`).
+
+    Kinds:
+
+        random:
+            Uniform random configurations.
+        quasirandom:
+            Low-discrepancy sequence (additive recurrence), so
+            fallback proposals cover search space evenly.
+        mutation:
+            Random neighbours of incumbent (the best told
+            configuration), random configurations until
+            anything is told.
+
+    Args:
+        search_space (SearchSpace):
+            Search space instance.
+        kind (str):
+            One of `random`, `quasirandom`, `mutation`.
+        scale (float):
+            Scale of mutation relative to parameter's range.
+        seed (int):
+            Random seed.
+
+    Raises:
+        ValueError: If unknown kind passed.
+
+    """
+
+    name = "Fallback"
+
+    def __init__(self, search_space, kind="random", scale=0.1, seed=0):
+        if kind not in FALLBACKS:
+            raise ValueError(
+                f"Unknown fallback `{kind}`. Available: {', '.join(FALLBACKS)}."
+            )
+
+        self.search_space = search_space
+        self.kind = kind
+
+        self.incumbent: Optional[Configuration] = None
+        self.best_result = float("+inf")
+        # count of served configurations
+        self.served = 0
+
+        self._randomizer = Randomizer(seed)
+        self._perturber = Perturber(scale, seed)
+        self._mapper = UnitMapper()
+        self._random = random.Random(seed)
+        self._steps = _recurrence(len(list(search_space)))
+        self._shift = [self._random.random() for _ in self._steps]
+        # index of the next point of sequence
+        self._index = 0
+
+    def ask(self, n: int = 1) -> List[Configuration]:
+        """
+        Get configurations.
+
+        Args:
+            n (int):
+                Count of configurations.
+
+        Returns:
+            List of configurations.
+
+        """
+
+        configs = [
+            Configuration(self._propose(), requestor=self.name)
+            for _ in range(max(1, n))
+        ]
+        self.served += len(configs)
+
+        return configs
+
+    def tell_many(self, configs, results):
+        """
+        Track incumbent for mutations.
+
+        Args:
+            configs (List[Configuration]):
+                Configuration instances.
+            results (List[float]):
+                Objective results for configurations.
+
+        Returns:
+            None
+
+        """
+
+        for config, result in zip(configs, results):
+            if math.isfinite(result) and result < self.best_result:
+                self.best_result = result
+                self.incumbent = config
+
+    def _propose(self) -> dict:
+        """Make one configuration of fallback's kind."""
+
+        parameters = list(self.search_space)
+
+        if self.kind == "quasirandom":
+            self._mapper.point = {
+                p.name: (shift + step * self._index) % 1
+                for p, shift, step in zip(parameters, self._shift, self._steps)
+            }
+            self._index += 1
+
+            return {p.name: p.accept(self._mapper) for p in parameters}
+
+        if self.kind == "mutation" and self.incumbent is not None:
+            params = dict(self.incumbent)
+            self._perturber.config = params
+            k = self._random.randint(1, len(parameters))
+
+            for p in self._random.sample(parameters, k):
+                params[p.name] = p.accept(self._perturber)
+
+            return params
+
+        return {p.name: p.accept(self._randomizer) for p in parameters}
+
+    def __repr__(self):
+        return f"Fallback(kind={self.kind}, served={self.served})"
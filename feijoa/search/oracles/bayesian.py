@@ -23,7 +23,7 @@
 
 import inspect
 import logging
-from typing import Generator, List, Optional
+from typing import List, Optional
 
 import numpy as np
 from scipy.stats import norm
@@ -33,8 +33,8 @@ from scipy.stats import norm
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.gaussian_process import GaussianProcessRegressor
 
-from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.models.configuration import Configuration, fingerprint
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.search.visitors import Randomizer
 from feijoa.utils.transformers import inverse_transform, transform
 
@@ -181,8 +181,10 @@ class Bayesian(Oracle):
             methods. For example, you
             can use regressor from sklearn package
             (https://scikit-learn.org/)
-        n_warmup (int):
-            Warmup points count.
+        n_warmup (int | None):
+            Warmup points count. By default, it's scaled to
+            count of workers (but not less than ``min_warmup``),
+            so the first batch keeps all workers busy.
 
     .. note::
         `lfbopi` and `lfboei` taked from publication:
@@ -201,6 +203,8 @@ class Bayesian(Oracle):
         "bayes",
     )
 
+    min_warmup = 5
+
     def __init__(
         self,
         search_space,
@@ -208,7 +212,7 @@ class Bayesian(Oracle):
         acq="ei",
         seed=0,
         regr="GaussianProcessRegressor",
-        n_warmup=5,
+        n_warmup=None,
         plugins=None,
         **kwargs,
     ):
@@ -258,55 +262,172 @@ class Bayesian(Oracle):
 
         # warmup points
         self.n_warmup = n_warmup
+        self.n_workers: Optional[int] = None
 
         # setup readable name
         self._name = f"Bayesian<{type(self.model).__name__}({self.acq_function})>"
 
         self._ask_gen = None
+        self._warmed_up = False
 
-    def ask(self, n: int = 1) -> Optional[List[Configuration]]:
-        # TODO (qnbhd): add test case on configurations
-        #  per emit count
+        # asked, but not told configurations
+        self.pending: List[Configuration] = []
+
+    def set_workers(self, n_workers: int):
+        """
+        Scale default warmup to count of workers
+        and emit warmup in chunks of requested size.
+        """
+
+        self.n_workers = n_workers
 
-        if not self._ask_gen:
-            # build ask generator
-            self._ask_gen = self._ask(n)
+    @property
+    def warmup_size(self) -> int:
+        """Count of warmup points."""
 
-        return next(self._ask_gen)
+        if self.n_warmup is not None:
+            return self.n_warmup
 
-    def _ask(self, n: int) -> Generator:
+        return max(self.min_warmup, self.n_workers or 1)
+
+    def ask(self, n: int = 1) -> Optional[List[Configuration]]:
+        return self._resume(n)
+
+    def _ask(self, n: int) -> AskGenerator:
         """Main ask generator."""
 
         # make some warmup configurations
+        # (generator is restarted after snapshot restore)
 
         randomizer = Randomizer(self.seed)
-        random_samples = [
-            Configuration(
-                {p.name: p.accept(randomizer) for p in self.search_space},
-                requestor=self.name,
-            )
-            for _ in range(self.n_warmup)
-        ]
 
-        yield random_samples
+        def sample(count):
+            return [
+                Configuration(
+                    {p.name: p.accept(randomizer) for p in self.search_space},
+                    requestor=self.name,
+                )
+                for _ in range(count)
+            ]
+
+        if not self._warmed_up:
+            self._warmed_up = True
 
-        self.model.fit(self.X, self.y)
+            # primed (or already told) results replace warmup
+            n_warmup = self.warmup_size - int(np.isfinite(self.y).sum())
+
+            if n_warmup > 0 and self.n_workers is None:
+                # no scheduler sized the asks,
+                # the whole warmup is the first batch
+                n = yield sample(n_warmup)
+            elif n_warmup > 0:
+                n = yield from self._chunks(sample(n_warmup), n)
 
         while True:
-            x = self.opt_acquisition(n)
-            configurations = list()
-            for c in x:
-                configurations.append(
-                    Configuration(
-                        transform(c, self.search_space),
-                        requestor=self.name,
-                    )
+            if not np.isfinite(self.y).any():
+                # warmup results are late (asks are not waiting
+                # for results), nothing to fit model on yet
+                n = yield sample(n)
+                continue
+
+            self._fit()
+
+            x = self.opt_acquisition(n, n_candidates=max(10 * n, 100))
+            n = yield self._unique(x, n)
+
+    def _unique(self, candidates, n: int) -> List[Configuration]:
+        """
+        Transform the best candidates to n distinct configurations.
+
+        Candidates, which round to the same configuration
+        (integer and categorical parameters) or to already
+        proposed one (see :meth:`set_proposal_index`), are skipped.
+
+        """
+
+        index = self.proposal_index
+        configurations: List[Configuration] = []
+        seen = set()
+
+        for c in candidates:
+            config = Configuration(transform(c, self.search_space), requestor=self.name)
+            key = fingerprint(config)
+
+            if key in seen or (index is not None and config in index):
+                continue
+
+            seen.add(key)
+            configurations.append(config)
+
+            if len(configurations) == n:
+                break
+
+        if not configurations:
+            # everything is proposed, job replaces
+            # the best candidate with its neighbour
+            configurations.append(
+                Configuration(
+                    transform(candidates[0], self.search_space), requestor=self.name
                 )
-            yield configurations
-            self.model.fit(self.X, self.y)
+            )
+
+        return configurations
+
+    def _fit(self):
+        """
+        Fit model on told results and fantasized
+        results of pending configurations.
+
+        Pending configurations get the mean of told
+        results (constant liar), so acquisition isn't
+        maximized again near points in evaluation.
+
+        """
+
+        X, y = self._finite()
+
+        if self.pending and len(y):
+            fantasies = np.array(
+                [
+                    inverse_transform(config, self.search_space)
+                    for config in self.pending
+                ]
+            )
+            liar = np.mean(y)
+
+            X = np.concatenate([X, fantasies])  # pragma: no mutate
+            y = np.concatenate([y, np.full(len(fantasies), liar)])
+
+        self.model.fit(X, y)
 
-    def opt_acquisition(self, n: int):
-        """Optimize acquisition function."""
+    def _finite(self):
+        """
+        Get told points with finite results. Failed configurations
+        can't be regressed, failure regions are learned
+        by failure model.
+        """
+
+        finite = np.isfinite(self.y)
+
+        return self.X[finite], self.y[finite]
+
+    def opt_acquisition(self, n: int, n_candidates: Optional[int] = None):
+        """
+        Optimize acquisition function.
+
+        Args:
+            n (int):
+                Count of configurations to propose.
+            n_candidates (int | None):
+                Count of the best candidates to return
+                (at least n), so the caller can skip some.
+
+        Returns:
+            Candidates vectors ordered from the best.
+
+        """
+
+        n_candidates = max(n, n_candidates or n)
 
         n_samples = 100000
 
@@ -316,24 +437,52 @@ class Bayesian(Oracle):
             size=(n_samples, self.bounds.shape[0]),
         )
 
+        X, y = self._finite()
+
         scores = acquisition(
             self.model,
             self.acq_function,
             X_samples,
-            self.X,
-            self.y,
+            X,
+            y,
             random_state=self.seed,
         )
 
         assert len(scores) == n_samples
 
-        minima_x = X_samples[scores.argsort()[:n]]
+        order = scores.argsort()
+
+        model = self.failure_model
+
+        if model is not None and model.ready:
+            # the best candidates, which are likely to fail,
+            # are replaced with the next safe ones
+            k = max(10 * n_candidates, 100)
+
+            while True:
+                top = order[:k]
+                probabilities = model.predict(X_samples[top])
+                risky = probabilities >= model.threshold
+
+                if (~risky).sum() >= n_candidates or k >= len(order):
+                    break
+
+                k *= 10
+
+            model.account(probabilities[:n][risky[:n]])
+
+            order = np.concatenate([top[~risky], top[risky]])
+
+        minima_x = X_samples[order[:n_candidates]]
 
         return minima_x
 
     def tell(self, config, result):
         """Tell configuration's result."""
 
+        if not self._accept(config):
+            return
+
         vec = np.array(inverse_transform(config, self.search_space))
 
         self.X = np.concatenate([self.X, vec.reshape(1, -1)])  # pragma: no mutate
@@ -342,6 +491,45 @@ class Bayesian(Oracle):
         if len(self.y) > 5:  # pragma: no mutate
             self.notify("on_tell", config, result)
 
+    def tell_many(self, configs, results):
+        """Tell results of batch with one training data update."""
+
+        configs, results = self._accept_many(configs, results)
+
+        if not configs:
+            return
+
+        vecs = np.array(
+            [inverse_transform(config, self.search_space) for config in configs]
+        )
+
+        n_told = len(self.y)
+
+        self.X = np.concatenate([self.X, vecs])  # pragma: no mutate
+        self.y = np.concatenate([self.y, results])
+
+        for i, (config, result) in enumerate(zip(configs, results)):
+            if n_told + i + 1 > 5:  # pragma: no mutate
+                self.notify("on_tell", config, result)
+
+    def prime(self, configs, results):
+        """Add historical results to training data of model."""
+
+        if not configs:
+            return
+
+        vecs = np.array(
+            [inverse_transform(config, self.search_space) for config in configs]
+        )
+
+        self.X = np.concatenate([self.X, vecs])  # pragma: no mutate
+        self.y = np.concatenate([self.y, results])
+
+    def set_pending(self, configs):
+        """Remember pending configurations for fantasized fit."""
+
+        self.pending = list(configs)
+
     def update(self, event, subject, *args, **kwargs):
         log.info(
             f"Event: {event}," f"Subject: {subject}" f"Args: {args}" f"Kwargs: {kwargs}"
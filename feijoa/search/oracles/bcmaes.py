@@ -1,16 +1,18 @@
 import logging
 import math
 import sys
-from typing import Generator, List, Optional, Tuple
+from typing import Dict, Generator, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
 from scipy.stats import multivariate_normal
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.utils.transformers import transform
 
+log = logging.getLogger(__name__)
+
 
 # noinspection PyAbstractClass,SpellCheckingInspection,PyPep8Naming
 class BCMAES(Oracle):
@@ -50,38 +52,61 @@ class BCMAES(Oracle):
         self.step = 0
 
         self.variance = np.ones([self.n, self.n])
-        self.results = []
+
+        # request token -> told result
+        self.results: Dict[str, float] = dict()
+        # tokens of requests without result
+        self._requested: Set[str] = set()
+
+        # extra samples of generation, while results are late
+        self.max_extra_samples = 3 * self.n
 
         self._ask_gen = None
 
-    def ask(self, n: int = 1) -> Optional[List[Configuration]]:
-        # TODO (qnbhd): add test case on configurations
-        #  per emit count
+    @property
+    def preferred_batch_size(self) -> int:  # type: ignore
+        """Samples count of generation."""
 
-        if not self._ask_gen:
-            # build ask generator
-            self._ask_gen = self._ask(n)
+        return self.n
 
-        return next(self._ask_gen)
+    def ask(self, n: int = 1) -> Optional[List[Configuration]]:
+        return self._resume(n)
 
-    # noinspection PyUnusedLocal
-    def _ask(self, W: int) -> Generator:
+    def _ask(self, W: int) -> AskGenerator:
         while True:
             # while np.linalg.norm(self.variance) > self.tol:
             E_mu = self.mu0
             E_sigma = self.psi / (self.v0 - self.n - 1)
             self.step += 1
 
-            # FIXME (qnbhd): ValueError: mean and cov must have same length
-            sample_X = np.random.multivariate_normal(
-                mean=E_mu, cov=E_sigma, size=(self.n,)
-            )
-            sample_X = np.clip(sample_X, self.bounds[:, 0], self.bounds[:, 1])
+            sample_X = self._sample(E_mu, E_sigma, self.n)
+            configs = self.make_configs(sample_X)
+
+            W = yield from self._chunks(list(configs), W)
 
-            yield self.make_configs(sample_X)
+            # results may be late, keep workers busy with extra
+            # samples of the same generation until enough are told
+            while (
+                sum(c.token in self.results for c in configs) < self.n
+                and len(configs) < self.n + self.max_extra_samples
+            ):
+                extra_X = self._sample(E_mu, E_sigma, max(1, W))
+                extra = self.make_configs(extra_X)
 
-            # TODO (qnbhd): FIX
-            g_x = self.results.pop()
+                sample_X = np.concatenate([sample_X, extra_X])
+                configs.extend(extra)
+
+                W = yield extra
+
+            results = self._collect(configs)
+            told = [i for i, result in enumerate(results) if result is not None]
+
+            if len(told) < 2:
+                log.debug(f"Results of generation are not told to {self.name}.")
+                continue
+
+            sample_X = sample_X[told]
+            g_x = np.array([results[i] for i in told])
 
             df = pd.DataFrame(sample_X)
             df["g_x"] = g_x
@@ -113,10 +138,7 @@ class BCMAES(Oracle):
 
             variance_norm = np.linalg.norm(self.variance)
 
-            # TODO (qnbhd): FIX
-            yield self.make_configs([mean])
-
-            fx_star = self.results.pop()
+            fx_star = yield from self._measure(mean)
 
             if fx_star < self.fx_star_min:
                 # if self.fx_star_min - fx_star < 1e-5:
@@ -129,15 +151,10 @@ class BCMAES(Oracle):
                     self.var_star_min = self.variance
                 self.list_x_star.append(mean)
 
-                yield self.make_configs([mean])
-
-                # TODO (qnbhd): FIX
-                self.list_fx_star.append(self.results.pop())
+                self.list_fx_star.append((yield from self._measure(mean)))
             else:
                 self.list_x_star.append(self.x_star_min)
-                # TODO (qnbhd): FIX
-                yield self.make_configs([self.x_star_min])
-                self.list_fx_star.append(self.results.pop())
+                self.list_fx_star.append((yield from self._measure(self.x_star_min)))
 
                 self.count += 1
 
@@ -166,13 +183,48 @@ class BCMAES(Oracle):
                 self.psi
                 + (self.k0 * self.n)
                 / (self.k0 + self.n)
-                * np.dot(np.mat(mean - self.mu0), np.mat(mean - self.mu0).T)
+                * np.dot(mean - self.mu0, mean - self.mu0)
                 + self.variance * (self.n - 1)
             )
             self.psi = self.psi * self.factor
 
+    def _sample(self, mean, cov, size):
+        """Sample points from distribution in bounds."""
+
+        # FIXME (qnbhd): ValueError: mean and cov must have same length
+        sample_X = np.random.multivariate_normal(mean=mean, cov=cov, size=(size,))
+
+        return np.clip(sample_X, self.bounds[:, 0], self.bounds[:, 1])
+
+    def _measure(self, x) -> Generator[List[Configuration], int, float]:
+        """Request one point, not told result is treated as failed."""
+
+        configs = self.make_configs([x])
+
+        yield configs
+
+        (result,) = self._collect(configs)
+
+        return float("+inf") if result is None else result
+
+    def _collect(self, configs) -> List[Optional[float]]:
+        """Take told results of requests, None for not told ones."""
+
+        results = [self.results.pop(c.token, None) for c in configs]
+        self._requested.difference_update(c.token for c in configs)
+
+        return results
+
     def tell(self, config, result):
-        self.results.append(result)
+        # results of other oracles, late
+        # and duplicated results are skipped
+        token = getattr(config, "token", None)
+
+        if token not in self._requested:
+            return
+
+        self._requested.discard(token)
+        self.results[token] = result
 
     def make_configs(self, sample):
         configurations = list()
@@ -184,4 +236,5 @@ class BCMAES(Oracle):
                     requestor=self.name,
                 )
             )
+        self._requested.update(c.token for c in configurations)
         return configurations
@@ -23,7 +23,7 @@
 
 import logging
 import time
-from typing import Generator, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -37,7 +37,7 @@ with ImportWrapper():
     from pymoo.algorithms.base.local import LocalSearch
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.utils.transformers import inverse_transform, transform
 
 de = LazyModuleImportProxy("pymoo.algorithms.soo.nonconvex.de")
@@ -120,17 +120,25 @@ class Genetic(Oracle):
 
         self.pop = None
 
+        # request token -> individual of current population
+        self._requests: Dict[str, Individual] = dict()
+
+    @property
+    def preferred_batch_size(self) -> int:  # type: ignore
+        """Population size."""
+
+        return self.algorithm.pop_size
+
+    @property
+    def max_batch_size(self) -> int:  # type: ignore
+        """Population size, one ask never gets more."""
+
+        return self.algorithm.pop_size
+
     def ask(self, n: int = 1) -> Optional[List[Configuration]]:
-        if not self._ask_gen:
-            self._ask_gen = self._ask(n)
-            log.debug(
-                "Parameter `n` does not affect on configuration's count,"
-                f" because {self.__class__.__name__} is can have variable pop size."
-            )
-        return next(self._ask_gen)
-
-    # noinspection PyUnusedLocal
-    def _ask(self, n: int) -> Generator:
+        return self._resume(n)
+
+    def _ask(self, n: int) -> AskGenerator:
         """Main ask generator for genetic oracles."""
 
         n_gen = 0
@@ -155,42 +163,83 @@ class Genetic(Oracle):
                 for i, solution in enumerate(X)
             ]
 
-            yield configs
+            self._requests = {
+                config.token: individual for config, individual in zip(configs, self.pop)
+            }
+
+            # population is emitted in chunks of requested size
+            n = yield from self._chunks(configs, n)
+
+            # results of the generation may be late (or never come),
+            # population is evaluated with known ones, late results
+            # are taken as experience
+            for individual in self._requests.values():
+                individual.F = np.array([float("+inf")])
+
+            self._requests = dict()
 
             self.algorithm.tell(infills=self.pop)
 
             n_gen += 1
 
     def tell(self, config, result):
+        self.tell_many([config], [result])
 
-        # take our results
+    def tell_many(self, configs, results):
+        """
+        Tell results of batch.
 
-        if config.requestor == self.name:
-            self.pop[config.request_id].F = np.array([result])
-            self.pool.append(self.pop[config.request_id])
+        Experience of other oracles restarts
+        algorithm at most once per batch.
+
+        """
+
+        configs, results = self._accept_many(configs, results)
+
+        foreign = []
+
+        for config, result in zip(configs, results):
+            # take our results
+
+            individual = self._requests.pop(getattr(config, "token", None), None)
+
+            if individual is not None:
+                individual.F = np.array([result])
+                self.pool.append(individual)
+                continue
+
+            # take experience from other oracles
+            # (and late results of previous generations)
+
+            x0 = Individual()
+            x0.X = inverse_transform(config, self.search_space)
+            x0.F = np.array([result])
+
+            foreign.append(x0)
+
+        if not foreign:
             return
 
-        # take experience from other oracles
+        best = min(foreign, key=lambda solution: solution.F).F
 
-        x0 = Individual()
+        if self.pool and best < min(self.pool, key=lambda solution: solution.F).F:
+            self._restart()
 
-        # cook our individual instance
-        x0.X = inverse_transform(config, self.search_space)
-        x0.F = np.array([result])
+        self.pool.extend(foreign)
 
-        if self.pool and result < min(self.pool, key=lambda solution: solution.F).F:
-            log.debug(f"Restarting {self.name}")
+    def _restart(self):
+        """Restart algorithm with the pool of known solutions."""
 
-            # take into account base class type
-            params = {"sampling": Population(individuals=np.array(self.pool))}
-            if issubclass(self.algorithm_cls, LocalSearch):
-                params = {"x0": Population(individuals=np.array(self.pool))}
+        log.debug(f"Restarting {self.name}")
 
-            # restart our oracle
-            self.algorithm = self.algorithm_cls(*self.args, **self.kwargs, **params)
-            self.algorithm.setup(self.problem, termination=self.termination)
+        # take into account base class type
+        params = {"sampling": Population(individuals=np.array(self.pool))}
+        if issubclass(self.algorithm_cls, LocalSearch):
+            params = {"x0": Population(individuals=np.array(self.pool))}
 
-        self.pool.append(x0)
+        # restart our oracle
+        self.algorithm = self.algorithm_cls(*self.args, **self.kwargs, **params)
+        self.algorithm.setup(self.problem, termination=self.termination)
 
 
 class DifferentialEvolution(Genetic):
@@ -23,12 +23,12 @@
 
 import logging
 from itertools import product
-from typing import Generator, List, Optional
+from typing import List, Optional
 
 import numpy
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.search.parameters import Categorical, Integer, ParametersVisitor, Real
 
 __all__ = ["Grid"]
@@ -105,11 +105,9 @@ class Grid(Oracle):
         self._ask_gen = None
 
     def ask(self, n: int = 1) -> Optional[List[Configuration]]:
-        if not self._ask_gen:
-            self._ask_gen = self._ask(n)
-        return next(self._ask_gen)
+        return self._resume(n)
 
-    def _ask(self, n: int) -> Generator:
+    def _ask(self, n: int) -> AskGenerator:
 
         while True:
             cfgs = []
@@ -124,10 +122,7 @@ class Grid(Oracle):
 
                 cfgs.append(Configuration(cfg, requestor=self.name))
 
-            if not cfgs:
-                yield None
-
-            yield cfgs
+            n = yield cfgs or None
 
     def tell(self, config, result):
         """No needed."""
@@ -0,0 +1,319 @@
+# MIT License
+#
+# Copyright (c) 2021-2022 Templin Konstantin
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Hyperband and BOHB multi-fidelity oracles module."""
+
+import bisect
+import logging
+import math
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from feijoa.models.configuration import Configuration
+from feijoa.search.oracles.bayesian import Bayesian
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
+from feijoa.search.visitors import Randomizer
+from feijoa.utils.transformers import inverse_transform, transform
+
+__all__ = ["Hyperband", "BOHB"]
+
+log = logging.getLogger(__name__)
+
+
+class Hyperband(Oracle):
+    """
+    Hyperband multi-fidelity oracle.
+
+    Configurations are evaluated with small budget first,
+    the best ``1 / eta`` part of each rung is promoted
+    to the next rung with ``eta`` times larger budget,
+    until ``max_budget`` is reached. New configurations are
+    distributed between brackets with different initial
+    budgets, which hedges against too aggressive early
+    stopping.
+
+    Promotions are made asynchronously (as in ASHA), so
+    oracle never waits for a full rung to be measured and
+    doesn't stall parallel workers.
+
+    Objective must read the budget from experiment:
+
+    .. code-block:: python
+
+        def objective(experiment):
+            epochs = experiment.budget
+            ...
+
+        job.do(objective, optimizer="ucb<hyperband[eta=3]>")
+
+    Args:
+        search_space (SearchSpace):
+            Search space instance.
+        min_budget (int | float):
+            Minimal budget of configuration.
+        max_budget (int | float):
+            Maximal budget of configuration.
+        eta (int):
+            Reduction factor of each rung.
+
+    Raises:
+        ValueError: If budgets or eta are not correct.
+
+    """
+
+    anchor = "hyperband"
+    aliases: Tuple[str, ...] = ("Hyperband", "hyperband", "hb")
+
+    def __init__(
+        self,
+        search_space,
+        *args,
+        min_budget=1,
+        max_budget=81,
+        eta=3,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+
+        if not 0 < min_budget < max_budget:
+            raise ValueError("Budgets must satisfy 0 < min_budget < max_budget.")
+
+        if eta < 2:
+            raise ValueError("`eta` must be >= 2.")
+
+        self.search_space = search_space
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.eta = eta
+
+        self.s_max = int(math.floor(math.log(max_budget / min_budget, eta) + 1e-9))
+
+        self.randomizer = Randomizer(self.seed)
+
+        # request token -> (bracket, rung, configuration)
+        self._requests: Dict[str, Tuple[int, int, Configuration]] = dict()
+        # (bracket, rung) -> [(result, request id, request token), ...]
+        # sorted by result, so the best ones are promoted first
+        self._rungs: Dict[Tuple[int, int], List[Tuple[float, int, str]]] = defaultdict(
+            list
+        )
+        # request tokens, which were promoted to the next rung
+        self._promoted = set()
+
+        self._next_request_id = 0
+        self._next_bracket = 0
+
+        self._ask_gen = None
+
+    def budget(self, bracket: int, rung: int):
+        """
+        Get budget of rung in bracket.
+
+        Bracket ``s`` starts with budget
+        ``max_budget * eta ** -s`` and has ``s + 1`` rungs.
+
+        """
+
+        budget = self.max_budget * self.eta ** (rung - bracket)
+
+        if isinstance(self.min_budget, int) and isinstance(self.max_budget, int):
+            return max(self.min_budget, int(round(budget)))
+
+        return max(self.min_budget, budget)
+
+    def ask(self, n: int = 1) -> Optional[List[Configuration]]:
+        return self._resume(n)
+
+    def _ask(self, n: int) -> AskGenerator:
+        while True:
+            n = yield [self._promote() or self._start() for _ in range(n)]
+
+    def _make(self, params, bracket, rung) -> Configuration:
+        """Make configuration for rung and register request."""
+
+        config = Configuration(
+            params,
+            requestor=self.name,
+            request_id=self._next_request_id,
+            budget=self.budget(bracket, rung),
+        )
+
+        self._requests[config.token] = (bracket, rung, config)
+        self._next_request_id += 1
+
+        return config
+
+    def _promote(self) -> Optional[Configuration]:
+        """Promote the best configuration of top-most possible rung."""
+
+        for bracket in range(self.s_max, -1, -1):
+            for rung in range(bracket - 1, -1, -1):
+                results = self._rungs.get((bracket, rung))
+
+                if not results:
+                    continue
+
+                n_promotable = len(results) // self.eta
+
+                for _, request_id, token in results[:n_promotable]:
+                    if token in self._promoted:
+                        continue
+
+                    self._promoted.add(token)
+
+                    _, _, config = self._requests[token]
+
+                    log.debug(
+                        f"Promote #{request_id} from rung {rung}"
+                        f" to rung {rung + 1} of bracket {bracket}"
+                    )
+
+                    return self._make(dict(config), bracket, rung + 1)
+
+        return None
+
+    def _start(self) -> Configuration:
+        """Start new configuration in the next bracket."""
+
+        bracket = self.s_max - self._next_bracket % (self.s_max + 1)
+        self._next_bracket += 1
+
+        return self._make(self.sample(bracket), bracket, 0)
+
+    def sample(self, bracket: int) -> dict:
+        """Sample new configuration's params."""
+
+        return {p.name: p.accept(self.randomizer) for p in self.search_space}
+
+    def tell(self, config, result):
+        """Tell configuration's result."""
+
+        if getattr(config, "requestor", None) != self.name:
+            # configuration of other oracle in portfolio
+            return
+
+        request = self._requests.get(getattr(config, "token", None))
+
+        if request is None or not self._accept(config):
+            # e.g. configuration of other worker of job
+            # or duplicated tell
+            return
+
+        bracket, rung, requested = request
+
+        if not np.isfinite(result):
+            result = float("+inf")
+
+        bisect.insort(
+            self._rungs[(bracket, rung)],
+            (result, requested.request_id, requested.token),
+        )
+
+        self.observe(requested, result)
+
+    def observe(self, config, result):
+        """Hook for measured configuration."""
+
+
+class BOHB(Hyperband):
+    """
+    BOHB multi-fidelity oracle.
+
+    Hyperband, which samples new configurations with
+    :class:`Bayesian` surrogate instead of random search.
+    Surrogate is fitted on results of the largest budget,
+    which has enough observations. Until then, new
+    configurations are sampled randomly.
+
+    Args:
+        search_space (SearchSpace):
+            Search space instance.
+        min_budget (int | float):
+            Minimal budget of configuration.
+        max_budget (int | float):
+            Maximal budget of configuration.
+        eta (int):
+            Reduction factor of each rung.
+        n_min (int | None):
+            Minimal count of observations on budget
+            to fit surrogate. By default, dimension
+            of search space + 1.
+        random_fraction (float):
+            Fraction of randomly sampled configurations.
+        acq (str):
+            Acquisition function of surrogate.
+
+    Raises:
+        ValueError: If budgets or eta are not correct.
+
+    """
+
+    anchor = "bohb"
+    aliases = ("BOHB", "bohb")
+
+    def __init__(
+        self,
+        search_space,
+        *args,
+        n_min=None,
+        random_fraction=1 / 3,
+        acq="ei",
+        **kwargs,
+    ):
+        super().__init__(search_space, *args, **kwargs)
+
+        self.n_min = n_min or len(search_space) + 1
+        self.random_fraction = random_fraction
+
+        self.surrogate = Bayesian(search_space, acq=acq, seed=self.seed)
+        self.rng = np.random.RandomState(self.seed)
+
+        # budget -> [(vector, result), ...]
+        self._observations = defaultdict(list)
+
+    def sample(self, bracket: int) -> dict:
+        fitted = [
+            (budget, observations)
+            for budget, observations in self._observations.items()
+            if len(observations) >= self.n_min
+        ]
+
+        if not fitted or self.rng.rand() < self.random_fraction:
+            return super().sample(bracket)
+
+        _, observations = max(fitted, key=lambda item: item[0])
+
+        self.surrogate.X = np.array([vec for vec, _ in observations])
+        self.surrogate.y = np.array([res for _, res in observations])
+        self.surrogate.model.fit(self.surrogate.X, self.surrogate.y)
+
+        (x,) = self.surrogate.opt_acquisition(1)
+
+        return transform(x, self.search_space)
+
+    def observe(self, config, result):
+        if not np.isfinite(result):
+            return
+
+        vec = inverse_transform(config, self.search_space)
+        self._observations[config.budget].append((vec, result))
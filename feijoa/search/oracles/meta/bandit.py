@@ -137,6 +137,31 @@ class UCB1(MetaOracle):
 
         """
 
+        if not self._accept(config):
+            return
+
+        self._reward(config, result)
+        self._tell_oracles([config], [result])
+
+    def tell_many(self, configs, results):
+        """
+        Tell batch of results to all search oracles.
+
+        Rewards are accounted one by one, but every
+        oracle is told once with the whole batch.
+
+        """
+
+        configs, results = self._accept_many(configs, results)
+
+        for config, result in zip(configs, results):
+            self._reward(config, result)
+
+        self._tell_oracles(configs, results)
+
+    def _reward(self, config, result):
+        """Reward oracle, which requested configuration."""
+
         reward_multiplier = 1
 
         if len(self.results) % 10 == 0:
@@ -172,9 +197,6 @@ class UCB1(MetaOracle):
 
         self.results.append(result)
 
-        for oracle in self.oracles:
-            oracle.tell(config, result)
-
 
 class UCBTuned(UCB1):
 
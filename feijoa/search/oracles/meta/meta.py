@@ -23,10 +23,12 @@
 
 import abc
 import logging
-from typing import Generator, List, Optional
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, wait
+from typing import Dict, List, Optional
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.utils.imports import LazyModuleImportProxy
 
 seed = LazyModuleImportProxy("feijoa.search.seed")
@@ -41,22 +43,65 @@ class MetaOracle(Oracle):
 
     Used for pick up oracles.
 
+    If ask deadline is set (see :meth:`set_ask_deadline`),
+    oracles are asked in background threads. Oracle, which
+    misses deadline, keeps working in background, its proposals
+    are served on its next turn, and configurations of cheap
+    fallback are served instead. Results told meanwhile are
+    deferred until oracle's ask is finished. Count of missed
+    deadlines per oracle is available in ``deadline_misses``.
+
     Raises:
         AnyError: If anything bad happens.
 
     """
 
+    # ask deadline in seconds
+    ask_timeout: Optional[float] = None
+    # proposals for missed deadlines
+    fallback = None
+
     def __init__(self, *oracles, **kwargs):
         super().__init__(*oracles, **kwargs)
         self.oracles = list(oracles)
         self.ask_gen = None
+        self._init_deadlines()
+
+    def _init_deadlines(self):
+        """Reset bookkeeping of asks in background."""
+
+        # oracle name -> count of missed ask deadlines
+        self.deadline_misses: Counter = Counter()
+        # oracle name -> ask in background, which missed deadline
+        self._inflight: Dict[str, Future] = dict()
+        # oracle name -> results told during its ask in background
+        self._deferred: Dict[str, list] = dict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def preferred_batch_size(self) -> int:  # type: ignore
+        """The largest preferred batch size of oracles."""
+
+        return max((o.preferred_batch_size for o in self.oracles), default=1)
+
+    @property
+    def max_batch_size(self) -> Optional[int]:  # type: ignore
+        """The largest batch size of oracles (``None`` if unlimited)."""
+
+        sizes = [o.max_batch_size for o in self.oracles]
+
+        if not sizes or None in sizes:
+            return None
+
+        return max(sizes)
 
     def ask(self, n: int = 1) -> Optional[List[Configuration]]:
         if not self.ask_gen:
             self.ask_gen = self._ask(n)
-        return next(self.ask_gen)
+            return next(self.ask_gen)
+        return self.ask_gen.send(n)
 
-    def _ask(self, n: int) -> Generator:
+    def _ask(self, n: int) -> AskGenerator:
         prev_picked = ""
 
         # pick up all seed's oracles
@@ -71,23 +116,166 @@ class MetaOracle(Oracle):
         if seed_oracles:
             log.debug("Let's measure seed configurations!")
             for oracle in seed_oracles:
+                # seeds are emitted in chunks of requested size
                 configs = oracle.ask(n)
-                yield configs
+
+                while configs:
+                    n = yield configs
+                    configs = oracle.ask(n)
 
         while True:
             for oracle in self.order:
                 if not prev_picked or prev_picked != oracle.name:
                     log.debug(f"Pick {oracle.name}")
-                configs = oracle.ask(n)
-                yield configs
+                configs = self._ask_oracle(oracle, n)
+                n = yield configs
                 prev_picked = oracle.name
 
+    def set_ask_deadline(self, timeout: Optional[float], fallback=None):
+        """
+        Set deadline of oracle's ask.
+
+        Args:
+            timeout (float | None):
+                Deadline in seconds, ``None`` disables it.
+            fallback (Fallback | None):
+                Cheap proposals for missed deadlines
+                (see :class:`feijoa.search.fallback.Fallback`).
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        self.ask_timeout = timeout
+        self.fallback = fallback if timeout is not None else None
+
+    def _ask_oracle(self, oracle: Oracle, n: int) -> Optional[List[Configuration]]:
+        """
+        Ask oracle within deadline, otherwise ask fallback.
+
+        Ask, which missed deadline, isn't repeated: oracle
+        finishes it in background and its configurations
+        are served on the next turn of oracle.
+
+        """
+
+        future = self._inflight.pop(oracle.name, None)
+
+        if self.ask_timeout is None and future is None:
+            self._flush(oracle)
+            return oracle.ask(n)
+
+        if future is None:
+            self._flush(oracle)
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="feijoa-ask")
+
+            future = self._executor.submit(oracle.ask, n)
+
+        try:
+            configs = future.result(timeout=self.ask_timeout)
+        except TimeoutError:
+            self._inflight[oracle.name] = future
+            self.deadline_misses[oracle.name] += 1
+
+            log.debug(f"{oracle.name} missed ask deadline, fallback is used.")
+
+            return self.fallback.ask(n) if self.fallback else []
+
+        self._flush(oracle)
+
+        return configs
+
+    def _busy(self, oracle: Oracle) -> bool:
+        """Check if oracle is asked in background."""
+
+        future = self._inflight.get(oracle.name)
+
+        return future is not None and not future.done()
+
+    def _flush(self, oracle: Oracle):
+        """Tell oracle results deferred during its ask in background."""
+
+        for configs, results in self._deferred.pop(oracle.name, []):
+            oracle.tell_many(configs, results)
+
+    def _tell_oracles(self, configs, results):
+        """
+        Tell batch of accepted results to all search oracles.
+
+        Oracles, which are asked in background, are
+        told when their asks are finished.
+
+        """
+
+        for oracle in self.oracles:
+            if self._busy(oracle):
+                self._deferred.setdefault(oracle.name, []).append((configs, results))
+            else:
+                self._flush(oracle)
+                oracle.tell_many(configs, results)
+
+        if self.fallback:
+            self.fallback.tell_many(configs, results)
+
     def tell(self, config, result):
         """
         Tell results to all search oracles"""
 
+        if not self._accept(config):
+            return
+
+        self._tell_oracles([config], [result])
+
+    def tell_many(self, configs, results):
+        """Tell batch of results to all search oracles."""
+
+        configs, results = self._accept_many(configs, results)
+
+        self._tell_oracles(configs, results)
+
+    def set_pending(self, configs):
+        """
+        Set pending configurations to all search oracles,
+        except oracles asked in background.
+        """
+
         for oracle in self.oracles:
-            oracle.tell(config, result)
+            if not self._busy(oracle):
+                oracle.set_pending(configs)
+
+    def prime(self, configs, results):
+        """Prime all search oracles with historical results."""
+
+        for oracle in self.oracles:
+            oracle.prime(configs, results)
+
+    def set_failure_model(self, model):
+        """Set failure model to all search oracles."""
+
+        self.failure_model = model
+
+        for oracle in self.oracles:
+            oracle.set_failure_model(model)
+
+    def set_proposal_index(self, index):
+        """Set proposal index to all search oracles."""
+
+        self.proposal_index = index
+
+        for oracle in self.oracles:
+            oracle.set_proposal_index(index)
+
+    def set_workers(self, n_workers: int):
+        """Set count of workers to all search oracles."""
+
+        for oracle in self.oracles:
+            oracle.set_workers(n_workers)
 
     def add_oracle(self, oracle: Oracle):
         """
@@ -131,3 +319,25 @@ class MetaOracle(Oracle):
         """Get order for oracles."""
 
         raise NotImplementedError()
+
+    def __getstate__(self):
+        """
+        Get state for snapshot.
+
+        Asks in background are finished first, their
+        configurations are dropped (oracles are asked
+        again after restore), deferred results are kept.
+
+        """
+
+        wait(list(self._inflight.values()))
+
+        state = super().__getstate__()
+        state["_inflight"] = dict()
+        state["_executor"] = None
+
+        return state
+
+    def __setstate__(self, state):
+        self._init_deadlines()
+        self.__dict__.update(state)
@@ -22,8 +22,10 @@
 """Base class of search oracles."""
 
 import abc
+import inspect
+import logging
 import random
-from typing import List, Optional
+from typing import Generator, List, Optional, Set
 
 import numpy
 
@@ -33,6 +35,12 @@ __all__ = ["Oracle"]
 
 from feijoa.utils.mixins import Observer, Subject
 
+log = logging.getLogger(__name__)
+
+# ask generator yields configurations (None if search space
+# is exhausted) and receives requested count of the next ask
+AskGenerator = Generator[Optional[List[Configuration]], int, None]
+
 
 class Oracle(Subject, Observer, metaclass=abc.ABCMeta):
     """
@@ -60,19 +68,51 @@ class Oracle(Subject, Observer, metaclass=abc.ABCMeta):
         ask(n):
             Get k <= n configurations.
 
+    Batch sizes:
+
+        Oracles advertise ``preferred_batch_size`` (count of
+        configurations, which oracle naturally proposes at once,
+        e.g. population size) and ``max_batch_size`` (``None``
+        if any count may be asked). Oracles should honor ``n``
+        of every ask: larger natural batches are emitted in
+        chunks of requested size (see :meth:`_chunks`).
+
         tell(configuration, result):
             Tell oracle measured result for
             configuration
 
+    Tell contract:
+
+        Every asked configuration has unique ``token``.
+        Results may be told in any order (many configurations
+        are evaluated in parallel), late (after the next ask),
+        more than once or never. Oracles must match results
+        with their requests by token, ignore duplicated tells
+        (see :meth:`_accept`) and never wait for results in ask.
+        Configurations of other oracles (or without token)
+        are experience, which may be used or ignored.
+
 
     Raises:
         AnyError: If anything bad happens.
 
     """
 
+    preferred_batch_size: int = 1
+    max_batch_size: Optional[int] = None
+
+    # classifier of failure regions, shared by job
+    failure_model = None
+    # index of proposed configurations, shared by job
+    proposal_index = None
+
+    _ask_gen: Optional[AskGenerator] = None
+
     def __init__(self, *args, seed=0, **kwargs):
         self._name = self.__class__.__name__
         self.subscribers = []
+        # tokens of told configurations
+        self._told: Set[str] = set()
         numpy.random.seed(seed)
         random.seed(seed)
         self.seed = seed
@@ -142,6 +182,210 @@ class Oracle(Subject, Observer, metaclass=abc.ABCMeta):
 
         raise NotImplementedError()
 
+    def tell_many(self, configs, results):
+        """
+        Tell results of batch of configurations.
+
+        By default, results are told one by one,
+        oracles may override it with vectorized update.
+
+        Args:
+            configs (List[Configuration]):
+                Configuration instances.
+            results (List[float]):
+                Objective results for configurations.
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        for config, result in zip(configs, results):
+            self.tell(config, result)
+
+    def set_pending(self, configs):
+        """
+        Set configurations which are asked,
+        but still not told (evaluations in flight).
+
+        By default, pending configurations are ignored,
+        model-based oracles may use them to fantasize
+        results and avoid proposing the same points.
+
+        Args:
+            configs (List[Configuration]):
+                Pending configurations.
+
+        Returns:
+            None
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+    def prime(self, configs, results):
+        """
+        Prime oracle with historical results (e.g. of earlier
+        jobs with the same search space), which weren't asked
+        from oracle and aren't evaluated again.
+
+        By default, history is ignored, model-based oracles
+        may add it to their training data.
+
+        Args:
+            configs (List[Configuration]):
+                Historical configurations.
+            results (List[float]):
+                Their objective results.
+
+        Returns:
+            None
+
+        """
+
+    def set_failure_model(self, model):
+        """
+        Set classifier of failure regions.
+
+        Model-based oracles consult it to drop candidates,
+        which are likely to fail, before they are emitted
+        (see :class:`feijoa.search.failures.FailureModel`).
+
+        Args:
+            model (FailureModel | None):
+                Failure model instance.
+
+        Returns:
+            None
+
+        """
+
+        self.failure_model = model
+
+    def set_proposal_index(self, index):
+        """
+        Set index of proposed and evaluated configurations.
+
+        Oracles may consult it to skip candidates, which
+        were already proposed, before they are emitted
+        (see :class:`feijoa.search.duplicates.ProposalIndex`).
+
+        Args:
+            index (ProposalIndex | None):
+                Proposal index instance.
+
+        Returns:
+            None
+
+        """
+
+        self.proposal_index = index
+
+    def set_workers(self, n_workers: int):
+        """
+        Set count of workers, which evaluate
+        configurations in parallel.
+
+        By default, it's ignored, oracles may use it
+        to scale their initial designs.
+
+        Args:
+            n_workers (int):
+                Count of workers.
+
+        Returns:
+            None
+
+        """
+
+    def _resume(self, n: int) -> Optional[List[Configuration]]:
+        """
+        Get the next configurations from ask generator.
+
+        Generator is built on the first ask (and after
+        snapshot restore), requested count of the next
+        asks is sent to generator.
+
+        """
+
+        if not self._ask_gen:
+            self._ask_gen = self._ask(n)
+            return next(self._ask_gen)
+
+        return self._ask_gen.send(n)
+
+    def _ask(self, n: int) -> AskGenerator:
+        """Ask generator, which is resumed by :meth:`_resume`."""
+
+        raise NotImplementedError()
+
+    @staticmethod
+    def _chunks(
+        configs: List[Configuration], n: int
+    ) -> Generator[List[Configuration], int, int]:
+        """
+        Yield configurations in chunks of requested size.
+
+        Args:
+            configs (List[Configuration]):
+                Configurations to emit.
+            n (int):
+                Requested count of the first chunk.
+
+        Returns:
+            Requested count of the next ask.
+
+        """
+
+        while configs:
+            n = max(1, n)
+            chunk, configs = configs[:n], configs[n:]
+            n = yield chunk
+
+        return n
+
+    def _accept(self, config) -> bool:
+        """
+        Check that result of configuration isn't
+        told yet and remember its token.
+
+        Args:
+            config (Configuration):
+                Configuration instance.
+
+        Returns:
+            False for duplicated tell.
+
+        """
+
+        token = getattr(config, "token", None)
+
+        if token is None:
+            return True
+
+        if token in self._told:
+            log.debug(f"Duplicated tell of {token} is ignored by {self.name}.")
+            return False
+
+        self._told.add(token)
+
+        return True
+
+    def _accept_many(self, configs, results):
+        """Filter out duplicated tells of batch."""
+
+        accepted = [
+            (config, result)
+            for config, result in zip(configs, results)
+            if self._accept(config)
+        ]
+
+        return [c for c, _ in accepted], [r for _, r in accepted]
+
     @property
     def name(self):
         """Name of oracle."""
@@ -166,3 +410,18 @@ class Oracle(Subject, Observer, metaclass=abc.ABCMeta):
 
     def update(self, event, subject, *args, **kwargs):
         pass
+
+    def __getstate__(self):
+        """
+        Get state of oracle for snapshot.
+
+        Ask generators can't be serialized, so they are
+        dropped and restarted on the next ask. Oracles
+        must keep essential state in attributes.
+
+        """
+
+        return {
+            key: None if inspect.isgenerator(value) else value
+            for key, value in self.__dict__.items()
+        }
@@ -21,10 +21,10 @@
 # SOFTWARE.
 import copy
 import logging
-from typing import Generator, List, Optional
+from typing import List, Optional, Tuple
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.search.parameters import Integer
 from feijoa.search.space import SearchSpace
 from feijoa.search.visitors import Randomizer
@@ -62,12 +62,17 @@ class Pattern(Oracle):
         "templatesearch",
     )
 
+    # pattern points are measured sequentially
+    preferred_batch_size = 1
+    max_batch_size = 1
+
     def __init__(self, search_space: SearchSpace, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.search_space = search_space
         self.step_size = 0.1
-        self.results: List[tuple] = []
-        self._ask_gen: Optional[Generator] = None
+        # the best told (configuration, result)
+        self.best: Optional[Tuple[dict, float]] = None
+        self._ask_gen: Optional[AskGenerator] = None
 
     def ask(self, n: int = 1) -> Optional[List[Configuration]]:
         if not self._ask_gen:
@@ -75,10 +80,9 @@ class Pattern(Oracle):
                 "Parameter `n` does not affect on configuration's count,"
                 f" because {self.__class__.__name__} is sequential."
             )
-            self._ask_gen = self._ask(n)
-        return next(self._ask_gen)
+        return self._resume(n)
 
-    def _ask(self, n: int) -> Generator:
+    def _ask(self, n: int) -> AskGenerator:
         randomizer = Randomizer()
         center = {p.name: p.accept(randomizer) for p in self.search_space}
         yield [Configuration(center, requestor=self.name)]
@@ -135,12 +139,23 @@ class Pattern(Oracle):
                     yield [Configuration(cfg, requestor=self.name)]
                     points.append(cfg)
 
-            minima = min(self.results, key=lambda x: x[1])
+            if self.best is None:
+                # nothing is told yet (results are late),
+                # explore pattern around the same center
+                continue
+
+            minima, _ = self.best
 
-            if minima[0] != center:
-                center = copy.copy(minima[0])
+            if minima != center:
+                center = dict(minima)
             else:
                 self.step_size /= 2.0
 
     def tell(self, config, result):
-        self.results.append((config, result))
+        # results may come in any order, so
+        # only the best one is tracked
+        if not self._accept(config):
+            return
+
+        if self.best is None or result < self.best[1]:
+            self.best = (config, result)
@@ -19,10 +19,10 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-from typing import Generator, List, Optional
+from typing import List, Optional
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.search.visitors import Randomizer
 
 __all__ = ["Random"]
@@ -57,11 +57,9 @@ class Random(Oracle):
         self._ask_gen = None
 
     def ask(self, n: int = 1) -> Optional[List[Configuration]]:
-        if not self._ask_gen:
-            self._ask_gen = self._ask(n)
-        return next(self._ask_gen)
+        return self._resume(n)
 
-    def _ask(self, n: int) -> Generator:
+    def _ask(self, n: int) -> AskGenerator:
 
         while True:
             cfgs = []
@@ -76,7 +74,7 @@ class Random(Oracle):
 
                 cfgs.append(Configuration(cfg, requestor=self.name))
 
-            yield cfgs
+            n = yield cfgs
 
     def tell(self, config, result):
         """No needed."""
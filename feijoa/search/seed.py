@@ -55,21 +55,27 @@ class SeedOracle(Oracle):
         super().__init__(*seeds, **kwargs)
         self.seeds: list = list(seeds)
         self.is_emitted = False
+        # count of emitted seeds
+        self.cursor = 0
 
-    def ask(self, n: int = 1) -> Optional[List[Configuration]]:
-        log.debug(
-            "Parameter `n` does not affect on configuration's count,"
-            f" because {self.__class__.__name__} is sequential."
-        )
+    @property
+    def preferred_batch_size(self) -> int:  # type: ignore
+        """Count of seeds to emit."""
+
+        return max(1, len(self.seeds) - self.cursor)
 
+    def ask(self, n: int = 1) -> Optional[List[Configuration]]:
         cf = partial(Configuration, requestor=self.name)
 
-        if not self.is_emitted:
-            self.is_emitted = True
-            return [cf(s) for s in self.seeds]
-        else:
+        if self.is_emitted:
             return None
 
+        chunk = self.seeds[self.cursor : self.cursor + max(1, n)]
+        self.cursor += len(chunk)
+        self.is_emitted = self.cursor >= len(self.seeds)
+
+        return [cf(s) for s in chunk] or None
+
     def tell(self, config, result):
         # Tell no needed
         pass
@@ -21,6 +21,8 @@
 # SOFTWARE.
 """Search space module."""
 
+import hashlib
+import json
 import warnings
 from typing import List
 
@@ -99,6 +101,23 @@ class SearchSpace:
 
         return np.array([p.bounds for p in self])
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        Hash of parameters names, kinds and meta.
+
+        Search spaces with the same fingerprint
+        are interchangeable.
+
+        """
+
+        dumped = json.dumps(
+            [(p.name, p.__class__.__name__, p.meta) for p in self],
+            sort_keys=True,
+        )
+
+        return hashlib.sha1(dumped.encode()).hexdigest()
+
     @classmethod
     def from_yaml(cls, yaml_string):
         """Load search space from yaml."""
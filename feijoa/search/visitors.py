@@ -48,3 +48,77 @@ class Randomizer(ParametersVisitor):
 
     def visit_categorical(self, p):
         return self.random_generator.choice(p.choices)
+
+
+class Perturber(ParametersVisitor):
+    """
+    Perturber for parameters visitor.
+
+    Generate values near the values of
+    configuration set in ``config``.
+
+    Args:
+        scale (float):
+            Scale of perturbation relative
+            to parameter's range.
+        seed (int):
+            Random seed.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(self, scale=0.1, seed=0):
+        self.scale = scale
+        self.config: dict = dict()
+        self.random_generator = random.Random(x=seed)
+
+    def visit_integer(self, p):
+        step = max(1, round(self.scale * (p.high - p.low)))
+        value = self.config[p.name] + self.random_generator.randint(
+            1, step
+        ) * self.random_generator.choice([-1, 1])
+
+        return min(max(value, p.low), p.high)
+
+    def visit_real(self, p):
+        value = self.config[p.name] + self.random_generator.gauss(
+            0.0, self.scale * (p.high - p.low)
+        )
+
+        return min(max(value, p.low), p.high)
+
+    def visit_categorical(self, p):
+        others = [c for c in p.choices if c != self.config[p.name]]
+
+        return self.random_generator.choice(others or p.choices)
+
+
+class UnitMapper(ParametersVisitor):
+    """
+    Unit cube to parameters visitor.
+
+    Map values from [0, 1) set in ``point``
+    (by parameter's name) to parameter's values.
+
+    Raises:
+        AnyError: If anything bad happens.
+
+    """
+
+    def __init__(self):
+        self.point: dict = dict()
+
+    def visit_integer(self, p):
+        value = p.low + int(self.point[p.name] * (p.high - p.low + 1))
+
+        return min(value, p.high)
+
+    def visit_real(self, p):
+        return p.low + self.point[p.name] * (p.high - p.low)
+
+    def visit_categorical(self, p):
+        index = int(self.point[p.name] * len(p.choices))
+
+        return p.choices[min(index, len(p.choices) - 1)]
@@ -23,7 +23,16 @@
 
 import json
 
-from sqlalchemy import Column, Float, ForeignKey, Integer, String, TypeDecorator, types
+from sqlalchemy import (
+    Column,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    TypeDecorator,
+    types,
+)
 from sqlalchemy.ext.declarative import DeclarativeMeta, declarative_base
 from sqlalchemy.orm import relationship
 
@@ -32,6 +41,8 @@ __all__ = [
     "ParameterModel",
     "JobModel",
     "ExperimentModel",
+    "EvaluationCacheModel",
+    "SnapshotModel",
 ]
 
 
@@ -86,6 +97,8 @@ class JobModel(_Base):  # type: ignore
     search_space_id = Column(ForeignKey(SearchSpaceModel.id))  # type: ignore
     search_space = relationship(SearchSpaceModel, backref="jobs")  # type: ignore
     last_optimizer = Column(String)
+    next_experiment_id = Column(Integer)
+    finish_seq = Column(Integer)
 
     def __repr__(self):
         return f"Job<{self.id}, {self.name}"
@@ -102,6 +115,31 @@ class ExperimentModel(_Base):  # type: ignore
     objective_result = Column(Float)
     requestor = Column(String)
     params = Column(Json)
+    # json keeps int budgets int, so fingerprints match
+    budget = Column(Json)
     create_timestamp = Column(Float)
     finish_timestamp = Column(Float)
     metrics = Column(Json)
+    intermediate_values = Column(Json)
+    worker_id = Column(String)
+    lease_expires = Column(Float)
+    finish_seq = Column(Integer, index=True)
+
+
+class EvaluationCacheModel(_Base):  # type: ignore
+    __tablename__ = "evaluation_cache"
+
+    space_fingerprint = Column(String, primary_key=True)
+    params_hash = Column(String, primary_key=True)
+    objective_result = Column(Float)
+    metrics = Column(Json)
+
+
+class SnapshotModel(_Base):  # type: ignore
+    __tablename__ = "snapshots"
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(ForeignKey(JobModel.id), index=True)  # type: ignore
+    finish_seq = Column(Integer)
+    create_timestamp = Column(Float)
+    data = Column(LargeBinary)
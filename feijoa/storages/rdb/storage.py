@@ -21,22 +21,77 @@
 # SOFTWARE.
 """RDB storage uses SQLAlchemy module."""
 
-from typing import List, Optional
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import List, Optional, Set, Tuple
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, func, inspect, select, text, update
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from feijoa.models import Experiment
+from feijoa.exceptions import DuplicatedJobError
+from feijoa.models import Experiment, Result
 from feijoa.models.configuration import Configuration
+from feijoa.models.experiment import ExperimentState
 from feijoa.search.space import SearchSpace
 from feijoa.storages.rdb.models import (
+    EvaluationCacheModel,
     ExperimentModel,
     JobModel,
     ParameterModel,
     SearchSpaceModel,
+    SnapshotModel,
     _Base,
 )
 from feijoa.storages.storage import Storage
+from feijoa.utils.misc import synchronized
+
+
+def _sqlite_write_ahead_log(connection, _):
+    """
+    Use write-ahead log for sqlite files: commits (one per
+    asked batch of experiments) don't wait for fsync, but
+    survive the crash of process.
+    """
+
+    cursor = connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _upgrade_schema(engine):
+    """
+    Add columns and indexes of models, which are missing
+    in tables created by older versions (``create_all``
+    creates missing tables only). Added columns are
+    nullable, so existing rows get NULL.
+    """
+
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+
+    with engine.begin() as connection:
+        for table in _Base.metadata.sorted_tables:
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {preparer.format_table(table)}"
+                        f" ADD COLUMN {preparer.format_column(column)}"
+                        f" {column.type.compile(dialect=engine.dialect)}"
+                    )
+                )
+
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
 
 
 class RDBStorage(Storage):
@@ -45,21 +100,63 @@ class RDBStorage(Storage):
 
     Uses SQLAlchemy framework.
 
+    Storage is thread-safe: every thread has its own
+    session and storage operations are serialized, so
+    one storage can be shared by many threads (and by
+    many jobs).
+
     Raises:
         AnyError: If anything bad happens.
 
     """
 
     def __init__(self, url):
-        self.engine = create_engine(url)
+        parsed = make_url(url)
+
+        if parsed.get_backend_name() == "sqlite" and parsed.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            # in-memory database lives in one connection,
+            # which must be shared by sessions of all threads
+            self.engine = create_engine(
+                url,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+            )
+        else:
+            self.engine = create_engine(url)
+
+            if parsed.get_backend_name() == "sqlite":
+                event.listen(self.engine, "connect", _sqlite_write_ahead_log)
+
         # noinspection PyUnresolvedReferences
         _Base.metadata.create_all(self.engine)
+        _upgrade_schema(self.engine)
         self.Session = sessionmaker(bind=self.engine)
-        self.session = self.Session()
+        # thread-local sessions
+        self.session = scoped_session(self.Session)
+        self._lock = threading.RLock()
 
+    @synchronized
     def insert_job(self, job):
-        search_space_model = SearchSpaceModel(id=job.id)
+        try:
+            self._insert_job(job, job.id)
+        except IntegrityError:
+            self.session.rollback()
+
+            if self.is_job_name_exists(job.name):
+                raise DuplicatedJobError(f"Job {job.name} is already exists.")
+
+            # index is taken by concurrent writer,
+            # so let database allocate it
+            job.id = self._insert_job(job, None)
+
+    def _insert_job(self, job, job_id):
+        search_space_model = SearchSpaceModel(id=job_id)
         self.session.add(search_space_model)
+        self.session.flush()
 
         for p in job.search_space:
             name = p.name
@@ -74,7 +171,7 @@ class RDBStorage(Storage):
             self.session.add(param_model)
 
         job_model = JobModel(
-            id=job.id,
+            id=job_id if job_id is not None else search_space_model.id,
             name=job.name,
             search_space_id=search_space_model.id,
             last_optimizer=job.optimizer_name_dsl,
@@ -82,46 +179,331 @@ class RDBStorage(Storage):
         self.session.add(job_model)
         self.session.commit()
 
+        return job_model.id
+
+    @synchronized
     def get_optimizer_name_by_job_id(self, job_id) -> Optional[str]:
         job_model = self.session.query(JobModel).filter_by(id=job_id).one()
         optimizer = job_model.last_optimizer
         return optimizer
 
+    @synchronized
     def update_optimizer_name_by_job_id(self, job_id, name):
         self.session.query(JobModel).filter_by(id=job_id).update(
             {"last_optimizer": name}
         )
         self.session.commit()
 
+    @synchronized
     def get_search_space_by_job_id(self, job_id):
         job_model = self.session.query(JobModel).filter_by(id=job_id).one()
         parameters = job_model.search_space.parameters
         return SearchSpace.from_db_parameters(parameters)
 
+    @synchronized
     def is_job_name_exists(self, name):
         job_model = self.session.query(JobModel).filter_by(name=name).first()
         return bool(job_model)
 
+    @synchronized
     def get_job_id_by_name(self, name) -> Optional[int]:
         job_model = self.session.query(JobModel).filter_by(name=name).first()
         return job_model.id if job_model else None
 
+    @synchronized
     def insert_experiment(self, experiment):
-        experiment_model = ExperimentModel(
-            id=experiment.id,
-            job_id=experiment.job_id,
-            state=experiment.state,
-            hash=experiment.hash,
-            objective_result=experiment.objective_result,
-            params=experiment.params,
-            requestor=experiment.params.requestor,
-            create_timestamp=experiment.create_timestamp,
-            finish_timestamp=experiment.finish_timestamp,
-            metrics=experiment.metrics,
-        )
-        self.session.add(experiment_model)
+        self.insert_experiments([experiment])
+
+    @synchronized
+    def insert_experiments(self, experiments):
+        # one transaction for the whole batch,
+        # finish sequence numbers are allocated per job at once
+        finished = Counter(e.job_id for e in experiments if e.is_finished())
+        next_seq = {
+            job_id: self._next_finish_seq(job_id, n) for job_id, n in finished.items()
+        }
+
+        stored = self._stored_experiments(experiments)
+        updates = []
+
+        for experiment in experiments:
+            finish_seq = None
+
+            if experiment.is_finished():
+                finish_seq = next_seq[experiment.job_id]
+                next_seq[experiment.job_id] += 1
+
+            row = dict(
+                id=experiment.id,
+                job_id=experiment.job_id,
+                state=experiment.state,
+                hash=experiment.hash,
+                objective_result=experiment.objective_result,
+                params=experiment.params,
+                requestor=experiment.params.requestor,
+                budget=experiment.budget,
+                create_timestamp=experiment.create_timestamp,
+                finish_timestamp=experiment.finish_timestamp,
+                metrics=experiment.metrics,
+                intermediate_values=experiment.intermediate_values,
+                finish_seq=finish_seq,
+                lease_expires=None,
+            )
+
+            if (experiment.job_id, experiment.id) in stored:
+                # experiment is already asked in progress or
+                # claimed by worker, so it's updated in place
+                updates.append(row)
+            else:
+                self.session.add(ExperimentModel(**row))
+
+        if updates:
+            self.session.bulk_update_mappings(ExperimentModel, updates)
+
+        self.session.commit()
+
+    @synchronized
+    def insert_wip_experiments(self, experiments):
+        self.insert_experiments(experiments)
+
+    @synchronized
+    def delete_experiments(self, job_id, experiment_ids):
+        experiment_ids = list(experiment_ids)
+
+        if not experiment_ids:
+            return
+
+        self.session.query(ExperimentModel).filter(
+            ExperimentModel.job_id == job_id,
+            ExperimentModel.state == ExperimentState.WIP,
+            ExperimentModel.id.in_(experiment_ids),
+        ).delete(synchronize_session=False)
+        self.session.commit()
+
+    @synchronized
+    def get_unfinished_experiments(self, job_id) -> List[Experiment]:
+        experiments_models = (
+            self.session.query(ExperimentModel)
+            .filter(
+                ExperimentModel.job_id == job_id,
+                ExperimentModel.state == ExperimentState.WIP,
+                # leased experiments are reclaimed by workers
+                ExperimentModel.lease_expires.is_(None),
+            )
+            .order_by(ExperimentModel.id)
+            .all()
+        )
+
+        return [self._to_experiment(exp) for exp in experiments_models]
+
+    def _stored_experiments(self, experiments) -> set:
+        """
+        Get (job id, id) keys of experiments which are already
+        stored, with one query per chunk instead of one per experiment.
+        """
+
+        ids = defaultdict(list)
+
+        for experiment in experiments:
+            ids[experiment.job_id].append(experiment.id)
+
+        stored: Set[Tuple[int, int]] = set()
+
+        for job_id, job_ids in ids.items():
+            for i in range(0, len(job_ids), 500):
+                stored.update(
+                    (job_id, idx)
+                    for idx in self.session.execute(
+                        select(ExperimentModel.id).where(
+                            ExperimentModel.job_id == job_id,
+                            ExperimentModel.id.in_(job_ids[i : i + 500]),
+                        )
+                    ).scalars()
+                )
+
+        return stored
+
+    def _next_finish_seq(self, job_id, n=1) -> int:
+        """
+        Increment finish sequence number of job by n
+        (in transaction), returns the first of allocated numbers.
+        """
+
+        self.session.execute(
+            update(JobModel)
+            .where(JobModel.id == job_id)
+            .values(finish_seq=func.coalesce(JobModel.finish_seq, 0) + n)
+        )
+
+        return self.get_finish_seq(job_id) - n + 1
+
+    @synchronized
+    def allocate_experiment_ids(self, job_id, n) -> range:
+        first_free = (
+            select(func.coalesce(func.max(ExperimentModel.id) + 1, 0))
+            .where(ExperimentModel.job_id == job_id)
+            .scalar_subquery()
+        )
+
+        self.session.execute(
+            update(JobModel)
+            .where(JobModel.id == job_id)
+            .values(
+                next_experiment_id=(
+                    func.coalesce(JobModel.next_experiment_id, first_free) + n
+                )
+            )
+        )
+
+        end = self.session.execute(
+            select(JobModel.next_experiment_id).where(JobModel.id == job_id)
+        ).scalar_one()
+
+        self.session.commit()
+
+        return range(end - n, end)
+
+    @synchronized
+    def claim_experiments(self, experiments, worker_id, lease_timeout):
+        expires = time.time() + lease_timeout
+
+        for experiment in experiments:
+            self.session.add(
+                ExperimentModel(
+                    id=experiment.id,
+                    job_id=experiment.job_id,
+                    state=experiment.state,
+                    params=experiment.params,
+                    requestor=experiment.params.requestor,
+                    budget=experiment.budget,
+                    create_timestamp=experiment.create_timestamp,
+                    worker_id=worker_id,
+                    lease_expires=expires,
+                )
+            )
+
         self.session.commit()
 
+    @synchronized
+    def renew_leases(self, job_id, worker_id, experiment_ids, lease_timeout):
+        experiment_ids = list(experiment_ids)
+
+        if not experiment_ids:
+            return
+
+        self.session.execute(
+            update(ExperimentModel)
+            .where(
+                ExperimentModel.job_id == job_id,
+                ExperimentModel.worker_id == worker_id,
+                ExperimentModel.state == ExperimentState.WIP,
+                ExperimentModel.id.in_(experiment_ids),
+            )
+            .values(lease_expires=time.time() + lease_timeout)
+        )
+        self.session.commit()
+
+    @synchronized
+    def reclaim_expired_experiments(
+        self, job_id, worker_id, lease_timeout, limit
+    ) -> List[Experiment]:
+        now = time.time()
+
+        candidates = (
+            self.session.query(ExperimentModel.id)
+            .filter(
+                ExperimentModel.job_id == job_id,
+                ExperimentModel.state == ExperimentState.WIP,
+                ExperimentModel.lease_expires < now,
+            )
+            .limit(limit)
+            .all()
+        )
+
+        reclaimed = []
+
+        for (experiment_id,) in candidates:
+            # compare-and-swap: only one worker wins the lease
+            result = self.session.execute(
+                update(ExperimentModel)
+                .where(
+                    ExperimentModel.job_id == job_id,
+                    ExperimentModel.id == experiment_id,
+                    ExperimentModel.state == ExperimentState.WIP,
+                    ExperimentModel.lease_expires < now,
+                )
+                .values(worker_id=worker_id, lease_expires=now + lease_timeout)
+            )
+            self.session.commit()
+
+            if result.rowcount == 1:
+                reclaimed.append(experiment_id)
+
+        if not reclaimed:
+            return []
+
+        experiments_models = (
+            self.session.query(ExperimentModel)
+            .filter(
+                ExperimentModel.job_id == job_id,
+                ExperimentModel.id.in_(reclaimed),
+            )
+            .all()
+        )
+
+        experiments = []
+
+        for exp in experiments_models:
+            experiments.append(self._to_experiment(exp))
+
+        return experiments
+
+    @synchronized
+    def release_experiments(self, job_id, worker_id, experiment_ids):
+        experiment_ids = list(experiment_ids)
+
+        if not experiment_ids:
+            return
+
+        self.session.query(ExperimentModel).filter(
+            ExperimentModel.job_id == job_id,
+            ExperimentModel.worker_id == worker_id,
+            ExperimentModel.state == ExperimentState.WIP,
+            ExperimentModel.id.in_(experiment_ids),
+        ).delete(synchronize_session=False)
+        self.session.commit()
+
+    @synchronized
+    def get_finish_seq(self, job_id) -> int:
+        finish_seq = self.session.execute(
+            select(JobModel.finish_seq).where(JobModel.id == job_id)
+        ).scalar()
+
+        return finish_seq or 0
+
+    @synchronized
+    def get_experiments_finished_after(
+        self, job_id, finish_seq
+    ) -> Tuple[List[Experiment], int]:
+        experiments_models = (
+            self.session.query(ExperimentModel)
+            .filter(
+                ExperimentModel.job_id == job_id,
+                ExperimentModel.finish_seq > finish_seq,
+            )
+            .order_by(ExperimentModel.finish_seq)
+            .all()
+        )
+
+        experiments = []
+
+        for exp in experiments_models:
+            finish_seq = max(finish_seq, exp.finish_seq)
+            experiments.append(self._to_experiment(exp))
+
+        return experiments, finish_seq
+
+    @synchronized
     def get_experiment(self, job_id, experiment_id):
         experiment_model = (
             self.session.query(ExperimentModel)
@@ -130,23 +512,100 @@ class RDBStorage(Storage):
         )
         return Experiment.from_orm(experiment_model)
 
+    @synchronized
     def get_experiments_by_job_id(self, job_id) -> List[Experiment]:
+        # experiments in order of finishing, in progress ones are the last
         experiments_models = (
-            self.session.query(ExperimentModel).filter_by(job_id=job_id).all()
+            self.session.query(ExperimentModel)
+            .filter_by(job_id=job_id)
+            .order_by(
+                ExperimentModel.finish_seq.is_(None),
+                ExperimentModel.finish_seq,
+                ExperimentModel.id,
+            )
+            .all()
         )
         experiments = []
         for exp in experiments_models:
-            exp.params = Configuration(exp.params, requestor=exp.requestor)
+            exp.params = Configuration(
+                exp.params, requestor=exp.requestor, budget=exp.budget
+            )
             experiments.append(Experiment.from_orm(exp))
         return experiments
 
+    @staticmethod
+    def _to_experiment(experiment_model) -> Experiment:
+        """Make experiment without modification of model."""
+
+        experiment = Experiment.from_orm(experiment_model)
+        experiment.params = Configuration(
+            experiment.params,
+            requestor=experiment_model.requestor,
+            budget=experiment_model.budget,
+        )
+
+        return experiment
+
+    @synchronized
     def get_experiments_count(self, job_id) -> int:
-        experiments_models = (
-            self.session.query(ExperimentModel).filter_by(job_id=job_id).all()
+        return self.session.query(ExperimentModel).filter_by(job_id=job_id).count()
+
+    @synchronized
+    def get_cached_result(self, space_fingerprint, params_hash) -> Optional[Result]:
+        cache_model = self.session.get(
+            EvaluationCacheModel, (space_fingerprint, params_hash)
+        )
+
+        if not cache_model:
+            return None
+
+        return Result(
+            objective_result=cache_model.objective_result,
+            metrics=cache_model.metrics,
+        )
+
+    @synchronized
+    def insert_cached_result(self, space_fingerprint, params_hash, result):
+        cache_model = EvaluationCacheModel(
+            space_fingerprint=space_fingerprint,
+            params_hash=params_hash,
+            objective_result=result.objective_result,
+            metrics=result.metrics,
+        )
+        self.session.merge(cache_model)
+        self.session.commit()
+
+    @synchronized
+    def insert_snapshot(self, job_id, finish_seq, data):
+        self.session.query(SnapshotModel).filter_by(job_id=job_id).delete(
+            synchronize_session=False
+        )
+        self.session.add(
+            SnapshotModel(
+                job_id=job_id,
+                finish_seq=finish_seq,
+                create_timestamp=time.time(),
+                data=data,
+            )
+        )
+        self.session.commit()
+
+    @synchronized
+    def get_latest_snapshot(self, job_id) -> Optional[Tuple[int, bytes]]:
+        snapshot_model = (
+            self.session.query(SnapshotModel)
+            .filter_by(job_id=job_id)
+            .order_by(SnapshotModel.id.desc())
+            .first()
         )
-        return len(experiments_models)
+
+        if not snapshot_model:
+            return None
+
+        return snapshot_model.finish_seq, snapshot_model.data
 
     @property
+    @synchronized
     def jobs(self):
         jobs_models = self.session.query(JobModel).all()
         jobs = []
@@ -159,5 +618,5 @@ class RDBStorage(Storage):
         raise NotImplementedError()
 
     def __del__(self):
-        self.session.close()
+        self.session.remove()
         self.engine.dispose()
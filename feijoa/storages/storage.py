@@ -20,9 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import abc
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from feijoa.models import Experiment
+from feijoa.models import Experiment, Result
 from feijoa.search.space import SearchSpace
 
 __all__ = ["Storage"]
@@ -122,6 +122,79 @@ class Storage(metaclass=abc.ABCMeta):
 
         raise NotImplementedError()
 
+    def insert_experiments(self, experiments):
+        """
+        Insert batch of experiments into storage.
+
+        Args:
+            experiments (List[Experiment]):
+                Experiment instances to insert.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        for experiment in experiments:
+            self.insert_experiment(experiment)
+
+    def insert_wip_experiments(self, experiments):
+        """
+        Insert asked experiments in progress, which are
+        updated in place by :meth:`insert_experiments`
+        when finished.
+
+        Args:
+            experiments (List[Experiment]):
+                WIP experiment instances.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def delete_experiments(self, job_id, experiment_ids):
+        """
+        Delete experiments in progress, which won't be evaluated.
+
+        Args:
+            job_id (int):
+                Job index.
+            experiment_ids (Iterable[int]):
+                Indexes of WIP experiments.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def get_unfinished_experiments(self, job_id) -> List[Experiment]:
+        """
+        Get experiments in progress, which aren't
+        leased by workers (their driver is stopped).
+
+        Args:
+            job_id (int):
+                Job index.
+
+        Returns:
+            WIP experiments.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        return [
+            experiment
+            for experiment in self.get_experiments_by_job_id(job_id)
+            if not experiment.is_finished()
+        ]
+
     @abc.abstractmethod
     def get_experiment(self, job_id, experiment_id):
         """
@@ -185,7 +258,9 @@ class Storage(metaclass=abc.ABCMeta):
 
         """
 
-        experiments = self.get_experiments_by_job_id(job)
+        experiments = [
+            e for e in self.get_experiments_by_job_id(job) if e.is_finished()
+        ]
 
         if not experiments:
             return None
@@ -207,7 +282,9 @@ class Storage(metaclass=abc.ABCMeta):
 
         """
 
-        experiments = self.get_experiments_by_job_id(job_id)
+        experiments = [
+            e for e in self.get_experiments_by_job_id(job_id) if e.is_finished()
+        ]
 
         experiments.sort(key=lambda x: x.objective_result)  # type: ignore
         return experiments[: min(len(experiments), n)]
@@ -227,6 +304,232 @@ class Storage(metaclass=abc.ABCMeta):
 
         raise NotImplementedError()
 
+    def get_cached_result(self, space_fingerprint, params_hash) -> Optional[Result]:
+        """
+        Get cached evaluation result.
+
+        Args:
+            space_fingerprint (str):
+                Search space fingerprint.
+            params_hash (str):
+                Hash of configuration.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def insert_cached_result(self, space_fingerprint, params_hash, result):
+        """
+        Insert evaluation result into cache.
+
+        Args:
+            space_fingerprint (str):
+                Search space fingerprint.
+            params_hash (str):
+                Hash of configuration.
+            result (Result):
+                Evaluation result.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def allocate_experiment_ids(self, job_id, n) -> range:
+        """
+        Atomically allocate indexes for new experiments.
+
+        Used by workers, which share one job, so
+        indexes are unique among all workers.
+
+        Args:
+            job_id (int):
+                Job index.
+            n (int):
+                Count of indexes.
+
+        Returns:
+            Range of allocated indexes.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def claim_experiments(self, experiments, worker_id, lease_timeout):
+        """
+        Insert WIP experiments leased by worker.
+
+        Args:
+            experiments (List[Experiment]):
+                Experiments with allocated indexes.
+            worker_id (str):
+                Worker identifier.
+            lease_timeout (float):
+                Lease duration in seconds.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def renew_leases(self, job_id, worker_id, experiment_ids, lease_timeout):
+        """
+        Prolong worker's leases of WIP experiments.
+
+        Args:
+            job_id (int):
+                Job index.
+            worker_id (str):
+                Worker identifier.
+            experiment_ids (Iterable[int]):
+                Indexes of leased experiments.
+            lease_timeout (float):
+                Lease duration in seconds.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def reclaim_expired_experiments(
+        self, job_id, worker_id, lease_timeout, limit
+    ) -> List[Experiment]:
+        """
+        Take over WIP experiments with expired leases.
+
+        Each experiment is reclaimed by exactly one worker.
+
+        Args:
+            job_id (int):
+                Job index.
+            worker_id (str):
+                Worker identifier.
+            lease_timeout (float):
+                New lease duration in seconds.
+            limit (int):
+                Max count of experiments.
+
+        Returns:
+            Reclaimed experiments.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def release_experiments(self, job_id, worker_id, experiment_ids):
+        """
+        Remove worker's WIP experiments, which won't be evaluated.
+
+        Args:
+            job_id (int):
+                Job index.
+            worker_id (str):
+                Worker identifier.
+            experiment_ids (Iterable[int]):
+                Indexes of leased experiments.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def get_finish_seq(self, job_id) -> int:
+        """
+        Get the last finish sequence number of job.
+
+        Args:
+            job_id (int):
+                Job index.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def get_experiments_finished_after(
+        self, job_id, finish_seq
+    ) -> Tuple[List[Experiment], int]:
+        """
+        Get experiments finished after specified
+        sequence number of job.
+
+        Args:
+            job_id (int):
+                Job index.
+            finish_seq (int):
+                Last seen finish sequence number.
+
+        Returns:
+            Finished experiments and the last
+            finish sequence number.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def insert_snapshot(self, job_id, finish_seq, data):
+        """
+        Insert snapshot of job's oracles.
+
+        Only the latest snapshot of job is kept.
+
+        Args:
+            job_id (int):
+                Job index.
+            finish_seq (int):
+                Finish sequence number of the last
+                experiment told to oracles.
+            data (bytes):
+                Serialized snapshot.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
+    def get_latest_snapshot(self, job_id) -> Optional[Tuple[int, bytes]]:
+        """
+        Get the latest snapshot of job's oracles.
+
+        Args:
+            job_id (int):
+                Job index.
+
+        Returns:
+            Finish sequence number and serialized
+            snapshot or None if job has no snapshots.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+        """
+
+        raise NotImplementedError()
+
     @property
     @abc.abstractmethod
     def jobs(self):
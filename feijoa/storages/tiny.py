@@ -21,6 +21,7 @@
 # SOFTWARE.
 """TinyDB storage module."""
 
+import threading
 from typing import List, NamedTuple, Optional
 
 from feijoa.utils.imports import ImportWrapper
@@ -31,10 +32,11 @@ with ImportWrapper():
     from tinydb.operations import set as tinydb_set
 
 from feijoa.exceptions import DBVersionError, InsertExperimentWithTheExistedId
-from feijoa.models import Experiment
+from feijoa.models import Experiment, Result
 from feijoa.models.configuration import Configuration
 from feijoa.search.space import SearchSpace
 from feijoa.storages.storage import Storage
+from feijoa.utils.misc import synchronized
 
 __all__ = ["TinyDBStorage"]
 
@@ -54,6 +56,8 @@ class TinyDBStorage(Storage):
     def __init__(self, json_file: str):
         self.json_file = json_file
         self.tiny_db = TinyDB(json_file)
+        # TinyDB isn't thread-safe
+        self._lock = threading.RLock()
 
         db_version_table = self.tiny_db.table("version")
 
@@ -69,7 +73,9 @@ class TinyDBStorage(Storage):
         self.jobs_table = self.tiny_db.table("job")
         self.experiments_table = self.tiny_db.table("experiment")
         self.parameters_table = self.tiny_db.table("parameters")
+        self.cache_table = self.tiny_db.table("cache")
 
+    @synchronized
     def insert_job(self, job):
         doc = {
             "name": job.name,
@@ -91,9 +97,11 @@ class TinyDBStorage(Storage):
             }
             self.parameters_table.insert(param_model)
 
+    @synchronized
     def update_optimizer_name_by_job_id(self, job_id, name):
         self.jobs_table.update(tinydb_set("last_optimizer", name), Query().id == "John")
 
+    @synchronized
     def get_search_space_by_job_id(self, job_id) -> SearchSpace:
         parameters = self.parameters_table.search(Query().job_id == job_id)
         pool = list()
@@ -102,6 +110,7 @@ class TinyDBStorage(Storage):
             pool.append(mod)
         return SearchSpace.from_db_parameters(pool)
 
+    @synchronized
     def get_optimizer_name_by_job_id(self, job_id) -> Optional[str]:
         jobs = self.jobs_table.search(Query().id == job_id)
 
@@ -114,6 +123,7 @@ class TinyDBStorage(Storage):
 
         return job["optimizer_name_dsl"]
 
+    @synchronized
     def get_job_id_by_name(self, name) -> Optional[int]:
         jobs = self.jobs_table.search(Query().name == name)
 
@@ -126,10 +136,12 @@ class TinyDBStorage(Storage):
 
         return job["id"]
 
+    @synchronized
     def is_job_name_exists(self, name):
         jobs = self.jobs_table.search(Query().name == name)
         return len(jobs) != 0
 
+    @synchronized
     def insert_experiment(self, experiment):
         doc = experiment.dict()
         doc["requestor"] = experiment.params.requestor
@@ -140,6 +152,7 @@ class TinyDBStorage(Storage):
 
         self.experiments_table.insert(doc)
 
+    @synchronized
     def get_experiment(self, job_id, experiment_id):
         q = self.experiments_table.search(
             (Query().id == experiment_id) & (Query().job_id == job_id)
@@ -158,6 +171,7 @@ class TinyDBStorage(Storage):
         docs = self.experiments_table.search(Query().job_id == job_id)
         return docs
 
+    @synchronized
     def get_experiments_by_job_id(self, job_id) -> List[Experiment]:
         docs = self._get_raw_experiments(job_id)
         experiments = []
@@ -168,10 +182,39 @@ class TinyDBStorage(Storage):
             experiments.append(exp)
         return experiments
 
+    @synchronized
     def get_experiments_count(self, job_id) -> int:
-        return len(self.get_experiments_by_job_id(job_id))
+        return self.experiments_table.count(Query().job_id == job_id)
+
+    @synchronized
+    def get_cached_result(self, space_fingerprint, params_hash) -> Optional[Result]:
+        docs = self.cache_table.search(
+            (Query().space_fingerprint == space_fingerprint)
+            & (Query().params_hash == params_hash)
+        )
+
+        if not docs:
+            return None
+
+        doc, *_ = docs
+
+        return Result(objective_result=doc["objective_result"], metrics=doc["metrics"])
+
+    @synchronized
+    def insert_cached_result(self, space_fingerprint, params_hash, result):
+        self.cache_table.upsert(
+            {
+                "space_fingerprint": space_fingerprint,
+                "params_hash": params_hash,
+                "objective_result": result.objective_result,
+                "metrics": result.metrics,
+            },
+            (Query().space_fingerprint == space_fingerprint)
+            & (Query().params_hash == params_hash),
+        )
 
     @property
+    @synchronized
     def jobs(self):
         return self.jobs_table.all()
 
@@ -206,7 +206,7 @@ class _OracleParser:
 
         # suppress ply logs
         with io.StringIO() as buf, redirect_stderr(buf):
-            self.parser = yacc.yacc(module=self)
+            self.parser = yacc.yacc(module=self, write_tables=False, debug=False)
 
     def parse(self, doc):
         self.exception_message = ""
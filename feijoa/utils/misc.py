@@ -1,3 +1,4 @@
+import functools
 import sys
 
 
@@ -14,3 +15,25 @@ def in_notebook():
 
     """
     return "ipykernel" in sys.modules
+
+
+def synchronized(method):
+    """
+    Decorator, which serializes calls of method
+    with reentrant lock of instance (``_lock`` attribute).
+
+        Args:
+            method:
+                Instance method.
+
+        Returns:
+            Wrapped method.
+
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
@@ -85,3 +85,64 @@ def inverse_transform(configuration: dict, search_space):
             solution[i] = index
 
     return solution
+
+
+def batch_inverse_transform(configurations, search_space) -> np.ndarray:
+    """
+    Transform batch of configurations to matrix,
+    columns are in search space order.
+
+        Args:
+            configurations (List[dict]):
+                Feijoa configurations.
+            search_space:
+                Search space instance.
+
+        Returns:
+            float64 matrix of shape (batch size, parameters count),
+            categorical values are replaced with their indices.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+    """
+
+    matrix = np.empty((len(configurations), len(search_space)), dtype=np.float64)
+
+    for j, param in enumerate(search_space):
+        column = [configuration[param.name] for configuration in configurations]
+
+        if isinstance(param, Categorical):
+            indices = {choice: i for i, choice in enumerate(param.choices)}
+            column = [indices[value] for value in column]
+
+        matrix[:, j] = column
+
+    return matrix
+
+
+def batch_columns(configurations, search_space) -> dict:
+    """
+    Transform batch of configurations to
+    dict of columns in search space order.
+
+        Args:
+            configurations (List[dict]):
+                Feijoa configurations.
+            search_space:
+                Search space instance.
+
+        Returns:
+            Dict of parameter's name to array of its values.
+
+        Raises:
+            AnyError: If anything bad happens.
+
+    """
+
+    return {
+        param.name: np.array(
+            [configuration[param.name] for configuration in configurations]
+        )
+        for param in search_space
+    }
@@ -1,12 +1,12 @@
 import logging
-from typing import Generator, List, Optional
+from typing import List, Optional
 
 from bayesmark.builtin_opt.hyperopt_optimizer import HyperoptOptimizer
 from bayesmark.builtin_opt.opentuner_optimizer import OpentunerOptimizer
 from bayesmark.builtin_opt.pysot_optimizer import PySOTOptimizer
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.search.parameters import Categorical, Integer, Real
 
 log = logging.getLogger(__name__)
@@ -66,7 +66,7 @@ class BayesmarkAdapterHyperOpt(Oracle):
             self._ask_gen = self._ask(n)
         return next(self._ask_gen)
 
-    def _ask(self, n: int = 1) -> Generator:
+    def _ask(self, n: int = 1) -> AskGenerator:
 
         while True:
             cfgs = self.optimizer.suggest(n)
@@ -23,13 +23,13 @@
 
 import logging
 from itertools import product
-from typing import Generator, List, Optional
+from typing import Dict, List, Optional
 
 import numpy
 import optuna
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.search.parameters import Categorical, Integer, ParametersVisitor, Real
 
 __all__ = ["OptunaTPE"]
@@ -53,39 +53,49 @@ class OptunaTPE(Oracle):
         self._ask_gen = None
         self.name = f"Optuna<{self.SAMPLER.__name__}>"
         self.study = optuna.create_study(sampler=self.SAMPLER(seed=self.seed))
-        self.trial = None
+        # request token -> asked trial
+        self.trials: Dict[str, optuna.Trial] = dict()
 
     def ask(self, n: int = 1) -> Optional[List[Configuration]]:
         if not self._ask_gen:
             self._ask_gen = self._ask(n)
         return next(self._ask_gen)
 
-    def _ask(self, n: int) -> Generator:
+    def _ask(self, n: int) -> AskGenerator:
         while True:
-            self.trial = self.study.ask()
+            trial = self.study.ask()
             configuration = {}
 
             for param in self.space:
                 if isinstance(param, Real):
-                    configuration[param.name] = self.trial.suggest_float(
+                    configuration[param.name] = trial.suggest_float(
                         param.name, low=param.low, high=param.high
                     )
                 elif isinstance(param, Integer):
-                    configuration[param.name] = self.trial.suggest_int(
+                    configuration[param.name] = trial.suggest_int(
                         param.name, low=param.low, high=param.high
                     )
                 elif isinstance(param, Categorical):
-                    configuration[param.name] = self.trial.suggest_categorical(
+                    configuration[param.name] = trial.suggest_categorical(
                         param.name, choices=param.choices
                     )
 
             c = Configuration(configuration, requestor=self.name)
+            self.trials[c.token] = trial
             yield [c]
 
     def tell(self, config, result):
-        """No needed."""
+        """Tell result to the trial of request."""
+
+        # other oracle's configurations, duplicated
+        # tells and tells of loaded experiments are skipped
+        trial = self.trials.pop(getattr(config, "token", None), None)
+
+        if trial is None:
+            return
+
         log.info(f"Telled for {self.name}")
-        self.study.tell(self.trial, result)
+        self.study.tell(trial, result)
 
 
 class OptunaCMAES(OptunaTPE):
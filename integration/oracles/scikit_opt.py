@@ -21,14 +21,14 @@
 # SOFTWARE.
 """Scikit-optimize integration module."""
 
-from typing import Generator, List, Optional
+from typing import List, Optional
 
 import sklearn.utils.fixes
 from numpy import float64, int64
 from numpy.ma import MaskedArray
 
 from feijoa.models.configuration import Configuration
-from feijoa.search.oracles.oracle import Oracle
+from feijoa.search.oracles.oracle import AskGenerator, Oracle
 from feijoa.search.parameters import Categorical, Integer, Real
 from feijoa.search.space import SearchSpace
 from feijoa.utils.imports import ImportWrapper
@@ -68,7 +68,7 @@ class Skopt(Oracle):
             self.skopt_space, random_state=self.seed
         )
 
-        self.ask_generator: Optional[Generator] = None
+        self.ask_generator: Optional[AskGenerator] = None
 
     @staticmethod
     def _make_space(space: SearchSpace):
@@ -86,7 +86,7 @@ class Skopt(Oracle):
 
         return params
 
-    def _ask(self, n: int) -> Generator:
+    def _ask(self, n: int) -> AskGenerator:
         @skopt.utils.use_named_args(self.skopt_space)
         def named(**kwargs) -> dict:
             return kwargs
@@ -117,4 +117,19 @@ class Skopt(Oracle):
         return next(self.ask_generator)
 
     def tell(self, config, result):
+        if not self._accept(config):
+            return
+
         self.optimizer_instance.tell(list(config.values()), result)
+
+    def tell_many(self, configs, results):
+        """Tell batch with one refit of surrogate."""
+
+        configs, results = self._accept_many(configs, results)
+
+        if not configs:
+            return
+
+        self.optimizer_instance.tell(
+            [list(config.values()) for config in configs], list(results)
+        )
@@ -5,6 +5,8 @@ from itertools import chain
 
 import pytest
 
+from feijoa import Real, SearchSpace
+
 excluded_loggers = (
     "numba",
     "matplotlib",
@@ -15,8 +17,21 @@ for log_name in excluded_loggers:
     other_log.setLevel(logging.WARNING)
 
 
+@pytest.fixture
+def space():
+    """Unit square search space of `x` and `y`."""
+
+    return SearchSpace(Real("x", low=0.0, high=1.0), Real("y", low=0.0, high=1.0))
+
+
 @pytest.fixture(autouse=True)
 def cleanup():
     yield
-    for f in chain(glob.glob("*.json"), glob.glob("*.yaml"), glob.glob("*.db")):
+    for f in chain(
+        glob.glob("*.json"),
+        glob.glob("*.yaml"),
+        glob.glob("*.db"),
+        glob.glob("*.db-wal"),
+        glob.glob("*.db-shm"),
+    ):
         os.remove(f)
@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from feijoa import Experiment, create_job
+
+
+async def objective(experiment: Experiment):
+    await asyncio.sleep(0.1)
+    x = experiment.params.get("x")
+    y = experiment.params.get("y")
+    return (1 - x) ** 2 + (1 - y) ** 2
+
+
+def test_ado(space):
+    job = create_job(search_space=space)
+
+    start = time.monotonic()
+    asyncio.run(
+        job.ado(objective, n_trials=50, n_concurrent=50, optimizer="ucb<random>")
+    )
+
+    # all evaluations are in flight at the same time
+    assert time.monotonic() - start < 50 * 0.1 / 2
+    assert job.experiments_count == 50
+    assert job.statistics.trials == 50
+
+
+def test_do_with_async_objective(space):
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=10, n_jobs=5, optimizer="ucb<random>")
+
+    assert job.experiments_count == 10
+
+
+def test_do_inside_running_loop(space):
+    job = create_job(search_space=space)
+
+    async def main():
+        job.do(objective, n_trials=10, n_jobs=5, optimizer="ucb<random>")
+
+    asyncio.run(main())
+
+    assert job.experiments_count == 10
@@ -0,0 +1,72 @@
+import pytest
+
+from feijoa import Categorical, Experiment, Integer, SearchSpace, create_job
+from feijoa.models import Result
+
+
+@pytest.fixture
+def space():
+    space = SearchSpace()
+    space.insert(Integer("x", low=0, high=2))
+    space.insert(Categorical("z", choices=["foo", "bar"]))
+    return space
+
+
+def test_evaluation_cache(space):
+    calls = []
+
+    def objective(experiment: Experiment):
+        calls.append(experiment.id)
+        x = experiment.params["x"]
+        z = experiment.params["z"]
+        obj = x + (1 if z == "foo" else 2)
+        return Result(objective_result=obj, metrics={"x": x})
+
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+    job.do(objective, n_trials=6, optimizer="ucb<grid>", use_cache=True)
+
+    assert len(calls) == 6
+    assert job.cache.hits == 0
+    assert job.cache.misses == 6
+
+    # the same search space in other job: everything is cached
+    job2 = create_job(search_space=space, name="boo", storage=job.storage)
+    job2.do(objective, n_trials=6, optimizer="ucb<grid>", use_cache=True)
+
+    assert len(calls) == 6
+    assert job2.cache.hits == 6
+    assert job2.cache.misses == 0
+    assert job2.best_value == job.best_value
+
+    for experiment in job2.experiments:
+        assert experiment.metrics == {"x": experiment.params["x"]}
+
+    # other search space: no hits
+    other = SearchSpace(
+        Integer("x", low=0, high=2),
+        Categorical("z", choices=["foo", "bar"]),
+        Integer("w", low=0, high=1),
+    )
+
+    job3 = create_job(search_space=other, name="woo", storage=job.storage)
+    job3.do(objective, n_trials=3, optimizer="ucb<grid>", use_cache=True)
+
+    assert len(calls) == 9
+    assert job3.cache.hits == 0
+
+
+def test_cache_is_opt_in(space):
+    calls = []
+
+    def objective(experiment: Experiment):
+        calls.append(experiment.id)
+        return experiment.params["x"]
+
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=6, optimizer="ucb<grid>")
+    job.do(objective, n_trials=6, optimizer="ucb<grid>")
+
+    assert job.cache is None
+    assert len(calls) == 12
@@ -0,0 +1,140 @@
+import pickle
+import threading
+
+import pytest
+
+from feijoa import Categorical, Integer, Real, SearchSpace, create_job
+from feijoa.models.configuration import Configuration
+from feijoa.search.fallback import Fallback
+from feijoa.search.oracles.meta.roundrobin import RoundRobinMeta
+from feijoa.search.oracles.oracle import Oracle
+
+
+@pytest.fixture
+def space():
+    return SearchSpace(
+        Real("x", low=0.0, high=1.0),
+        Integer("y", low=0, high=9),
+        Categorical("kind", choices=["a", "b", "c"]),
+    )
+
+
+def in_space(space, config):
+    for p in space:
+        value = config[p.name]
+
+        if isinstance(p, Categorical):
+            if value not in p.choices:
+                return False
+        elif not p.low <= value <= p.high:
+            return False
+
+    return isinstance(config["y"], int)
+
+
+class Slow(Oracle):
+    """Oracle, which proposes only after event is set."""
+
+    anchor = "slow"
+    aliases = ("slow",)
+
+    def __init__(self):
+        super().__init__()
+        self.ready = threading.Event()
+        self.told = []
+
+    def ask(self, n=1):
+        self.ready.wait()
+        return [Configuration({"x": 0.5, "y": 5, "kind": "a"}, requestor=self.name)]
+
+    def tell(self, config, result):
+        self.told.append(result)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("ready")
+        return state
+
+
+def test_missed_deadline_serves_fallback(space):
+    slow = Slow()
+    meta = RoundRobinMeta(slow)
+    meta.set_ask_deadline(0.05, Fallback(space, seed=0))
+
+    configs = meta.ask(3)
+
+    assert len(configs) == 3
+    assert all(c.requestor == "Fallback" for c in configs)
+    assert meta.deadline_misses == {"Slow": 1}
+
+    # slow oracle is told when its ask is finished
+    meta.tell_many(configs, [1.0, 2.0, 3.0])
+
+    assert slow.told == []
+
+    slow.ready.set()
+    (config,) = meta.ask(1)
+
+    assert config.requestor == "Slow"
+    assert slow.told == [1.0, 2.0, 3.0]
+    assert meta.deadline_misses == {"Slow": 1}
+
+
+def test_meta_oracle_with_ask_in_background_is_pickled(space):
+    slow = Slow()
+    meta = RoundRobinMeta(slow)
+    meta.set_ask_deadline(0.01, Fallback(space))
+
+    meta.ask(1)
+    slow.ready.set()
+
+    restored = pickle.loads(pickle.dumps(meta))
+
+    assert restored.deadline_misses == {"Slow": 1}
+    assert not restored._inflight
+
+
+@pytest.mark.parametrize("kind", ["random", "quasirandom", "mutation"])
+def test_fallback_kinds(kind, space):
+    fallback = Fallback(space, kind=kind, seed=0)
+    fallback.tell_many(
+        [{"x": 0.2, "y": 3, "kind": "b"}, {"x": 0.9, "y": 8, "kind": "c"}],
+        [1.0, 2.0],
+    )
+
+    configs = fallback.ask(64)
+
+    assert len(configs) == 64
+    assert fallback.served == 64
+    assert all(in_space(space, c) for c in configs)
+
+    if kind == "quasirandom":
+        # low-discrepancy points cover every decile
+        assert len({int(c["x"] * 10) for c in configs}) == 10
+
+    if kind == "mutation":
+        assert fallback.incumbent == {"x": 0.2, "y": 3, "kind": "b"}
+        assert sum(abs(c["x"] - 0.2) < 0.4 for c in configs) > 48
+
+    with pytest.raises(ValueError):
+        Fallback(space, kind="bayesian")
+
+
+def test_job_with_ask_deadline(space):
+    def objective(experiment):
+        return (experiment.params["x"] - 0.3) ** 2 + experiment.params["y"]
+
+    job = create_job(search_space=space)
+    job.do(
+        objective,
+        n_trials=20,
+        optimizer="ucb<bayesian[n_warmup=3]>",
+        ask_timeout=1e-6,
+        ask_fallback="mutation",
+    )
+
+    requestors = {e.params.requestor for e in job.experiments}
+
+    assert job.experiments_count == 20
+    assert "Fallback" in requestors
+    assert sum(job.optimizer.deadline_misses.values()) > 0
@@ -0,0 +1,76 @@
+import pytest
+
+from feijoa import Categorical, Integer, SearchSpace, create_job
+from feijoa.models.configuration import Configuration
+from feijoa.search.duplicates import ProposalIndex
+
+
+@pytest.fixture
+def space():
+    return SearchSpace(
+        Integer("x", low=0, high=9),
+        Categorical("kind", choices=["a", "b", "c"]),
+    )
+
+
+def objective(experiment):
+    x, kind = experiment.params["x"], experiment.params["kind"]
+
+    return (x - 3) ** 2 + {"a": 1.0, "b": 0.0, "c": 2.0}[kind]
+
+
+def count_distinct(job):
+    return len({e.params_hash for e in job.experiments})
+
+
+def test_index_filters_duplicates(space):
+    index = ProposalIndex(space)
+    index.add([{"x": 1, "kind": "a"}])
+
+    configs = [
+        Configuration({"x": 1, "kind": "a"}, requestor="random"),
+        Configuration({"x": 2, "kind": "a"}, requestor="random"),
+        Configuration({"x": 2, "kind": "a"}, requestor="bayesian"),
+        Configuration({"x": 2, "kind": "a"}, requestor="hyperband", budget=3),
+    ]
+
+    accepted, rejected = index.filter(configs)
+
+    assert accepted == [configs[1], configs[3]]
+    assert rejected == [configs[0], configs[2]]
+    assert index.rates == {"random": 0.5, "bayesian": 1.0, "hyperband": 0.0}
+
+    neighbour = index.neighbour(configs[0])
+
+    assert neighbour not in [configs[0], configs[1]]
+    assert neighbour.token == configs[0].token
+    assert neighbour in index
+
+
+def test_random_search_without_duplicates(space):
+    plain = create_job(search_space=space)
+    plain.do(objective, n_trials=25, optimizer="random", seed=0)
+
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=25, optimizer="random", seed=0, deduplicate=True)
+
+    assert job.experiments_count == 25
+    assert count_distinct(job) == 25
+    assert count_distinct(plain) < 25
+    assert job.proposals.rates["Random"] > 0.0
+
+
+def test_bayesian_batch_without_duplicates(space):
+    job = create_job(search_space=space)
+    job.do(
+        objective,
+        n_trials=20,
+        n_jobs=4,
+        n_points_iter=4,
+        optimizer="bayesian",
+        seed=0,
+        deduplicate=True,
+    )
+
+    assert job.experiments_count == 20
+    assert count_distinct(job) == 20
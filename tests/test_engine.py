@@ -0,0 +1,264 @@
+import time
+
+from feijoa import Experiment, create_job
+
+
+def objective(experiment: Experiment):
+    x = experiment.params.get("x")
+    y = experiment.params.get("y")
+
+    # the first trial is a straggler
+    time.sleep(0.5 if experiment.id == 0 else 0.01)
+
+    return (1 - x) ** 2 + (1 - y) ** 2
+
+
+def test_engine_statistics(space):
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=20, n_jobs=4, optimizer="ucb<random>")
+
+    assert job.experiments_count == 20
+    assert job.statistics.trials == 20
+    assert job.statistics.n_workers == 4
+    assert 0.0 < job.statistics.utilization <= 1.0
+    assert job.statistics.trials_per_hour > 0.0
+
+
+def test_engine_is_barrier_free(space):
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=20, n_jobs=2, optimizer="ucb<random>")
+
+    # straggler doesn't block another worker,
+    # so it is told among the last ones
+    told = [e.id for e in job.experiments]
+    assert told.index(0) > 10
+
+
+def hung(experiment: Experiment):
+    # abandoned thread is joined at interpreter exit, keep it short
+    time.sleep(3 if experiment.id == 0 else 0.01)
+    return experiment.params["x"]
+
+
+def assert_killed(job, ids):
+    killed = [e for e in job.experiments if e.metrics and "timeout" in e.metrics]
+
+    assert sorted(e.id for e in killed) == ids
+    assert all(e.state == "ERROR" for e in killed)
+    assert job.statistics.timed_out == len(ids)
+
+
+def test_trial_timeout(space, caplog):
+    job = create_job(search_space=space)
+
+    start = time.monotonic()
+    job.do(hung, n_trials=10, n_jobs=2, optimizer="ucb<random>", timeout=0.5)
+
+    assert time.monotonic() - start < 2.5
+    assert job.experiments_count == 10
+    assert_killed(job, [0])
+    # backend isn't switched, hung thread is left in background
+    assert "can't be killed" in caplog.text
+
+
+def test_timeout_kills_subprocesses(tmp_path, space):
+    import subprocess
+
+    def objective(experiment: Experiment):
+        if experiment.id == 0:
+            proc = subprocess.Popen(["sleep", "30"])
+            (tmp_path / "pid").write_text(str(proc.pid))
+            proc.wait()
+        return experiment.params["x"]
+
+    job = create_job(search_space=space)
+    job.do(
+        objective,
+        n_trials=4,
+        n_jobs=2,
+        optimizer="ucb<random>",
+        backend="processes",
+        timeout=1.0,
+    )
+
+    assert_killed(job, [0])
+
+    time.sleep(0.1)
+    pid = int((tmp_path / "pid").read_text())
+
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            # killed process may stay zombie without reaper
+            assert "zombie" in f.read()
+    except FileNotFoundError:
+        pass
+
+
+def test_straggler_cutoff(space):
+    def objective(experiment: Experiment):
+        time.sleep(3 if experiment.id == 6 else 0.01)
+        return experiment.params["x"]
+
+    job = create_job(search_space=space)
+
+    start = time.monotonic()
+    job.do(objective, n_trials=10, optimizer="ucb<random>", straggler_cutoff=10)
+
+    assert time.monotonic() - start < 2.5
+    assert_killed(job, [6])
+
+
+def test_async_timeout(space):
+    import asyncio
+
+    async def objective(experiment: Experiment):
+        await asyncio.sleep(30 if experiment.id == 0 else 0.01)
+        return experiment.params["x"]
+
+    job = create_job(search_space=space)
+
+    asyncio.run(job.ado(objective, n_trials=5, optimizer="ucb<random>", timeout=0.5))
+
+    assert_killed(job, [0])
+
+
+def run_with_slow_ask(space, pipelined):
+    from feijoa.jobs.engine import Engine
+
+    def objective(experiment: Experiment):
+        time.sleep(0.1)
+        return experiment.params["x"]
+
+    job = create_job(search_space=space)
+    job._setup_optimizer("ucb<random>", None)
+
+    ask = job.optimizer.ask
+
+    def slow_ask(n=1):
+        time.sleep(0.1)
+        return ask(n)
+
+    job.optimizer.ask = slow_ask
+
+    engine = Engine(job, objective, n_trials=10, pipelined=pipelined)
+
+    return job, engine.run()
+
+
+def test_pipelined_ask(space):
+    job, pipelined = run_with_slow_ask(space, pipelined=True)
+    _, sequential = run_with_slow_ask(space, pipelined=False)
+
+    assert job.experiments_count == 10
+    assert pipelined.trials == 10
+
+    # ask is overlapped with evaluation
+    assert pipelined.ask_fraction < sequential.ask_fraction
+    assert pipelined.wall_time < sequential.wall_time
+
+
+def test_trials_are_told_during_background_ask(space):
+    from feijoa.jobs.engine import Engine
+
+    def objective(experiment: Experiment):
+        time.sleep(0.05)
+        return experiment.params["x"]
+
+    job = create_job(search_space=space)
+    job._setup_optimizer("ucb<random>", None)
+
+    ask = job.optimizer.ask
+    recorded = []
+
+    def blocking_ask(n=1):
+        if job.experiments_count:
+            # background ask holds the optimizer lock until
+            # trials of the first batch are recorded
+            deadline = time.monotonic() + 5.0
+
+            while job.state.finished < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            recorded.append(job.state.finished)
+
+        return ask(n)
+
+    job.optimizer.ask = blocking_ask
+
+    engine = Engine(job, objective, n_trials=4, n_jobs=2, pipelined=True)
+    engine.run()
+
+    assert recorded[0] == 2
+    assert job.experiments_count == 4
+    # results recorded during ask are told to oracles
+    assert len(job.optimizer.results) == 4
+
+
+def test_pending_configurations_are_fantasized(space):
+    from feijoa.models.configuration import Configuration
+    from feijoa.search.oracles.bayesian import Bayesian
+
+    oracle = Bayesian(space, n_warmup=2)
+    oracle.tell_many(
+        [Configuration({"x": 0.1, "y": 0.1}), Configuration({"x": 0.9, "y": 0.9})],
+        [1.0, 3.0],
+    )
+    oracle.set_pending([Configuration({"x": 0.5, "y": 0.5})])
+    oracle._fit()
+
+    assert len(oracle.model.X_train_) == 3
+    assert oracle.model.y_train_[-1] == 2.0
+    assert len(oracle.y) == 2
+
+
+def test_adaptive_batch_size(space):
+    from feijoa.jobs.engine import Engine
+
+    job = create_job(search_space=space)
+    job._setup_optimizer("ucb<random>", seed=0)
+
+    asked = []
+    ask = job.optimizer.ask
+
+    def spy(n):
+        asked.append(n)
+        return ask(n)
+
+    job.optimizer.ask = spy
+
+    def fast(experiment):
+        return experiment.params["x"]
+
+    statistics = Engine(job, fast, n_trials=10, n_jobs=4).run()
+
+    # all workers are idle at start, budget caps the last asks
+    assert asked[0] == 4
+    assert max(asked) <= 4
+    assert sum(asked) == 10
+    assert statistics.trials == 10
+    assert job.experiments_count == 10
+
+
+def test_oracles_honor_batch_size(space):
+    from feijoa.search.oracles.bayesian import Bayesian
+    from feijoa.search.oracles.randomized import Random
+    from feijoa.search.seed import SeedOracle
+
+    oracle = Random(space)
+    assert [len(oracle.ask(n)) for n in (3, 1, 5)] == [3, 1, 5]
+
+    seeds = SeedOracle({"x": 0.1}, {"x": 0.2}, {"x": 0.3})
+    assert seeds.preferred_batch_size == 3
+    assert len(seeds.ask(2)) == 2
+    assert len(seeds.ask(2)) == 1
+    assert seeds.ask(2) is None
+
+    # warmup is scaled to count of workers
+    bayesian = Bayesian(space)
+    bayesian.set_workers(8)
+    assert len(bayesian.ask(8)) == 8
+
+    # results are late, random samples are proposed
+    assert len(bayesian.ask(2)) == 2
+
+    assert len(Bayesian(space, n_warmup=2).ask(8)) == 2
@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+from feijoa import Experiment, create_job
+from feijoa.models import Result
+
+
+@pytest.mark.parametrize("backend", ["threads", "processes", "serial"])
+def test_backends(backend, space):
+    shift = 1.0
+
+    # closure, can't be pickled with regular pickle
+    def objective(experiment: Experiment):
+        x = experiment.params.get("x")
+        y = experiment.params.get("y")
+        obj = (shift - x) ** 2 + (shift - y) ** 2
+        return Result(objective_result=obj, metrics={"x_plus_y": x + y})
+
+    job = create_job(search_space=space)
+    job.do(
+        objective,
+        n_trials=10,
+        n_jobs=2,
+        optimizer="ucb<random>",
+        backend=backend,
+    )
+
+    assert job.experiments_count == 10
+
+    for experiment in job.experiments:
+        x, y = experiment.params["x"], experiment.params["y"]
+        assert experiment.metrics == {"x_plus_y": pytest.approx(x + y)}
+
+
+def test_not_picklable_objective(space):
+    lock = threading.Lock()
+
+    def objective(experiment: Experiment):
+        with lock:
+            return experiment.params["x"]
+
+    job = create_job(search_space=space)
+
+    with pytest.warns(UserWarning, match="can't be pickled"):
+        job.do(objective, n_trials=3, optimizer="ucb<random>", backend="processes")
+
+    assert job.experiments_count == 3
+
+
+def test_unknown_backend(space):
+    job = create_job(search_space=space)
+
+    with pytest.raises(ValueError):
+        job.do(lambda e: 0.0, n_trials=3, optimizer="ucb<random>", backend="gpu")
@@ -31,7 +31,8 @@ def test_experiment():
     },
     "create_timestamp": 0.0,
     "finish_timestamp": null,
-    "metrics": null
+    "metrics": null,
+    "intermediate_values": null
 })"""
     )
 
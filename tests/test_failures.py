@@ -0,0 +1,84 @@
+import numpy as np
+
+from feijoa import create_job
+from feijoa.models.experiment import ExperimentState
+from feijoa.search.failures import FailureModel
+
+
+def objective(experiment):
+    x, y = experiment.params["x"], experiment.params["y"]
+
+    # configurations in the right part don't compile
+    if x > 0.5:
+        return float("+inf")
+
+    return (x - 0.2) ** 2 + (y - 0.5) ** 2
+
+
+def count_failures(job):
+    return sum(e.state == ExperimentState.ERROR for e in job.experiments)
+
+
+def test_failure_model_predicts_regions(space):
+    model = FailureModel(space)
+    rng = np.random.RandomState(0)
+
+    configs = [{"x": x, "y": y} for x, y in rng.uniform(size=(50, 2))]
+    results = [float("+inf") if c["x"] > 0.5 else 1.0 for c in configs]
+
+    assert not model.ready
+
+    model.add(configs, results)
+
+    assert model.ready
+    assert list(model.risky(np.array([[0.9, 0.5], [0.1, 0.5]]))) == [True, False]
+
+
+def test_failure_model_is_refitted_lazily(space):
+    model = FailureModel(space, refit_every=5)
+    configs = [{"x": x, "y": 0.5} for x in np.linspace(0.0, 1.0, 10)]
+
+    model.add(configs, [float("+inf") if c["x"] > 0.5 else 1.0 for c in configs])
+    model.predict(np.array([[0.9, 0.5]]))
+    classifier = model.classifier
+
+    # successes only: classifier is kept until enough of them
+    model.add(configs[:4], [1.0] * 4)
+    model.predict(np.array([[0.9, 0.5]]))
+
+    assert model.classifier is classifier
+
+    model.add(configs[:1], [1.0])
+    model.predict(np.array([[0.9, 0.5]]))
+
+    assert model.classifier is not classifier
+
+    # a new failure refits at once
+    classifier = model.classifier
+    model.add(configs[:1], [None])
+    model.predict(np.array([[0.9, 0.5]]))
+
+    assert model.classifier is not classifier
+    assert model.n_failed == 6
+
+
+def test_random_search_avoids_failures(space):
+    plain = create_job(search_space=space)
+    plain.do(objective, n_trials=60, optimizer="random", seed=0)
+
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=60, optimizer="random", seed=0, avoid_failures=True)
+
+    assert job.experiments_count == 60
+    assert job.failures.rejected > 0
+    assert job.failures.avoided > 0.0
+    assert count_failures(job) < count_failures(plain)
+
+
+def test_bayesian_with_failures(space):
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=20, optimizer="bayesian", seed=0, avoid_failures=True)
+
+    assert job.experiments_count == 20
+    assert np.isfinite(job.best_value)
+    assert count_failures(job) < 10
@@ -0,0 +1,98 @@
+import pytest
+
+from feijoa import Experiment, create_job
+from feijoa.search.oracles.hyperband import BOHB, Hyperband
+
+
+def test_hyperband_brackets(space):
+    oracle = Hyperband(space, min_budget=1, max_budget=27, eta=3)
+
+    assert oracle.s_max == 3
+    assert [oracle.budget(3, rung) for rung in range(4)] == [1, 3, 9, 27]
+    assert oracle.budget(0, 0) == 27
+
+    with pytest.raises(ValueError):
+        Hyperband(space, min_budget=10, max_budget=1)
+
+
+def test_hyperband_promotion(space):
+    oracle = Hyperband(space, min_budget=1, max_budget=9, eta=3)
+
+    # first bracket starts with the smallest budget
+    configs = oracle.ask(3)
+    assert [c.budget for c in configs] == [1, 3, 9]
+
+    oracle = Hyperband(space, min_budget=1, max_budget=9, eta=3)
+    bottom = []
+
+    while len(bottom) < 3:
+        bottom.extend(c for c in oracle.ask(3) if c.budget == 1)
+
+    for i, config in enumerate(bottom[:3]):
+        oracle.tell(config, float(i))
+
+    # the best of three is promoted to the next rung
+    promoted = oracle.ask(3)[0]
+    assert promoted.budget == 3
+    assert dict(promoted) == dict(bottom[0])
+
+
+def test_hyperband_rungs_are_sorted(space):
+    oracle = Hyperband(space, min_budget=1, max_budget=9, eta=3)
+    bottom = []
+
+    while len(bottom) < 3:
+        bottom.extend(c for c in oracle.ask(3) if c.budget == 1)
+
+    for i, config in enumerate(bottom[:3]):
+        oracle.tell(config, float(2 - i))
+
+    results = [result for result, _, _ in oracle._rungs[(2, 0)]]
+    assert results == [0.0, 1.0, 2.0]
+
+    promoted = oracle.ask(3)[0]
+    assert promoted.budget == 3
+    assert dict(promoted) == dict(bottom[2])
+
+
+def test_hyperband_ignores_foreign_configurations(space):
+    oracle = Hyperband(space, max_budget=9)
+    config = oracle.ask(1)[0]
+    config.requestor = "other"
+
+    oracle.tell(config, 0.0)
+
+    assert not oracle._rungs
+
+
+@pytest.mark.parametrize("optimizer", ["ucb<hyperband[eta=3]>", "ucb<bohb, random>"])
+def test_hyperband_job(optimizer, space):
+    budgets = []
+
+    def objective(experiment: Experiment):
+        # configurations of other oracles have no budget
+        budget = experiment.budget or 81
+        budgets.append(experiment.budget)
+        x = experiment.params["x"]
+        return (x - 0.3) ** 2 + 1.0 / budget
+
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=60, optimizer=optimizer)
+
+    assert len(job.experiments) == 60
+    assert max(b for b in budgets if b is not None) == 81
+    assert len({b for b in budgets if b is not None}) > 1
+
+
+def test_bohb_surrogate(space):
+    oracle = BOHB(space, max_budget=9, eta=3, random_fraction=0.0)
+
+    for config in oracle.ask(1):
+        pass
+
+    for _ in range(10):
+        for config in oracle.ask(1):
+            oracle.tell(config, config["x"])
+
+    assert any(len(obs) >= oracle.n_min for obs in oracle._observations.values())
+    assert set(oracle.sample(0)) == {"x", "y"}
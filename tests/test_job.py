@@ -103,3 +103,38 @@ def test_load_storage():
 
     with pytest.raises(InvalidStoragePassed):
         _load_storage(dict(a=1))
+
+
+def test_job_state_index():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=1.0))
+
+    def objective(experiment: Experiment):
+        return (0.3 - experiment.params["x"]) ** 2
+
+    job = create_job(search_space=space, name="foo", storage="sqlite:///foo.db")
+    job.do(objective, n_trials=20, optimizer="ucb<random>")
+
+    storage = job.storage
+    experiments = job.experiments
+
+    rewards = 0
+    m = float("+inf")
+    for experiment in experiments:
+        if experiment.objective_result < m:
+            rewards += 1
+            m = experiment.objective_result
+
+    assert job.rewards == rewards
+    assert job.best_value == storage.best_experiment(job.id).objective_result
+    assert job.pending_experiments == 0
+
+    job2 = load_job(name="foo", storage="sqlite:///foo.db")
+
+    assert job2.rewards == rewards
+    assert job2.best_value == job.best_value
+
+    job2.do(objective, n_trials=5, optimizer="ucb<random>")
+
+    ids = [experiment.id for experiment in job2.experiments]
+    assert sorted(ids) == list(range(25))
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from feijoa import Categorical, Real, SearchSpace, create_job
+from feijoa.jobs.vectorized import numba_objective
+from feijoa.utils.imports import import_or_skip
+
+import_or_skip("numba")
+
+
+def objective(x):
+    # x[2] is index of categorical value
+    return (x[0] - 1.0) ** 2 + x[1] ** 2 + x[2]
+
+
+def test_numba_objective():
+    X = np.random.RandomState(0).uniform(size=(1000, 3))
+    expected = np.array([objective(x) for x in X])
+
+    assert numba_objective(objective)(X) == pytest.approx(expected)
+
+
+def test_numba_jit_job():
+    space = SearchSpace(
+        Real("x", low=-2.0, high=2.0),
+        Real("y", low=-2.0, high=2.0),
+        Categorical("kind", choices=["fast", "slow"]),
+    )
+    job = create_job(search_space=space, storage="sqlite:///:memory:")
+    job.do(
+        objective,
+        n_trials=300,
+        optimizer="random",
+        seed=0,
+        use_numba_jit=True,
+        pipelined=True,
+    )
+
+    assert job.experiments_count == 300
+    assert job.best_parameters["kind"] == "fast"
+    assert job.best_value < 0.1
@@ -0,0 +1,96 @@
+import pytest
+
+from feijoa import Experiment, Real, SearchSpace, create_job, load_job
+from feijoa.exceptions import TrialPruned
+from feijoa.models.experiment import ExperimentState
+from feijoa.pruners import MedianPruner, PercentilePruner, SuccessiveHalvingPruner
+
+
+def test_percentile_pruners():
+    pruner = MedianPruner(n_startup_trials=3)
+
+    assert pruner.prune(0, 10.0, [1.0, 2.0, 3.0, 4.0])
+    assert not pruner.prune(0, 2.0, [1.0, 2.0, 3.0, 4.0])
+    assert not pruner.prune(0, float("nan"), [1.0, 2.0, 3.0])
+    assert not pruner.prune(0, 10.0, [float("inf")])
+
+    pruner = PercentilePruner(90.0)
+
+    assert not pruner.prune(0, 3.5, [1.0, 2.0, 3.0, 4.0])
+    assert pruner.prune(0, 5.0, [1.0, 2.0, 3.0, 4.0])
+
+
+def test_successive_halving_pruner():
+    pruner = SuccessiveHalvingPruner(min_resource=1, reduction_factor=2)
+
+    assert pruner.is_rung(1)
+    assert pruner.is_rung(2)
+    assert pruner.is_rung(4)
+    assert not pruner.is_rung(3)
+
+    # not a rung: never prune
+    assert not pruner.prune(3, 100.0, [1.0, 2.0, 3.0])
+    # top half is kept
+    assert not pruner.prune(2, 1.5, [1.0, 2.0, 3.0])
+    assert pruner.prune(2, 2.5, [1.0, 2.0, 3.0])
+
+
+def test_job_pruning():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=1.0))
+
+    def objective(experiment: Experiment):
+        x = experiment.params["x"]
+
+        for step in range(10):
+            experiment.report(step, x * (10 - step))
+
+            if experiment.should_prune():
+                raise TrialPruned()
+
+        return x
+
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+    job.do(
+        objective,
+        n_trials=30,
+        optimizer="random",
+        pruner=MedianPruner(n_startup_trials=3),
+    )
+
+    states = [experiment.state for experiment in job.experiments]
+    pruned = [e for e in job.experiments if e.state == ExperimentState.PRUNED]
+
+    assert len(states) == 30
+    assert pruned
+    assert job.statistics.pruned == len(pruned)
+
+    for experiment in pruned:
+        assert experiment.objective_result == experiment.last_intermediate_value
+        assert len(experiment.intermediate_values) < 10
+
+    # best experiment is a fully evaluated one
+    assert job.best_experiment.state == ExperimentState.OK
+
+    loaded = load_job(name="foo", storage=storage)
+    loaded_pruned = [e for e in loaded.experiments if e.state == ExperimentState.PRUNED]
+
+    assert len(loaded_pruned) == len(pruned)
+    assert loaded_pruned[0].intermediate_values == pruned[0].intermediate_values
+
+
+def test_pruner_with_processes_backend():
+    space = SearchSpace()
+    space.insert(Real("x", low=0.0, high=1.0))
+
+    job = create_job(search_space=space)
+
+    with pytest.raises(ValueError):
+        job.do(
+            lambda experiment: experiment.params["x"],
+            n_trials=2,
+            backend="processes",
+            pruner=MedianPruner(),
+        )
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from feijoa import Real, SearchSpace, create_job
+from feijoa.jobs.racing import (
+    MEASUREMENTS_METRIC,
+    RACED_OUT_METRIC,
+    Race,
+)
+
+INSTANCES = [1.0, 2.0, 3.0]
+
+
+def measure(experiment, instance):
+    # instances have different scale, measurements are noisy
+    return instance * (1.0 + experiment.params["x"]) + random.gauss(0.0, 0.05)
+
+
+def test_race_drops_bad_configurations():
+    random.seed(0)
+
+    space = SearchSpace(Real("x", low=0.0, high=1.0))
+    job = create_job(search_space=space)
+    race = Race(measure, instances=INSTANCES, n_repeats=3)
+
+    job.add_seed({"x": 0.0})
+    job.do(race, n_trials=20, optimizer="random", seed=0, progress_bar=False)
+
+    experiments = job.experiments
+    full = len(INSTANCES) * 3
+
+    raced_out = [e for e in experiments if e.metrics[RACED_OUT_METRIC]]
+    finished = [e for e in experiments if not e.metrics[RACED_OUT_METRIC]]
+
+    assert raced_out
+    assert all(e.metrics[MEASUREMENTS_METRIC] < full for e in raced_out)
+    assert all(e.metrics[MEASUREMENTS_METRIC] == full for e in finished)
+    assert all(e.objective_result > race.incumbent[0] for e in raced_out)
+
+    assert job.best_parameters == {"x": 0.0}
+    assert race.dropped == len(raced_out)
+    assert race.measurements == sum(e.metrics[MEASUREMENTS_METRIC] for e in experiments)
+    assert 0.0 < race.saved_fraction < 1.0
+
+
+def test_default_race_stops_bad_configuration_early():
+    random.seed(0)
+
+    space = SearchSpace(Real("x", low=0.0, high=1.0))
+    job = create_job(search_space=space)
+    race = Race(lambda e, _: e.params["x"] + random.gauss(0.0, 0.01))
+
+    job.add_seed({"x": 0.0})
+    job.add_seed({"x": 1.0})
+    job.do(race, n_trials=2, optimizer="random", progress_bar=False)
+
+    good, bad = sorted(job.experiments, key=lambda e: e.params["x"])
+
+    assert good.metrics[MEASUREMENTS_METRIC] == len(race.blocks)
+    assert bad.metrics[RACED_OUT_METRIC]
+    assert bad.metrics[MEASUREMENTS_METRIC] < len(race.blocks)
+
+
+def test_failed_measurement_stops_race():
+    space = SearchSpace(Real("x", low=0.0, high=1.0))
+    job = create_job(search_space=space)
+
+    calls = []
+
+    def failing(experiment, instance):
+        calls.append(instance)
+        return float("+inf")
+
+    job.do(Race(failing, instances=INSTANCES), n_trials=1, optimizer="random")
+
+    assert len(calls) == 1
+    assert job.experiments[0].metrics[MEASUREMENTS_METRIC] == 1
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        Race(measure, test="unknown")
+
+    with pytest.raises(ValueError):
+        Race(measure, instances=[])
+
+    # the first test would follow the last block
+    with pytest.raises(ValueError):
+        Race(measure, n_repeats=3, min_blocks=3)
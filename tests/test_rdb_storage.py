@@ -1,4 +1,6 @@
-from feijoa import Experiment, Real, SearchSpace, create_job
+import sqlite3
+
+from feijoa import Experiment, Real, SearchSpace, create_job, load_job
 from feijoa.models.configuration import Configuration
 from feijoa.models.experiment import ExperimentState
 from feijoa.storages.rdb.storage import RDBStorage
@@ -73,3 +75,48 @@ def test_integrated_rdb_storage():
     job.do(objective, n_trials=5)
 
     print(job.dataframe)
+
+
+def test_rdb_storage_upgrades_old_schema(tmp_path):
+    path = tmp_path / "old.db"
+
+    # schema and rows of database created by feijoa 0.1.9
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE search_space (id INTEGER NOT NULL, PRIMARY KEY (id));
+        CREATE TABLE parameter (
+            id INTEGER NOT NULL, search_space_id INTEGER, name VARCHAR,
+            kind VARCHAR, meta VARCHAR, PRIMARY KEY (id),
+            FOREIGN KEY(search_space_id) REFERENCES search_space (id)
+        );
+        CREATE TABLE jobs (
+            id INTEGER NOT NULL, name VARCHAR, search_space_id INTEGER,
+            last_optimizer VARCHAR, PRIMARY KEY (id), UNIQUE (name),
+            FOREIGN KEY(search_space_id) REFERENCES search_space (id)
+        );
+        CREATE TABLE experiments (
+            id INTEGER NOT NULL, job_id INTEGER NOT NULL, state VARCHAR,
+            hash VARCHAR, objective_result FLOAT, requestor VARCHAR,
+            params VARCHAR, create_timestamp FLOAT, finish_timestamp FLOAT,
+            metrics VARCHAR, PRIMARY KEY (id, job_id),
+            FOREIGN KEY(job_id) REFERENCES jobs (id)
+        );
+        INSERT INTO search_space VALUES (1);
+        INSERT INTO parameter VALUES (1, 1, 'x', 'Real', '{"low": 0.0, "high": 1.0}');
+        INSERT INTO jobs VALUES (1, 'old', 1, 'ucb<bayesian>');
+        INSERT INTO experiments VALUES
+            (0, 1, 'OK', 'a', 0.5, 'random', '{"x": 0.5}', 0.0, 1.0, 'null'),
+            (1, 1, 'OK', 'b', 0.25, 'random', '{"x": 0.25}', 0.0, 2.0, 'null');
+        """)
+    connection.commit()
+    connection.close()
+
+    job = load_job(name="old", storage=f"sqlite:///{path}")
+
+    assert len(job.experiments) == 2
+    assert job.best_value == 0.25
+
+    job.do(lambda experiment: experiment.params["x"], n_trials=2)
+
+    assert len(job.experiments) == 4
+    assert sorted(e.id for e in job.experiments) == [0, 1, 2, 3]
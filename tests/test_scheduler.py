@@ -0,0 +1,140 @@
+import time
+
+import pytest
+
+from feijoa import Real, SearchSpace, create_job
+from feijoa.jobs.scheduler import Scheduler
+
+
+def make_job(name):
+    space = SearchSpace(Real("x", low=0.0, high=1.0), Real("y", low=0.0, high=1.0))
+    return create_job(search_space=space, name=name)
+
+
+def make_objective(shift, delay=0.0):
+    def objective(experiment):
+        time.sleep(delay)
+        return (experiment.params["x"] - shift) ** 2 + experiment.params["y"]
+
+    return objective
+
+
+@pytest.mark.parametrize("backend", ["threads", "processes"])
+def test_jobs_share_pool(backend):
+    scheduler = Scheduler(n_jobs=4, backend=backend)
+    jobs = [make_job(f"job-{i}") for i in range(3)]
+
+    for i, job in enumerate(jobs):
+        scheduler.add(job, make_objective(i / 3), n_trials=10 + i, optimizer="random")
+
+    finished = []
+    statistics = scheduler.run(callback=lambda job, e: finished.append(job.name))
+
+    assert statistics.trials == 10 + 11 + 12
+    assert len(finished) == statistics.trials
+
+    for i, job in enumerate(jobs):
+        assert job.experiments_count == 10 + i
+        assert job.pending_experiments == 0
+        assert job.statistics.trials == 10 + i
+
+    progress = scheduler.progress()
+
+    assert [p["job"] for p in progress] == ["job-0", "job-1", "job-2"]
+    assert [p["trials"] for p in progress] == [10, 11, 12]
+
+
+def test_fair_share_follows_weights():
+    scheduler = Scheduler(n_jobs=3)
+    heavy, light = make_job("heavy"), make_job("light")
+
+    scheduler.add(
+        heavy, make_objective(0, 0.01), n_trials=60, weight=2.0, optimizer="random"
+    )
+    scheduler.add(
+        light, make_objective(0, 0.01), n_trials=60, weight=1.0, optimizer="random"
+    )
+
+    order = []
+    scheduler.run(callback=lambda job, e: order.append(job.name))
+
+    # while both jobs are active, heavy job gets ~2/3 of workers
+    head = order[:45]
+    assert 25 <= head.count("heavy") <= 35
+
+
+def test_priority_policy():
+    scheduler = Scheduler(n_jobs=2, policy="priority")
+    low, high = make_job("low"), make_job("high")
+
+    scheduler.add(
+        low, make_objective(0, 0.02), n_trials=10, priority=0, optimizer="random"
+    )
+    scheduler.add(
+        high, make_objective(0, 0.02), n_trials=10, priority=1, optimizer="random"
+    )
+
+    order = []
+    scheduler.run(callback=lambda job, e: order.append(job.name))
+
+    # low priority job takes only workers, which
+    # are free while high priority job is asked first
+    assert order[:12].count("high") == 10
+
+
+def test_jobs_are_asked_in_background():
+    scheduler = Scheduler(n_jobs=2)
+    slow, fast = make_job("slow"), make_job("fast")
+
+    scheduler.add(slow, make_objective(0), n_trials=2, optimizer="random")
+    scheduler.add(fast, make_objective(0, 0.01), n_trials=30, optimizer="random")
+
+    ask = slow.optimizer.ask
+    asking = []
+
+    def slow_ask(n=1):
+        start = time.monotonic()
+        time.sleep(0.3)
+        asking.append((start, time.monotonic()))
+        return ask(n)
+
+    slow.optimizer.ask = slow_ask
+
+    finished = []
+    scheduler.run(callback=lambda job, e: finished.append((job.name, time.monotonic())))
+
+    start, end = asking[0]
+
+    # trials of other job are evaluated while job is asked
+    assert any(start < t < end for name, t in finished if name == "fast")
+    assert slow.experiments_count == 2
+    assert fast.experiments_count == 30
+
+
+def test_jobs_are_asked_for_idle_workers():
+    scheduler = Scheduler(n_jobs=4)
+    job = make_job("foo")
+
+    scheduler.add(job, make_objective(0), n_trials=8, optimizer="random")
+
+    ask = job.optimizer.ask
+    sizes = []
+
+    def record(n=1):
+        sizes.append(n)
+        return ask(n)
+
+    job.optimizer.ask = record
+
+    scheduler.run()
+
+    assert sizes[0] == 4
+    assert job.experiments_count == 8
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        Scheduler(policy="unknown")
+
+    with pytest.raises(ValueError):
+        Scheduler().add(make_job("job"), make_objective(0), weight=0)
@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+
+from feijoa import Real, SearchSpace, create_job
+from feijoa.exceptions import ServerError
+from feijoa.jobs.client import JobClient
+from feijoa.jobs.server import JobServer
+from feijoa.models import Result
+
+
+def make_job():
+    space = SearchSpace(Real("x", low=0.0, high=1.0), Real("y", low=0.0, high=1.0))
+    return create_job(search_space=space)
+
+
+def objective(experiment):
+    return experiment.params["x"] ** 2 + experiment.params["y"]
+
+
+def test_external_workers():
+    job = make_job()
+
+    with JobServer(job, optimizer="random", seed=0, n_trials=60) as server:
+        counts = []
+
+        def worker():
+            with JobClient(server.url) as client:
+                counts.append(client.work(objective, n=4))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert server.wait(timeout=10)
+
+        with JobClient(server.url) as client:
+            status = client.status()
+
+    assert sum(counts) == 60
+    assert job.experiments_count == 60
+    assert job.pending_experiments == 0
+    assert status["finished"]
+    assert status["told"] == 60
+    assert status["best_value"] == job.best_value
+
+
+def test_metrics_and_ignored_results():
+    job = make_job()
+
+    with JobServer(job, optimizer="random", seed=0, n_trials=2) as server:
+        with JobClient(server.url) as client:
+            first, second = client.ask(2)
+
+            assert client.tell(first, 1.0, metrics={"loss": 0.5}) == 1
+            # duplicated and unknown results are ignored
+            assert client.tell_many([first, 12345], [2.0, 3.0]) == 0
+            assert client.tell_many([second], [Result(objective_result=0.5)]) == 1
+            assert client.ask(1) == []
+
+        assert server.wait(timeout=1)
+
+    assert job.best_value == 0.5
+    assert job.experiments[0].metrics == {"loss": 0.5}
+
+
+def test_expired_leases_are_leased_again():
+    job = make_job()
+
+    with JobServer(
+        job, optimizer="random", seed=0, n_trials=1, lease_timeout=0.05
+    ) as server:
+        with JobClient(server.url) as client:
+            (lost,) = client.ask(1)
+            time.sleep(0.1)
+            (leased,) = client.ask(1)
+
+            assert leased.id == lost.id
+            assert client.tell(leased, 1.0) == 1
+
+        assert server.wait(timeout=1)
+
+    assert job.experiments_count == 1
+
+
+def test_lost_ask_is_not_repeated():
+    job = make_job()
+
+    with JobServer(job, optimizer="random", seed=0, n_trials=4) as server:
+        with JobClient(server.url) as client:
+            connection = client._connect()
+            getresponse = connection.getresponse
+
+            def lost():
+                # server leases experiments, but response is lost
+                getresponse().read()
+                raise ConnectionResetError()
+
+            connection.getresponse = lost
+            client._connection = connection
+
+            with pytest.raises(ServerError):
+                client.ask(2)
+
+            assert client.status()["leased"] == 2
+
+
+def test_unknown_endpoint():
+    job = make_job()
+
+    with JobServer(job, optimizer="random", seed=0) as server:
+        with JobClient(server.url) as client:
+            with pytest.raises(ServerError):
+                client._request("GET", "/unknown")
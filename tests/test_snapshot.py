@@ -0,0 +1,115 @@
+import threading
+
+from feijoa import Experiment, create_job, load_job
+from feijoa.jobs.snapshot import Snapshot
+
+
+def objective(experiment: Experiment):
+    x = experiment.params["x"]
+    y = experiment.params["y"]
+    return (x - 0.3) ** 2 + (y - 0.7) ** 2
+
+
+def test_resume_from_snapshot(space):
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+    job.do(
+        objective,
+        n_trials=10,
+        optimizer="ucb<bayesian[n_warmup=3], random>",
+        snapshot_interval=5,
+    )
+    # without snapshots: the tail to replay
+    job.do(objective, n_trials=3)
+
+    assert job.snapshots is None
+
+    snapshot = Snapshot.latest(job.storage, job.id)
+
+    assert snapshot.state.finished == 10
+
+    loaded = load_job(name="foo", storage=storage, restore_snapshot=True)
+
+    assert loaded.snapshot is not None
+    assert len(loaded.loaded_experiments_pool) == 3
+    assert loaded.state.finished == 13
+    assert loaded.best_value == job.best_value
+
+    loaded._setup_optimizer("", None)
+    bayesian = loaded.optimizer.oracles[0]
+
+    # snapshot state and replayed tail
+    assert len(bayesian.y) == 13
+    assert bayesian._warmed_up
+
+    loaded.do(objective, n_trials=3)
+
+    assert loaded.experiments_count == 16
+
+
+def test_resume_with_other_optimizer(space):
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+    job.do(objective, n_trials=6, optimizer="ucb<random>", snapshot_interval=4)
+
+    loaded = load_job(name="foo", storage=storage, restore_snapshot=True)
+
+    assert not loaded.loaded_experiments_pool
+
+    # oracles can't be restored from snapshot
+    loaded._setup_optimizer("ucb<bayesian>", None)
+
+    assert len(loaded.loaded_experiments_pool) == 6
+    assert len(loaded.optimizer.oracles[0].y) == 6
+
+
+def test_snapshot_restore_is_opt_in(space):
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+    job.do(objective, n_trials=6, optimizer="ucb<random>", snapshot_interval=4)
+
+    loaded = load_job(name="foo", storage=storage)
+
+    # untrusted snapshot isn't unpickled, all experiments are replayed
+    assert loaded.snapshot is None
+    assert len(loaded.loaded_experiments_pool) == 6
+
+
+def test_snapshot_matches_stored_results(space):
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+    job._setup_optimizer("ucb<random>", None)
+    job._setup_snapshots(2)
+
+    experiments = job.ask(4)
+
+    # oracles are asked in background
+    with job.locked_optimizer():
+        tell = threading.Thread(
+            target=job.tell_many, args=(experiments[:2], [1.0, 2.0])
+        )
+        tell.start()
+        tell.join(timeout=5)
+
+        # results are stored, snapshot waits for oracles
+        assert not tell.is_alive()
+        assert job.storage.get_finish_seq(job.id) == 2
+        assert job.snapshots.taken == 0
+
+    job.tell_many(experiments[2:], [3.0, 4.0])
+
+    snapshot = Snapshot.latest(job.storage, job.id)
+
+    assert job.snapshots.taken == 1
+    assert snapshot.finish_seq == 4
+    assert len(snapshot.optimizer.results) == 4
+
+    loaded = load_job(name="foo", storage=storage, restore_snapshot=True)
+    loaded._setup_optimizer("", None)
+
+    # nothing is told twice
+    assert len(loaded.optimizer.results) == 4
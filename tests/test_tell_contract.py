@@ -0,0 +1,95 @@
+import random
+
+import numpy as np
+import pytest
+
+from feijoa import Experiment, create_job
+from feijoa.search.oracles.bayesian import Bayesian
+from feijoa.search.oracles.bcmaes import BCMAES
+from feijoa.search.oracles.finder import maker
+from feijoa.search.oracles.hyperband import Hyperband
+from feijoa.search.oracles.pattern import Pattern
+from feijoa.search.oracles.randomized import Random
+
+
+def value(config):
+    return (config["x"] - 0.3) ** 2 + (config["y"] - 0.7) ** 2
+
+
+def test_tokens_are_unique(space):
+    configs = Random(space).ask(100)
+
+    assert len({c.token for c in configs}) == 100
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda space: Pattern(space),
+        lambda space: BCMAES(space),
+        lambda space: Hyperband(space, max_budget=9),
+        lambda space: maker("ucb<template, random>", space),
+    ],
+)
+def test_tell_in_any_order(make, space):
+    rng = random.Random(0)
+    oracle = make(space)
+
+    in_flight = []
+
+    for _ in range(30):
+        in_flight.extend(oracle.ask(2))
+        rng.shuffle(in_flight)
+
+        # tell part of results in random order, some twice,
+        # others later or never
+        for config in in_flight[: len(in_flight) // 2]:
+            oracle.tell(config, value(config))
+
+            if rng.random() < 0.2:
+                oracle.tell(config, value(config))
+
+        in_flight = in_flight[len(in_flight) // 2 :]
+
+        if rng.random() < 0.2:
+            in_flight.pop()
+
+
+def test_duplicated_tell_is_ignored(space):
+    oracle = Bayesian(space)
+    configs = Random(space).ask(3)
+
+    oracle.tell_many(configs, [1.0, 2.0, 3.0])
+    oracle.tell(configs[0], 1.0)
+    oracle.tell_many(configs, [1.0, 2.0, 3.0])
+
+    assert len(oracle.y) == 3
+
+
+def test_late_result_of_pattern(space):
+    oracle = Pattern(space)
+
+    center = oracle.ask()[0]
+    pattern = [oracle.ask()[0] for _ in range(4)]
+
+    # the next round is started before any result is told
+    oracle.ask()
+
+    for config in reversed(pattern):
+        oracle.tell(config, value(config))
+    oracle.tell(center, value(center))
+
+    best = min(pattern + [center], key=value)
+    assert oracle.best[0] is best
+
+
+@pytest.mark.parametrize("optimizer", ["ucb<template>", "ucb<BCMAES>"])
+def test_parallel_job(optimizer, space):
+    def objective(experiment: Experiment):
+        return value(experiment.params)
+
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=60, n_jobs=4, optimizer=optimizer)
+
+    assert job.experiments_count >= 50
+    assert np.isfinite(job.best_value)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from feijoa import create_job
+from feijoa.search.oracles.bayesian import Bayesian
+from feijoa.search.oracles.finder import maker
+from feijoa.search.oracles.randomized import Random
+
+
+def test_bayesian_tell_many(space):
+    one_by_one = Bayesian(space)
+    batched = Bayesian(space)
+
+    configs = Random(space).ask(7)
+    results = [c["x"] + c["y"] for c in configs]
+
+    for config, result in zip(configs, results):
+        one_by_one.tell(config, result)
+
+    batched.tell_many(configs, results)
+
+    assert np.array_equal(one_by_one.X, batched.X)
+    assert np.array_equal(one_by_one.y, batched.y)
+
+
+def test_bandit_tell_many(space):
+    calls = []
+
+    class Spy(Random):
+        def tell_many(self, configs, results):
+            calls.append(len(configs))
+
+    optimizer = maker("ucb<random>", space)
+    optimizer.oracles.append(Spy(space))
+
+    configs = optimizer.ask(4)
+    optimizer.tell_many(configs, [1.0, 0.5, 0.25, 0.1])
+
+    # every oracle is told once with the whole batch
+    assert calls == [4]
+    assert optimizer.results == [1.0, 0.5, 0.25, 0.1]
+
+
+def test_job_tell_many(space):
+    job = create_job(search_space=space)
+    job._setup_optimizer("ucb<random>", None)
+
+    experiments = job.ask(5)
+    job.tell_many(experiments, [float(e.id) for e in experiments])
+
+    assert job.pending_experiments == 0
+    assert job.experiments_count == 5
+    assert job.best_value == 0.0
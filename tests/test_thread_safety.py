@@ -0,0 +1,39 @@
+import threading
+
+import pytest
+
+from feijoa import create_job
+
+
+@pytest.mark.parametrize("file_storage", [False, True])
+def test_concurrent_ask_tell(tmp_path, file_storage, space):
+    storage = f"sqlite:///{tmp_path / 'job.db'}" if file_storage else None
+
+    job = create_job(search_space=space, storage=storage)
+    job._setup_optimizer("ucb<random, template>", seed=0)
+
+    errors = []
+    ids = []
+
+    def worker():
+        try:
+            for _ in range(25):
+                for experiment in job.ask(1):
+                    ids.append(experiment.id)
+                    job.tell(experiment, experiment.params["x"])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(ids) == len(set(ids))
+    assert job.experiments_count == len(ids)
+    assert job.pending_experiments == 0
+    assert job.best_value == min(e.objective_result for e in job.experiments)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from feijoa import Categorical, Integer, Real, SearchSpace, create_job
+
+
+@pytest.fixture
+def space():
+    return SearchSpace(
+        Real("x", low=-1.0, high=1.0),
+        Integer("n", low=0, high=4),
+        Categorical("kind", choices=["a", "b"]),
+    )
+
+
+def test_vectorized_array(space):
+    batches = []
+
+    def objective(X):
+        batches.append(X)
+        return X[:, 0] ** 2 + X[:, 1] + X[:, 2]
+
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=300, optimizer="random", seed=0, vectorized=True)
+
+    assert job.experiments_count == 300
+    assert sum(len(X) for X in batches) == 300
+    assert all(X.dtype == np.float64 and X.shape[1] == 3 for X in batches)
+    assert set(np.concatenate(batches)[:, 2]) == {0.0, 1.0}
+
+    best = job.best_parameters
+    expected = best["x"] ** 2 + best["n"] + ["a", "b"].index(best["kind"])
+
+    assert job.best_value == pytest.approx(expected)
+
+
+def test_vectorized_columns(space):
+    def objective(columns):
+        return columns["x"] ** 2 + columns["n"] + (columns["kind"] == "b")
+
+    job = create_job(search_space=space)
+    job.do(
+        objective,
+        n_trials=50,
+        n_points_iter=16,
+        optimizer="random",
+        seed=0,
+        vectorized="columns",
+    )
+
+    assert job.experiments_count == 50
+    assert job.best_value < 0.5
+
+
+def test_vectorized_wrong_count(space):
+    job = create_job(search_space=space)
+
+    with pytest.raises(ValueError):
+        job.do(lambda X: X[:1, 0], n_trials=10, optimizer="random", vectorized=True)
@@ -0,0 +1,51 @@
+from feijoa import Integer, SearchSpace, create_job
+from feijoa.storages.rdb.storage import RDBStorage
+
+
+def objective(experiment):
+    return (experiment.params["x"] - 0.3) ** 2 + (experiment.params["y"] - 0.7) ** 2
+
+
+def test_warm_start_from_compatible_jobs(tmp_path, space):
+    storage = RDBStorage(f"sqlite:///{tmp_path / 'jobs.db'}")
+
+    old = create_job(search_space=space, storage=storage, name="release-1")
+    old.do(objective, n_trials=30, optimizer="random", seed=0)
+
+    other = create_job(
+        search_space=SearchSpace(Integer("x", low=0, high=10)),
+        storage=storage,
+        name="other",
+    )
+    other.do(lambda e: 0.0, n_trials=5, optimizer="random")
+
+    job = create_job(
+        search_space=space,
+        storage=storage,
+        name="release-2",
+        warm_start=3,
+        warm_start_history=True,
+    )
+
+    best = sorted(e.objective_result for e in old.experiments)[:3]
+
+    assert len(job.seeds) == 3
+    assert len(job.history) == 30
+
+    job._setup_optimizer("ucb<bayesian>", seed=0)
+
+    (bayesian,) = [o for o in job.optimizer.oracles if o.anchor == "bayesian"]
+    assert len(bayesian.y) == 30
+
+    job.do(objective, n_trials=3, n_jobs=1)
+
+    # seeds are measured first, history isn't evaluated again
+    assert sorted(e.objective_result for e in job.experiments) == best
+    assert job.best_value == old.best_value
+
+
+def test_warm_start_without_compatible_jobs(space):
+    job = create_job(search_space=space, warm_start=5)
+
+    assert job.seeds == []
+    assert job.warm_start(5, history=True) == []
@@ -0,0 +1,96 @@
+from feijoa import Experiment, create_job, load_job
+from feijoa.jobs.client import JobClient
+from feijoa.jobs.server import JobServer
+from feijoa.models.experiment import ExperimentState
+
+
+def objective(experiment: Experiment):
+    return experiment.params["x"] ** 2 + experiment.params["y"]
+
+
+def test_unfinished_experiments_are_asked_again(space):
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+    job._setup_optimizer("random", 0)
+
+    experiments = job.ask(3)
+    job.tell(experiments[0], objective(experiments[0]))
+
+    # asked experiments are stored before they are told
+    assert job.experiments_count == 3
+    assert [e.state for e in job.experiments].count(ExperimentState.WIP) == 2
+
+    # driver is stopped, its in-flight experiments aren't lost
+    loaded = load_job(name="foo", storage=storage)
+    loaded._setup_optimizer("random", 0)
+
+    assert [e.id for e in loaded.unfinished] == [1, 2]
+
+    resumed = loaded.ask(2)
+
+    assert [e.id for e in resumed] == [1, 2]
+    assert resumed[0].params == experiments[1].params
+    assert loaded.pending_experiments == 2
+
+    loaded.tell_many(resumed, [objective(e) for e in resumed])
+
+    assert loaded.pending_experiments == 0
+    assert loaded.experiments_count == 3
+    assert all(e.is_finished() for e in loaded.experiments)
+    # new experiments don't reuse indexes of unfinished ones
+    assert loaded.ask(1)[0].id == 3
+
+
+def test_unfinished_experiments_keep_budget(space):
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+    job._setup_optimizer("hyperband[min_budget=1,max_budget=9]", 0)
+
+    experiments = job.ask(3)
+
+    assert [e.budget for e in experiments] == [1, 3, 9]
+
+    loaded = load_job(name="foo", storage=storage)
+    loaded._setup_optimizer("hyperband[min_budget=1,max_budget=9]", 0)
+
+    resumed = loaded.ask(3)
+
+    assert [e.id for e in resumed] == [e.id for e in experiments]
+    assert [e.budget for e in resumed] == [1, 3, 9]
+    assert [e.params_hash for e in resumed] == [e.params_hash for e in experiments]
+
+
+def test_discarded_experiments_are_deleted(space):
+    job = create_job(search_space=space)
+    job.do(objective, n_trials=10, n_jobs=2, optimizer="ucb<random>")
+
+    assert job.experiments_count == 10
+    assert all(e.is_finished() for e in job.experiments)
+    assert not job.storage.get_unfinished_experiments(job.id)
+
+
+def test_server_accepts_results_after_restart(space):
+    storage = "sqlite:///foo.db"
+
+    job = create_job(search_space=space, name="foo", storage=storage)
+
+    with JobServer(job, optimizer="random", seed=0, n_trials=2) as server:
+        with JobClient(server.url) as client:
+            first, second = client.ask(2)
+
+    # worker finishes experiment, while server is restarted
+    loaded = load_job(name="foo", storage=storage)
+
+    with JobServer(loaded, optimizer="random", seed=0, n_trials=0) as server:
+        assert server.status()["leased"] == 2
+
+        with JobClient(server.url) as client:
+            assert client.tell_many([first, second], [1.0, 0.5]) == 2
+
+        assert server.wait(timeout=1)
+
+    assert loaded.best_value == 0.5
+    assert loaded.experiments_count == 2
+    assert loaded.pending_experiments == 0
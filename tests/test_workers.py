@@ -0,0 +1,122 @@
+import threading
+import time
+
+from feijoa import Experiment, create_job
+from feijoa.storages.rdb.storage import RDBStorage
+
+
+def objective(experiment: Experiment):
+    x = experiment.params["x"]
+    y = experiment.params["y"]
+    return (x - 0.3) ** 2 + (y - 0.7) ** 2
+
+
+def make_worker(space, url="sqlite:///foo.db"):
+    return create_job(
+        search_space=space,
+        name="foo",
+        storage=RDBStorage(url),
+        load_if_exists=True,
+    )
+
+
+def test_workers_share_job(space):
+    first = make_worker(space)
+    second = make_worker(space)
+
+    assert first.id == second.id
+
+    first.do(objective, n_trials=10, optimizer="random", lease_timeout=60)
+    second.do(objective, n_trials=10, optimizer="random", lease_timeout=60)
+    first.do(objective, n_trials=5, optimizer="random", lease_timeout=60)
+
+    experiments = first.experiments
+    ids = [e.id for e in experiments]
+
+    assert len(experiments) == 25
+    assert sorted(ids) == list(range(25))
+    assert all(e.is_finished() for e in experiments)
+
+    # results of other worker are told to oracles
+    assert second.coordinator.synced == 10
+    assert first.coordinator.synced == 10
+    assert (
+        first.best_value
+        == second.best_value
+        == min(e.objective_result for e in experiments)
+    )
+
+
+def test_expired_leases_are_reclaimed(space):
+    dead = make_worker(space)
+    dead._setup_optimizer("random", None)
+    dead._setup_coordinator(lease_timeout=0.01)
+
+    abandoned = dead.ask(2)
+    time.sleep(0.05)
+
+    alive = make_worker(space)
+    alive.do(objective, n_trials=3, optimizer="random", lease_timeout=60)
+
+    experiments = alive.experiments
+
+    assert alive.coordinator.reclaimed == 2
+    assert len(experiments) == 3
+    assert all(e.is_finished() for e in experiments)
+    assert {e.id for e in abandoned} <= {e.id for e in experiments}
+
+
+def test_reclaimed_experiments_keep_budget(space):
+    dead = make_worker(space)
+    dead._setup_optimizer("hyperband[min_budget=1,max_budget=9]", None)
+    dead._setup_coordinator(lease_timeout=0.01)
+
+    abandoned = dead.ask(3)
+    time.sleep(0.05)
+
+    budgets = {}
+
+    def record(experiment: Experiment):
+        budgets[experiment.id] = experiment.budget
+        return objective(experiment)
+
+    alive = make_worker(space)
+    alive.do(record, n_trials=3, optimizer="random", lease_timeout=60)
+
+    assert alive.coordinator.reclaimed == 3
+    assert budgets == {e.id: e.budget for e in abandoned}
+    assert sorted(budgets.values()) == [1, 3, 9]
+
+
+def test_concurrent_workers(space):
+    make_worker(space)
+
+    errors = []
+
+    def work():
+        try:
+            job = make_worker(space)
+            job.do(
+                objective,
+                n_trials=15,
+                optimizer="random",
+                progress_bar=False,
+                lease_timeout=60,
+            )
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=work) for _ in range(3)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+    experiments = make_worker(space).experiments
+
+    assert len(experiments) == 45
+    assert len({e.id for e in experiments}) == 45